@@ -1,5 +1,5 @@
 import pygame
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from config import TOWER_DEFINITIONS, Biome, RARE_TOWERS, TowerType
 
 # Create a global instance of AutoCollector
@@ -34,21 +34,28 @@ class AutoCollector:
             if 'resource' in specs:
                 self.collection_relationships[name] = specs['resource']
 
+    def collection_area(self, tower) -> Optional[Tuple[str, pygame.Rect]]:
+        """Resource type a tower collects and the area it collects from, or None if it collects nothing"""
+        if not tower.name in self.collection_relationships:
+            return None
+
+        # Calculate tower collection area (slightly larger than tower bounds)
+        tower_rect = pygame.Rect(
+            tower.x * tower.CELL_WIDTH + tower.SIDEBAR_WIDTH - 5,
+            tower.y * tower.CELL_HEIGHT - 5,
+            tower.CELL_WIDTH + 10,
+            tower.CELL_HEIGHT + 10
+        )
+        return self.collection_relationships[tower.name], tower_rect
+
     def check_auto_collect(self, orb, tower) -> bool:
         """Check if a tower can auto-collect a specific resource orb"""
-        if not tower.name in self.collection_relationships:
+        area = self.collection_area(tower)
+        if area is None:
             return False
-            
-        collect_type = self.collection_relationships[tower.name]
+
+        collect_type, tower_rect = area
         if collect_type == 'all' or collect_type == orb.resource_type:
-            # Calculate tower collection area (slightly larger than tower bounds)
-            tower_rect = pygame.Rect(
-                tower.x * tower.CELL_WIDTH + tower.SIDEBAR_WIDTH - 5,
-                tower.y * tower.CELL_HEIGHT - 5,
-                tower.CELL_WIDTH + 10,
-                tower.CELL_HEIGHT + 10
-            )
-            
             # Check if orb is within collection area
             orb_pos = pygame.Vector2(orb.x, orb.y)
             return tower_rect.collidepoint(orb_pos)
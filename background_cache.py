@@ -0,0 +1,63 @@
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+# Baked sediment layers live next to the game, one compressed file per level
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "backgrounds")
+
+def cache_path(biome, level, size, version):
+    """File holding the layers for one biome, level, window size and generator version"""
+    width, height = size
+    return os.path.join(CACHE_DIR, f"{biome.name.lower()}_{level:02d}_{width}x{height}_v{version}.npz")
+
+def load_layers(biome, level, size, version):
+    """Cached (layers, grid_height, grid_width, 3) chunk colours, or None if missing or unreadable"""
+    path = cache_path(biome, level, size, version)
+    try:
+        with np.load(path) as data:
+            return data['chunks']
+    except (OSError, KeyError, ValueError):
+        return None
+
+def save_layers(biome, level, size, version, chunks):
+    """Write layers atomically; a read-only install just runs uncached"""
+    path = cache_path(biome, level, size, version)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, chunks=chunks)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def main(argv=None):
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    from config import Biome
+    from sediment_generator import SedimentGenerator, GENERATOR_VERSION
+
+    parser = argparse.ArgumentParser(description="Pre-generate the sediment background of every level")
+    parser.add_argument('--biome', choices=[biome.name for biome in Biome], action='append',
+                        help="bake only this biome (repeatable)")
+    parser.add_argument('--levels', type=int, default=15, help="bake levels 1..N")
+    parser.add_argument('--force', action='store_true', help="regenerate levels that are already cached")
+    args = parser.parse_args(argv)
+
+    biomes = [Biome[name] for name in args.biome] if args.biome else list(Biome)
+    start = time.perf_counter()
+    baked = 0
+    for biome in biomes:
+        for level in range(1, args.levels + 1):
+            generator = SedimentGenerator(biome, level, use_cache=not args.force)
+            if generator.loaded_from_cache:
+                continue
+            if args.force:
+                save_layers(biome, level, (generator.width, generator.height), GENERATOR_VERSION,
+                            generator.layer_chunks)
+            baked += 1
+    print(f"baked {baked} backgrounds into {CACHE_DIR} in {time.perf_counter() - start:.2f}s")
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,4 @@
+"""Scripted full-level benchmarks that drive GameplayManager.update and draw headlessly.
+
+Run from the repository root with `python -m benchmarks`.
+"""
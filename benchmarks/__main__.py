@@ -0,0 +1,130 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# Render without a window; must be set before pygame is imported
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+from config import *
+from gameplay import GameplayManager
+from rng import GameRNG
+from simulation import FIXED_DT
+from benchmarks.scenarios import SCENARIOS
+
+def _percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def _ms(seconds):
+    return round(seconds * 1000, 3) if seconds is not None else None
+
+def setup_game(scenario, seed):
+    """Create the level, place the scenario's towers and skip to its starting wave"""
+    gameplay = GameplayManager(scenario.biome, scenario.level, GameRNG(seed))
+    gameplay.auto_collect = scenario.auto_collect
+    for tower_name, grid_x, grid_y, stars in scenario.build_layout():
+        if gameplay.is_valid_placement(grid_x, grid_y):
+            tower = gameplay.create_tower(tower_name, grid_x, grid_y, stars)
+            if tower:
+                gameplay.add_tower(tower)
+
+    if scenario.start_wave:
+        waves = gameplay.wave_manager.waves
+        for i, wave in enumerate(waves):
+            if any(group['enemy_type'] == scenario.start_wave for group in wave.enemy_groups):
+                gameplay.wave_manager.current_wave = i
+                break
+    # Skip the build phase so enemies arrive straight away
+    gameplay.wave_manager.build_phase = False
+    gameplay.wave_manager.wave_timer = 0
+    return gameplay
+
+def run_scenario(scenario, screen, ticks, draw_every, seed):
+    """Step one scenario, timing every update and draw"""
+    gameplay = setup_game(scenario, seed)
+    update_times = []
+    draw_times = []
+    peaks = {'towers': 0, 'enemies': 0, 'projectiles': 0, 'resource_orbs': 0}
+    state = GameState.GAMEPLAY
+
+    start = time.perf_counter()
+    tick = 0
+    while tick < ticks and state == GameState.GAMEPLAY:
+        t0 = time.perf_counter()
+        state = gameplay.update(FIXED_DT)
+        update_times.append(time.perf_counter() - t0)
+        tick += 1
+
+        peaks['towers'] = max(peaks['towers'], len(gameplay.towers))
+        peaks['enemies'] = max(peaks['enemies'], len(gameplay.enemies))
+        peaks['projectiles'] = max(peaks['projectiles'], len(gameplay.projectiles))
+        peaks['resource_orbs'] = max(peaks['resource_orbs'], len(gameplay.resource_orbs))
+
+        if tick % draw_every == 0:
+            t0 = time.perf_counter()
+            gameplay.draw(screen)
+            pygame.display.flip()
+            draw_times.append(time.perf_counter() - t0)
+    wall_time = time.perf_counter() - start
+
+    if state == GameState.VICTORY:
+        outcome = 'victory'
+    elif state == GameState.GAME_OVER:
+        outcome = 'game_over'
+    else:
+        outcome = 'running'
+
+    return {
+        'scenario': scenario.name,
+        'outcome': outcome,
+        'ticks': tick,
+        'frames': len(draw_times),
+        'wall_seconds': round(wall_time, 4),
+        'ticks_per_second': round(tick / wall_time, 1) if wall_time > 0 else None,
+        'update_ms': {'p50': _ms(_percentile(update_times, 50)), 'p99': _ms(_percentile(update_times, 99))},
+        'draw_ms': {'p50': _ms(_percentile(draw_times, 50)), 'p99': _ms(_percentile(draw_times, 99))},
+        'peak': peaks
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description="Run scripted scenarios and report update/draw timings as JSON")
+    parser.add_argument('scenarios', nargs='*', help="scenarios to run (default: all)")
+    parser.add_argument('--ticks', type=int, default=1200, help="maximum ticks per scenario")
+    parser.add_argument('--draw-every', type=int, default=1, help="draw a frame every N ticks")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--list', action='store_true', help="list scenarios and exit")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}; choose from {', '.join(SCENARIOS)}")
+
+    if args.list:
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name:20} {scenario.description}")
+        return
+
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    from tower import initialize_tower_images
+    initialize_tower_images()
+
+    results = [run_scenario(SCENARIOS[name], screen, args.ticks, args.draw_every, args.seed)
+               for name in (args.scenarios or SCENARIOS)]
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+    pygame.quit()
+
+if __name__ == '__main__':
+    main()
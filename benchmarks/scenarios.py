@@ -0,0 +1,43 @@
+from config import *
+from simulation import load_layout
+
+EFFECT_TOWERS = ['BlueCilliates', 'VesicomyidaeClams', 'MuscleBed', 'DumboOctopus', 'Beggiatoa']
+
+def _effect_carpet_layout(biome):
+    """A tank wall in the first column with overlapping effect fields behind it"""
+    tank = TOWER_DEFINITIONS[biome][TowerType.TANK]['name']
+    layout = [(tank, 0, row, 1) for row in range(GRID_ROWS)]
+    for col in range(1, GRID_COLS):
+        for row in range(GRID_ROWS):
+            layout.append((EFFECT_TOWERS[(col + row) % len(EFFECT_TOWERS)], col, row, 1))
+    return layout
+
+def _nautilus_layout(biome):
+    """Every cell holds a Nautilus, which spawns an orb of each resource type"""
+    return [('Nautilus', col, row, 1) for col in range(GRID_COLS) for row in range(GRID_ROWS)]
+
+class Scenario:
+    """A level, a starting tower layout and the wave to begin on"""
+    def __init__(self, name, description, biome, level, layout, start_wave=None, auto_collect=True):
+        self.name = name
+        self.description = description
+        self.biome = biome
+        self.level = level
+        self.layout = layout  # Callable taking the biome, returning (name, x, y, stars) tuples
+        self.start_wave = start_wave  # Enemy type that marks the wave to skip ahead to
+        self.auto_collect = auto_collect  # False leaves every orb floating until it expires
+
+    def build_layout(self):
+        return self.layout(self.biome)
+
+SCENARIOS = {
+    scenario.name: scenario for scenario in [
+        Scenario('grid45_boss_raid', "Full 45-tower grid against the late-game boss_raid wave",
+                 Biome.HYDROTHERMAL, 11, lambda biome: load_layout('full_grid', biome),
+                 start_wave='CorporateSubmarine'),
+        Scenario('effect_carpet', "Tank wall with stacked effect fields against a late-game swarm",
+                 Biome.COLDSEEP, 14, _effect_carpet_layout),
+        Scenario('orb_flood', "Resource orb flood from a grid of Nautilus towers, nothing collected",
+                 Biome.WHALEFALL, 1, _nautilus_layout, auto_collect=False)
+    ]
+}
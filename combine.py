@@ -1,5 +1,6 @@
 import pygame
 from config import *
+from text_cache import render_text
 
 class CombineManager:
     def __init__(self):
@@ -7,6 +8,7 @@ class CombineManager:
         self.is_combining = False   # Whether we're in combining mode
         self.combine_preview = None # Preview position for combined tower
         self.towers = []           # Reference to the tower list
+        self.game_state = None     # Owner of the tower list and occupancy grid
         
     def find_combinable_towers(self, selected_tower):
         """Find towers that can be combined with the selected tower"""
@@ -19,9 +21,10 @@ class CombineManager:
                 same_towers.append(tower)
         return same_towers
         
-    def start_combining(self, tower, towers):
+    def start_combining(self, tower, game_state):
         """Start the combining process with the selected tower"""
-        self.towers = towers  # Store reference to tower list
+        self.game_state = game_state
+        self.towers = game_state.towers  # Store reference to tower list
         if tower.stars >= 3:
             return False
         combinable = self.find_combinable_towers(tower)
@@ -47,7 +50,7 @@ class CombineManager:
                 return True
         return False
         
-    def complete_combine(self, grid_pos, create_tower_func):
+    def complete_combine(self, grid_pos):
         """Complete the combining process at the specified grid position"""
         if len(self.combining_towers) != 3:
             return False
@@ -56,22 +59,9 @@ class CombineManager:
         if not self.is_valid_placement(grid_x, grid_y):
             return False
             
-        # Get properties from first tower
-        base_tower = self.combining_towers[0]
-        tower_name = base_tower.name
-        current_stars = base_tower.stars
-        biome = base_tower.biome
-        
-        # Create new tower with increased star level
-        new_tower = create_tower_func(tower_name, grid_x, grid_y, current_stars + 1)
-        if new_tower:
-            # Remove the old towers
-            for tower in self.combining_towers:
-                if tower in self.towers:
-                    self.towers.remove(tower)
-            
-            # Add the new tower
-            self.towers.append(new_tower)
+        # The game state swaps the three towers for one with an extra star
+        cells = [(tower.x, tower.y) for tower in self.combining_towers]
+        if self.game_state.combine_towers(cells, grid_x, grid_y):
             self.reset()
             return True
             
@@ -93,11 +83,8 @@ class CombineManager:
             return False
             
         # Check if cell is empty (except for towers being combined)
-        for tower in self.towers:
-            if tower not in self.combining_towers:
-                if tower.x == grid_x and tower.y == grid_y:
-                    return False
-        return True
+        occupant = self.game_state.tower_at(grid_x, grid_y)
+        return occupant is None or occupant in self.combining_towers
         
     def draw_combine_preview(self, surface):
         """Draw preview and selection highlights for combining"""
@@ -128,11 +115,9 @@ class CombineManager:
     def draw_combine_instructions(self, surface, font):
         """Draw instructions for combining"""
         if self.is_combining:
-            text = font.render(f"Select {3 - len(self.combining_towers)} more identical towers", 
-                             True, COLOR_TEXT)
+            text = render_text(font, f"Select {3 - len(self.combining_towers)} more identical towers", COLOR_TEXT)
             surface.blit(text, (WINDOW_WIDTH//2 - text.get_width()//2, 10))
             
             if len(self.combining_towers) == 3:
-                text = font.render("Click empty cell to place combined tower", 
-                                 True, COLOR_TEXT)
+                text = render_text(font, "Click empty cell to place combined tower", COLOR_TEXT)
                 surface.blit(text, (WINDOW_WIDTH//2 - text.get_width()//2, 40))
\ No newline at end of file
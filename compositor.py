@@ -0,0 +1,92 @@
+import pygame
+
+def merge_rects(rects):
+    """Union overlapping rects until none overlap"""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        if not (rect.width and rect.height):
+            continue
+        # Absorb every merged rect this one touches; the grown rect may touch others
+        while True:
+            hit = rect.collidelist(merged)
+            if hit < 0:
+                break
+            rect.union_ip(merged.pop(hit))
+        merged.append(rect)
+    return merged
+
+class Layer:
+    """One long-lived surface of the composed frame"""
+    def __init__(self, name, draw, transparent, composite):
+        self.name = name
+        self.draw = draw  # draw(surface, state) -> rects it covered, or None for the whole layer
+        self.transparent = transparent
+        self.composite = composite  # False for layers only used as a source by the layers above
+        self.surface = None
+        self.state = None  # What the layer shows, handed to draw
+        self.dirty = True
+        self.regions = None
+
+class Compositor:
+    """Stack of display-format layers blended in a fixed order.
+
+    Layers are allocated once and redrawn only after invalidate() or when
+    set_state() gives them a different state; otherwise the last render is reused. Opaque layers are copied straight to the target,
+    transparent layers are blended over only the regions their last draw
+    reported, merged first so no pixel is blended twice.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.layers = []
+        self.by_name = {}
+
+    def add_layer(self, name, draw, transparent=False, composite=True):
+        layer = Layer(name, draw, transparent, composite)
+        self.layers.append(layer)
+        self.by_name[name] = layer
+        return layer
+
+    def invalidate(self, *names):
+        """Redraw the named layers (all layers if none given) on the next compose"""
+        for layer in (self.by_name[name] for name in names) if names else self.layers:
+            layer.dirty = True
+
+    def set_state(self, name, state):
+        """Give a layer the state it shows, redrawing it on the next compose if it differs"""
+        layer = self.by_name[name]
+        if layer.state != state:
+            layer.state = state
+            layer.dirty = True
+
+    def surface(self, name):
+        return self.by_name[name].surface
+
+    def _allocate(self, layer, target):
+        """Create the layer surface in the target's pixel format"""
+        if layer.transparent:
+            layer.surface = pygame.Surface(self.size, pygame.SRCALPHA, target)
+            if pygame.display.get_surface() is not None:
+                layer.surface = layer.surface.convert_alpha()
+        else:
+            layer.surface = pygame.Surface(self.size, 0, target)
+
+    def compose(self, target):
+        """Redraw invalidated layers, then blend every layer onto target in order"""
+        for layer in self.layers:
+            if layer.surface is None:
+                self._allocate(layer, target)
+            if layer.dirty:
+                if layer.transparent:
+                    layer.surface.fill((0, 0, 0, 0))
+                regions = layer.draw(layer.surface, layer.state)
+                layer.regions = None if regions is None else merge_rects(regions)
+                layer.dirty = False
+
+            if not layer.composite:
+                continue
+            if not layer.transparent or layer.regions is None:
+                target.blit(layer.surface, (0, 0))
+            else:
+                for rect in layer.regions:
+                    target.blit(layer.surface, rect, rect)
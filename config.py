@@ -3,14 +3,25 @@ from enum import Enum, auto
 import os
 
 # Font setup
-def get_font(size):
-    """Get the C&C Red Alert font in specified size"""
-    try:
-        font_path = os.path.join(os.path.dirname(__file__), "assets", "fonts", "C&C Red Alert [INET].ttf")
-        return pygame.font.Font(font_path, size)
-    except:
-        print("Warning: Could not load C&C Red Alert font, falling back to system font")
-        return pygame.font.SysFont('Arial', size)
+FONT_PATH = os.path.join(os.path.dirname(__file__), "assets", "fonts", "C&C Red Alert [INET].ttf")
+
+_fonts = {}  # (path, size) -> Font, shared by every widget for the life of the process
+_missing_fonts = set()  # Paths that failed to load, so the fallback warning prints once
+
+def get_font(size, path=FONT_PATH):
+    """Get the C&C Red Alert font in specified size, loading each size only once"""
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        try:
+            font = pygame.font.Font(path, size)
+        except (OSError, pygame.error):
+            if path not in _missing_fonts:
+                _missing_fonts.add(path)
+                print("Warning: Could not load C&C Red Alert font, falling back to system font")
+            font = pygame.font.SysFont('Arial', size)
+        _fonts[key] = font
+    return font
 
 # Window settings
 WINDOW_WIDTH = 1200
@@ -323,7 +334,7 @@ ENEMY_DEFINITIONS = {
 ENEMY_ABILITIES = {
     'detect_towers': {'range': 300, 'reveal_duration': 5.0},
     'fast_movement': {'speed_boost': 1.5, 'duration': 3.0},
-    'shield_generator': {'shield_amount': 50, 'radius': 100},
+    'shield_generator': {'shield_amount': 50, 'radius': 100, 'duration': 5.0},
     'repair_nearby': {'heal_amount': 10, 'radius': 150, 'interval': 2.0},
     'break_terrain': {'damage_multiplier': 2.0, 'cooldown': 5.0},
     'armor_plating': {'damage_reduction': 0.3},
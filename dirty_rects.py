@@ -0,0 +1,69 @@
+import pygame
+
+def union_rects(*rects):
+    """Smallest rect covering every non-empty rect given, skipping None; None if nothing was drawn"""
+    drawn = [rect for rect in rects if rect]
+    if not drawn:
+        return None
+    return drawn[0].unionall(drawn[1:])
+
+class DirtyRectTracker:
+    """Collects the screen regions that changed this frame and pushes only those to the display.
+
+    Regions marked on the previous frame are pushed again, so a sprite that
+    moved away leaves no stale pixels behind. Falls back to a full flip when a
+    screen asks for it or the marked area covers most of the window.
+    """
+    FULL_UPDATE_FRACTION = 0.6  # Share of the window above which one flip is cheaper
+
+    def __init__(self, size):
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.rects = []
+        self.previous = []
+        self.full = True  # Nothing has been presented yet
+        self.signatures = {}  # key -> last seen value, for mark_if_changed
+        self.areas = {}  # key -> rect marked for it last time, which may hold pixels the new state no longer covers
+
+    def mark(self, rect):
+        """Mark one screen region as changed"""
+        rect = self.screen_rect.clip(rect)
+        if rect.width and rect.height:
+            self.rects.append(rect)
+
+    def mark_all(self):
+        """Redraw the whole window this frame"""
+        self.full = True
+
+    def changed(self, key, signature):
+        """Whether signature differs from the one seen last frame under key"""
+        if self.signatures.get(key) == signature:
+            return False
+        self.signatures[key] = signature
+        return True
+
+    def mark_if_changed(self, key, signature, rect):
+        """Mark rect, and the area marked for key last time, only when the state drawn inside it has changed"""
+        if self.changed(key, signature):
+            self.mark(rect)
+            previous = self.areas.get(key)
+            if previous is not None:
+                self.mark(previous)
+            self.areas[key] = pygame.Rect(rect)
+
+    def reset(self):
+        """Forget remembered signatures, e.g. when switching screens"""
+        self.signatures.clear()
+        self.areas.clear()
+        self.full = True
+
+    def present(self):
+        """Push the marked regions to the display and start a new frame"""
+        rects = self.rects + self.previous
+        area = sum(rect.width * rect.height for rect in rects)
+        if self.full or area > self.screen_rect.width * self.screen_rect.height * self.FULL_UPDATE_FRACTION:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+        self.previous = self.rects
+        self.rects = []
+        self.full = False
@@ -2,13 +2,38 @@ import pygame
 import random
 from config import *
 from ui import HealthBar
+from dirty_rects import union_rects
+from enemy_store import StoreField, PositionField, ENEMY_TYPE_IDS
 
 class Enemy:
-    def __init__(self, y, enemy_type):
+    """A single enemy; its hot per-frame values live in an EnemyStore once spawned"""
+    x = PositionField('x')
+    y = PositionField('y')
+    velocity_x = StoreField('vx')
+    velocity_y = StoreField('vy')
+    health = StoreField('health')
+    max_health = StoreField('max_health')
+    base_speed = StoreField('base_speed')
+    speed = StoreField('speed')
+    speed_multiplier = StoreField('speed_multiplier')
+    is_stunned = StoreField('stunned')
+    stun_timer = StoreField('stun_timer')
+    attack_cooldown = StoreField('attack_cooldown')
+    damage_flash = StoreField('damage_flash')
+    type_id = StoreField('type_id')
+
+    def __init__(self, y, enemy_type, rng=None):
+        # Values are held here until the enemy is appended to an EnemyStore
+        self._store = None
+        self._slot = None
+        self._detached = {}
+        
         # Position starts at right edge of grid
         self.x = WINDOW_WIDTH - SIDEBAR_WIDTH
         self.y = y * CELL_HEIGHT + CELL_HEIGHT // 2
         self.enemy_type = enemy_type
+        self.rng = rng if rng is not None else random  # Simulation stream for pathing choices
+        self.type_id = ENEMY_TYPE_IDS[enemy_type]
         
         # Get enemy properties from definitions
         enemy_def = ENEMY_DEFINITIONS[enemy_type]
@@ -62,36 +87,26 @@ class Enemy:
         self.velocity_x = -self.speed
         self.velocity_y = 0
         
-        # Create collision rect
-        self.collision_rect = pygame.Rect(
-            self.x - self.width/2,
-            self.y - self.height/2,
-            self.width,
-            self.height
-        )
+    @property
+    def collision_rect(self):
+        """Collision rect at the enemy's current position"""
+        # Assign coordinates rather than pass them in: Rect rounds on assignment
+        # but truncates in the constructor, and movement has always used assignment
+        rect = pygame.Rect(0, 0, self.width, self.height)
+        rect.x = self.x - self.width/2
+        rect.y = self.y - self.height/2
+        return rect
         
-    def update(self, dt, towers, gameplay_manager=None):
-        if self.is_stunned:
-            self.stun_timer -= dt
-            if self.stun_timer <= 0:
-                self.is_stunned = False
-            return
-            
-        # Store old position for collision resolution
-        old_x = self.x
-        old_y = self.y
+    def resolve_tower_collisions(self, dt, towers, old_x, old_y, lane_index):
+        """Block, attack and path around solid towers after the store has moved us.
+        Returns True if a tower was hit this frame."""
+        collision_rect = self.collision_rect
         
-        # Update actual speed based on multipliers
-        self.speed = self.base_speed * self.speed_multiplier
-        
-        # Apply movement if not stunned
-        if not self.is_stunned:
-            self.x += self.velocity_x * dt
-            self.y += self.velocity_y * dt
-        
-        # Update collision rect
-        self.collision_rect.x = self.x - self.width/2
-        self.collision_rect.y = self.y - self.height/2
+        # Only towers near either end of this frame's move can be hit
+        old_rect = collision_rect.copy()
+        old_rect.x = old_x - self.width/2
+        old_rect.y = old_y - self.height/2
+        nearby_towers = lane_index.colliding_candidates(collision_rect.union(old_rect))
         
         # Update ability cooldowns
         for ability in self.ability_cooldowns:
@@ -100,14 +115,14 @@ class Enemy:
                 
         # Check collisions with towers
         collided = False
-        for tower in towers:
-            if tower.check_collision(self.collision_rect):
+        for tower in nearby_towers:
+            if tower.check_collision(collision_rect):
                 if tower.has_collision:
                     # Revert to old position if tower has collision
                     self.x = old_x
                     self.y = old_y
-                    self.collision_rect.x = self.x - self.width/2
-                    self.collision_rect.y = self.y - self.height/2
+                    collision_rect.x = self.x - self.width/2
+                    collision_rect.y = self.y - self.height/2
                     collided = True
                     
                     # Attack tower if attack is available
@@ -131,26 +146,17 @@ class Enemy:
         # Handle pathing and movement
         if collided:
             # Try to find an open path
-            can_move_up = True
-            can_move_down = True
-            
             test_distance = 50
             
             # Test upward movement
-            self.collision_rect.y -= test_distance
-            for tower in towers:
-                if tower.has_collision and tower.check_collision(self.collision_rect):
-                    can_move_up = False
-                    break
-            self.collision_rect.y += test_distance
+            collision_rect.y -= test_distance
+            can_move_up = not lane_index.is_blocked(collision_rect)
+            collision_rect.y += test_distance
             
             # Test downward movement
-            self.collision_rect.y += test_distance
-            for tower in towers:
-                if tower.has_collision and tower.check_collision(self.collision_rect):
-                    can_move_down = False
-                    break
-            self.collision_rect.y -= test_distance
+            collision_rect.y += test_distance
+            can_move_down = not lane_index.is_blocked(collision_rect)
+            collision_rect.y -= test_distance
             
             # Choose direction based on available paths
             if can_move_up and not can_move_down:
@@ -159,23 +165,11 @@ class Enemy:
                 self.velocity_y = self.speed
             elif can_move_up and can_move_down:
                 if self.velocity_y == 0:
-                    self.velocity_y = self.speed if random.random() > 0.5 else -self.speed
+                    self.velocity_y = self.speed if self.rng.random() > 0.5 else -self.speed
             else:
                 self.velocity_y = 0
-        else:
-            # Gradually return to horizontal movement
-            self.velocity_y *= 0.9
-            if abs(self.velocity_y) < 1:
-                self.velocity_y = 0
-        
-        # Use abilities
-        self.update_abilities(dt, towers, gameplay_manager)
-        
-        # Update status effect timers
-        if self.damage_flash > 0:
-            self.damage_flash -= dt
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= dt
+                
+        return collided
             
     def update_abilities(self, dt, towers, gameplay_manager):
         if not gameplay_manager:
@@ -188,7 +182,7 @@ class Enemy:
                 elif ability == 'shield_generator':
                     self.use_shield_generator()
                 elif ability == 'repair_nearby':
-                    self.use_repair_nearby()
+                    self.use_repair_nearby(gameplay_manager)
                 elif ability == 'resource_steal':
                     self.use_resource_steal(gameplay_manager)
                 elif ability == 'divide':
@@ -210,9 +204,9 @@ class Enemy:
         self.shield_amount = ability_data['shield_amount']
         self.ability_cooldowns['shield_generator'] = ability_data['duration']
         
-    def use_repair_nearby(self):
+    def use_repair_nearby(self, gameplay_manager):
         ability_data = ENEMY_ABILITIES['repair_nearby']
-        for enemy in self.nearby_enemies:
+        for enemy in gameplay_manager.enemy_grid.query_radius(self.x, self.y, ability_data['radius']):
             if enemy != self and enemy.health < enemy.max_health:
                 enemy.health = min(enemy.max_health, enemy.health + ability_data['heal_amount'])
         self.ability_cooldowns['repair_nearby'] = ability_data['interval']
@@ -222,7 +216,7 @@ class Enemy:
         # Steal from random resource type
         resources = list(gameplay_manager.resources.keys())
         if resources:
-            resource = random.choice(resources)
+            resource = self.rng.choice(resources)
             amount = min(ability_data['amount'], gameplay_manager.resources[resource])
             gameplay_manager.resources[resource] -= amount
         self.ability_cooldowns['resource_steal'] = 5.0
@@ -254,9 +248,10 @@ class Enemy:
     def use_divide(self, gameplay_manager):
         ability_data = ENEMY_ABILITIES['divide']
         if len(self.clones) < ability_data['max_clones']:
-            clone = Enemy(int(self.y / CELL_HEIGHT), self.enemy_type)
+            clone = Enemy(int(self.y / CELL_HEIGHT), self.enemy_type, self.rng)
             clone.health = self.max_health * ability_data['clone_health_percent']
             clone.max_health = clone.health
+            clone.abilities = [ability for ability in clone.abilities if ability != 'divide']  # Clones don't split again
             gameplay_manager.enemies.append(clone)
             self.clones.append(clone)
         self.ability_cooldowns['divide'] = ability_data['cooldown']
@@ -264,7 +259,7 @@ class Enemy:
     def use_deploy_drones(self, gameplay_manager):
         ability_data = ENEMY_ABILITIES['deploy_drones']
         for _ in range(ability_data['drone_count']):
-            drone = Enemy(int(self.y / CELL_HEIGHT), 'ScoutDrone')
+            drone = Enemy(int(self.y / CELL_HEIGHT), 'ScoutDrone', self.rng)
             drone.health = ability_data['drone_health']
             drone.max_health = drone.health
             gameplay_manager.enemies.append(drone)
@@ -291,6 +286,7 @@ class Enemy:
         return self.is_dead()
         
     def draw(self, surface):
+        """Draw the enemy, returning the area everything it drew covers"""
         # Draw enemy with appropriate size and color
         color = self.color
         
@@ -299,45 +295,47 @@ class Enemy:
             color = (255, 255, 255)
             
         # Draw base shape
-        pygame.draw.rect(surface, color,
-                        (self.x - self.width/2, 
-                         self.y - self.height/2, 
-                         self.width, self.height))
+        drawn = pygame.draw.rect(surface, color,
+                                (self.x - self.width/2, 
+                                 self.y - self.height/2, 
+                                 self.width, self.height))
                          
         # Draw shield if active
         if self.shield_amount > 0:
             shield_surface = pygame.Surface((self.width + 8, self.height + 8), pygame.SRCALPHA)
             pygame.draw.rect(shield_surface, (100, 200, 255, 128),
                            (0, 0, self.width + 8, self.height + 8))
-            surface.blit(shield_surface, 
-                        (self.x - (self.width + 8)/2, 
-                         self.y - (self.height + 8)/2))
+            drawn = union_rects(drawn, surface.blit(shield_surface, 
+                                                    (self.x - (self.width + 8)/2, 
+                                                     self.y - (self.height + 8)/2)))
                          
         # Draw health bar using shared HealthBar component
-        HealthBar.draw(surface, 
-                      self.x - self.width/2, 
-                      self.y - self.height/2 - 8,
-                      self.width, self.health, self.max_health)
+        health_bar = HealthBar.draw(surface, 
+                                    self.x - self.width/2, 
+                                    self.y - self.height/2 - 8,
+                                    self.width, self.health, self.max_health)
         
         # Draw ability indicators
-        self.draw_ability_indicators(surface)
+        return union_rects(drawn, health_bar, *self.draw_ability_indicators(surface))
         
     def draw_ability_indicators(self, surface):
-        # Draw small indicators for active abilities
+        """Draw small indicators for active abilities, returning their areas"""
         indicator_size = 4
         spacing = 6
         x_start = self.x - (len(self.abilities) * spacing) / 2
         
+        drawn = []
         for i, ability in enumerate(self.abilities):
             if self.ability_cooldowns[ability] <= 0:
                 color = (0, 255, 0)  # Ready
             else:
                 color = (255, 0, 0)  # On cooldown
                 
-            pygame.draw.circle(surface, color,
-                             (int(x_start + i * spacing),
-                              int(self.y + self.height/2 + 8)),
-                             indicator_size)
+            drawn.append(pygame.draw.circle(surface, color,
+                                            (int(x_start + i * spacing),
+                                             int(self.y + self.height/2 + 8)),
+                                            indicator_size))
+        return drawn
     
     def is_dead(self):
         return self.health <= 0
@@ -0,0 +1,161 @@
+import numpy as np
+from config import ENEMY_DEFINITIONS
+
+# Stable numeric id per enemy type for the type_id array
+ENEMY_TYPE_IDS = {enemy_type: i for i, enemy_type in enumerate(ENEMY_DEFINITIONS)}
+
+# Per-enemy values kept in structure-of-arrays form, with their dtypes
+STORE_FIELDS = {
+    'x': np.float64,
+    'y': np.float64,
+    'vx': np.float64,
+    'vy': np.float64,
+    'health': np.float64,
+    'max_health': np.float64,
+    'base_speed': np.float64,
+    'speed': np.float64,
+    'speed_multiplier': np.float64,
+    'stunned': np.bool_,
+    'stun_timer': np.float64,
+    'attack_cooldown': np.float64,
+    'damage_flash': np.float64,
+    'type_id': np.int16
+}
+
+class StoreField:
+    """Attribute that lives in a store array (EnemyStore, OrbStore) once its object is added to one"""
+    def __init__(self, field):
+        self.field = field
+
+    def __get__(self, enemy, owner=None):
+        if enemy is None:
+            return self
+        store = enemy._store
+        if store is None:
+            return enemy._detached[self.field]
+        return store.arrays[self.field][enemy._slot].item()
+
+    def __set__(self, enemy, value):
+        store = enemy._store
+        if store is None:
+            enemy._detached[self.field] = value
+        else:
+            store.arrays[self.field][enemy._slot] = value
+
+class PositionField(StoreField):
+    """StoreField for x and y that marks the store's positions as changed on every write"""
+    def __set__(self, enemy, value):
+        super().__set__(enemy, value)
+        if enemy._store is not None:
+            enemy._store.version += 1
+
+class EnemyStore:
+    """List-like container of enemies backed by NumPy arrays.
+
+    Iteration order matches insertion order, like the plain list it replaces,
+    while movement and timers for every enemy advance in one vectorized step.
+    """
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.arrays = {name: np.zeros(capacity, dtype=dtype) for name, dtype in STORE_FIELDS.items()}
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+        self.free_slots = list(range(capacity - 1, -1, -1))
+        self.order = []  # Enemy views in spawn order
+        self.version = 0  # Bumped whenever enemies are added, removed or moved
+
+    def __len__(self):
+        return len(self.order)
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __getitem__(self, index):
+        return self.order[index]
+
+    def __contains__(self, enemy):
+        return enemy._store is self
+
+    def slots(self):
+        """Array slot of each enemy, in iteration order"""
+        return np.fromiter((enemy._slot for enemy in self.order), dtype=np.intp, count=len(self.order))
+
+    def _grow(self):
+        """Double capacity, keeping existing slots in place"""
+        new_capacity = self.capacity * 2
+        for name, array in self.arrays.items():
+            grown = np.zeros(new_capacity, dtype=array.dtype)
+            grown[:self.capacity] = array
+            self.arrays[name] = grown
+        alive = np.zeros(new_capacity, dtype=np.bool_)
+        alive[:self.capacity] = self.alive
+        self.alive = alive
+        self.free_slots.extend(range(new_capacity - 1, self.capacity - 1, -1))
+        self.capacity = new_capacity
+
+    def append(self, enemy):
+        """Move a newly created enemy's values into the arrays"""
+        if not self.free_slots:
+            self._grow()
+        slot = self.free_slots.pop()
+        for field, value in enemy._detached.items():
+            self.arrays[field][slot] = value
+        self.alive[slot] = True
+        enemy._store = self
+        enemy._slot = slot
+        enemy._detached = None
+        self.order.append(enemy)
+        self.version += 1
+
+    def remove(self, enemy):
+        """Detach an enemy, keeping a snapshot of its values on the object"""
+        self.order.remove(enemy)
+        slot = enemy._slot
+        enemy._detached = {field: array[slot].item() for field, array in self.arrays.items()}
+        enemy._store = None
+        enemy._slot = None
+        self.alive[slot] = False
+        self.free_slots.append(slot)
+        self.version += 1
+
+    def update(self, dt, towers, lane_index, gameplay_manager=None):
+        """Advance every enemy by dt: stuns, movement, tower collisions and timers"""
+        a = self.arrays
+        alive = self.alive
+
+        # Stunned enemies only count down their stun this tick
+        stunned = alive & a['stunned']
+        a['stun_timer'][stunned] -= dt
+        a['stunned'][stunned & (a['stun_timer'] <= 0)] = False
+
+        # Move everyone else along their current velocity
+        moving = alive & ~stunned
+        a['speed'][moving] = a['base_speed'][moving] * a['speed_multiplier'][moving]
+        old_x = a['x'].copy()
+        old_y = a['y'].copy()
+        a['x'][moving] += a['vx'][moving] * dt
+        a['y'][moving] += a['vy'][moving] * dt
+        self.version += 1
+
+        # Tower collisions and path finding still need per-enemy logic
+        collided = np.zeros(self.capacity, dtype=np.bool_)
+        for enemy in self.order[:]:
+            slot = enemy._slot
+            if moving[slot]:
+                collided[slot] = enemy.resolve_tower_collisions(dt, towers, old_x[slot], old_y[slot], lane_index)
+                enemy.update_abilities(dt, towers, gameplay_manager)
+
+        # Abilities may have spawned enemies and grown the arrays
+        if self.capacity > len(moving):
+            moving = np.pad(moving, (0, self.capacity - len(moving)))
+            collided = np.pad(collided, (0, self.capacity - len(collided)))
+
+        # Gradually return to horizontal movement when not blocked
+        drifting = moving & ~collided
+        a['vy'][drifting] *= 0.9
+        a['vy'][drifting & (np.abs(a['vy']) < 1)] = 0
+
+        # Update status effect timers
+        flashing = moving & (a['damage_flash'] > 0)
+        a['damage_flash'][flashing] -= dt
+        cooling = moving & (a['attack_cooldown'] > 0)
+        a['attack_cooldown'][cooling] -= dt
@@ -72,8 +72,8 @@ class EnergySystem:
             return True
         return False
     
-    def draw(self, surface, x: int, y: int) -> None:
-        """Draw the energy bar above the tower"""
+    def draw(self, surface, x: int, y: int) -> pygame.Rect:
+        """Draw the energy bar above the tower, returning the area it covers"""
         # Create a small transparent surface for the energy bar background
         bar_y = y - 12  # Position above health bar
         bg_rect = pygame.Rect(x + 5, bar_y, self.bar_width, self.bar_height)
@@ -81,12 +81,13 @@ class EnergySystem:
         # Draw background with alpha
         s = pygame.Surface((self.bar_width, self.bar_height), pygame.SRCALPHA)
         pygame.draw.rect(s, self.bar_bg_color, (0, 0, self.bar_width, self.bar_height))
-        surface.blit(s, bg_rect)
+        drawn = surface.blit(s, bg_rect)
         
         # Draw energy level
         energy_width = int((self.current_energy / self.max_energy) * self.bar_width)
         energy_rect = pygame.Rect(x + 5, bar_y, energy_width, self.bar_height)
         pygame.draw.rect(surface, self.bar_color, energy_rect)
+        return drawn
 
 # Dictionary to store energy costs for different tower types
 ENERGY_COSTS = {
@@ -1,3 +1,5 @@
+import argparse
+import os
 import pygame
 import sys
 from enum import Enum, auto
@@ -6,16 +8,34 @@ from title_screen import TitleScreen
 from level_select import LevelSelectScreen
 from gameplay import GameplayManager, GameState
 from game_over_screen import GameOverScreen
+from simulation import FIXED_DT
+from rng import GameRNG
+from replay import InputRecorder, ReplayPlayer
+from dirty_rects import DirtyRectTracker
+from level_loader import LevelLoader
+from loading_screen import LoadingScreen
+
+# Most fixed simulation steps to run in one frame before dropping time
+MAX_STEPS_PER_FRAME = 5
 
 class AppState(Enum):
     TITLE_SCREEN = auto()
     LEVEL_SELECT = auto()
+    LOADING = auto()
     GAMEPLAY = auto()
     GAME_OVER = auto()
     VICTORY = auto()
     QUIT = auto()
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mars Tower Defense")
+    parser.add_argument('--seed', type=int, default=None, help="seed every level started this session")
+    parser.add_argument('--record', default=None, help="save the inputs of each level played to this path, suffixed with its biome and level")
+    parser.add_argument('--replay', default=None, help="play back a recorded level")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="push only changed screen regions to the display (faster without a GPU)")
+    args = parser.parse_args(argv)
+    
     pygame.init()
     pygame.font.init()
     
@@ -27,14 +47,64 @@ def main():
     initialize_tower_images()
     
     clock = pygame.time.Clock()
+    dirty = DirtyRectTracker(screen.get_size()) if args.dirty_rects else None
     
     # Initialize screens
     title_screen = TitleScreen()
     level_select_screen = LevelSelectScreen()
+    loading_screen = LoadingScreen()
+    level_loader = LevelLoader()
+    loading = None  # (biome, level) being prepared while in the LOADING state
     gameplay = None
     game_over_screen = None
+    player = None  # ReplayPlayer driving the current level, if replaying
+    recorder = None  # InputRecorder for the current level, if recording
+    recorded_paths = set()  # Recordings written this session, so a restarted level gets its own file
+    
+    def load_level(biome, level):
+        """Show the loading screen while the level is prepared in the background"""
+        nonlocal loading
+        loading = (biome, level)
+        level_loader.prefetch(biome, level)
+        loading_screen.start(biome, level)
+        return AppState.LOADING
+    
+    def start_level(biome, level):
+        """Create a fresh level from its prepared background, recording its inputs if requested"""
+        nonlocal recorder
+        finish_recording()
+        rng = GameRNG(args.seed)
+        new_gameplay = GameplayManager(biome, level, rng, level_loader.take(biome, level))
+        if args.record:
+            recorder = InputRecorder(biome, level, rng.seed)
+            new_gameplay.recorder = recorder
+        return new_gameplay
+    
+    def finish_recording():
+        """Write out the recording of the level that just ended"""
+        nonlocal recorder
+        if recorder:
+            recorder.save(recording_path(recorder))
+            recorder = None
+    
+    def recording_path(recorder):
+        """--record path with the level's biome and number added, plus a counter if it was already played"""
+        stem, ext = os.path.splitext(args.record)
+        base = f"{stem}_{recorder.biome.name.lower()}_{recorder.level}"
+        path = base + ext
+        attempt = 1
+        while path in recorded_paths:
+            attempt += 1
+            path = f"{base}_{attempt}{ext}"
+        recorded_paths.add(path)
+        return path
     
     current_state = AppState.TITLE_SCREEN
+    if args.replay:
+        player = ReplayPlayer.load(args.replay)
+        gameplay = GameplayManager(player.biome, player.level, GameRNG(player.seed))
+        current_state = AppState.GAMEPLAY
+    step_time = 0  # Unsimulated time carried between frames
     prev_state = None  # Track previous state for transitions
     transition_timer = 0  # Add transition timer
     
@@ -49,6 +119,8 @@ def main():
         if current_state != prev_state:
             prev_state = current_state
             transition_timer = 0.1  # Set 100ms transition guard
+            if dirty:
+                dirty.reset()
             if current_state == AppState.GAMEPLAY:
                 # Clear all event handlers when transitioning to gameplay
                 pygame.event.clear()
@@ -76,32 +148,33 @@ def main():
                     if result:
                         if result['action'] == 'title_screen':
                             current_state = AppState.TITLE_SCREEN
+                        elif result['action'] == 'prefetch_level':
+                            level_loader.prefetch(result['biome'], result['level'])
                         elif result['action'] == 'start_level':
-                            # Create gameplay manager with selected biome and level
-                            gameplay = GameplayManager(result['biome'], result['level'])
-                            current_state = AppState.GAMEPLAY
+                            # Prepare the selected biome and level, then start it from the loading screen
+                            current_state = load_level(result['biome'], result['level'])
                             # Clear any remaining events
                             pygame.event.clear()
                 
                 elif current_state == AppState.GAMEPLAY:
+                    if player:
+                        continue  # Recorded inputs drive the level during a replay
                     result = gameplay.handle_input(event)
                     if result == 'menu':
+                        finish_recording()
                         current_state = AppState.TITLE_SCREEN
                     elif result == 'restart':
                         # Restart the current level
-                        biome = gameplay.biome
-                        level = gameplay.level
-                        gameplay = GameplayManager(biome, level)
+                        current_state = load_level(gameplay.biome, gameplay.level)
                 
                 elif current_state == AppState.GAME_OVER or current_state == AppState.VICTORY:
                     result = game_over_screen.handle_input(event)
                     if result == 'restart':
                         # Restart the current level
-                        biome = gameplay.biome
-                        level = gameplay.level
-                        gameplay = GameplayManager(biome, level)
-                        current_state = AppState.GAMEPLAY
+                        player = None
+                        current_state = load_level(gameplay.biome, gameplay.level)
                     elif result == 'menu':
+                        player = None
                         current_state = AppState.LEVEL_SELECT
                     elif result == 'next_level' and current_state == AppState.VICTORY:
                         # Try to advance to next level
@@ -111,8 +184,8 @@ def main():
                         if level > 15:
                             current_state = AppState.LEVEL_SELECT
                         else:
-                            gameplay = GameplayManager(biome, level)
-                            current_state = AppState.GAMEPLAY
+                            player = None
+                            current_state = load_level(biome, level)
         
         # Update based on current state
         if current_state == AppState.TITLE_SCREEN:
@@ -121,8 +194,31 @@ def main():
         elif current_state == AppState.LEVEL_SELECT:
             level_select_screen.update(dt)
             
+        elif current_state == AppState.LOADING:
+            loading_screen.update(dt)
+            if level_loader.ready(*loading):
+                gameplay = start_level(*loading)
+                step_time = 0  # Leftover time from the previous level is not this level's
+                current_state = AppState.GAMEPLAY
+            
         elif current_state == AppState.GAMEPLAY:
-            game_state = gameplay.update(dt)
+            # Advance the simulation in fixed steps so recordings replay exactly
+            game_state = GameState.GAMEPLAY
+            step_time += dt
+            steps = 0
+            while step_time >= FIXED_DT and steps < MAX_STEPS_PER_FRAME:
+                if player:
+                    player.apply(gameplay)
+                game_state = gameplay.update(FIXED_DT)
+                step_time -= FIXED_DT
+                steps += 1
+                if game_state in (GameState.GAME_OVER, GameState.VICTORY):
+                    break
+            if steps == MAX_STEPS_PER_FRAME:
+                step_time = 0  # Too far behind; drop the backlog rather than spiral
+            
+            if game_state in (GameState.GAME_OVER, GameState.VICTORY):
+                finish_recording()
             
             if game_state == GameState.GAME_OVER:
                 # Create game over screen with player statistics
@@ -133,6 +229,7 @@ def main():
                 }
                 game_over_screen = GameOverScreen(False, statistics)  # False = defeat
                 current_state = AppState.GAME_OVER
+                level_loader.prefetch(gameplay.biome, gameplay.level)  # Ready for "Play Again"
             
             elif game_state == GameState.VICTORY:
                 # Mark the level as completed and save progress
@@ -146,6 +243,8 @@ def main():
                 }
                 game_over_screen = GameOverScreen(True, statistics)  # True = victory
                 current_state = AppState.VICTORY
+                if gameplay.level < 15:
+                    level_loader.prefetch(gameplay.biome, gameplay.level + 1)  # Ready for "Next Level"
         
         elif current_state == AppState.GAME_OVER or current_state == AppState.VICTORY:
             game_over_screen.update(dt)
@@ -157,14 +256,27 @@ def main():
         elif current_state == AppState.LEVEL_SELECT:
             level_select_screen.draw(screen)
         
+        elif current_state == AppState.LOADING:
+            loading_screen.draw(screen)
+        
         elif current_state == AppState.GAMEPLAY:
             gameplay.draw(screen)
         
         elif current_state == AppState.GAME_OVER or current_state == AppState.VICTORY:
             game_over_screen.draw(screen)
         
-        pygame.display.flip()
+        if dirty:
+            # Only gameplay knows which regions it touched; menus always repaint in full
+            if current_state == AppState.GAMEPLAY:
+                gameplay.mark_dirty(dirty)
+            else:
+                dirty.mark_all()
+            dirty.present()
+        else:
+            pygame.display.flip()
     
+    finish_recording()
+    level_loader.shutdown()
     pygame.quit()
     sys.exit()
 
@@ -1,6 +1,7 @@
 import pygame
 from config import *
 from ui import Button
+from text_cache import render_text
 
 class GameOverScreen:
     """Screen displayed when the game ends (either victory or defeat)"""
@@ -26,6 +27,14 @@ class GameOverScreen:
             color=(50, 50, 100)
         )
         
+        # Static backdrop and overlays, rendered once
+        self.background = self.render_background()
+        flash_color = (255, 255, 255) if self.is_victory else (255, 0, 0)
+        self.flash_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.flash_surface.fill(flash_color)
+        # Own copy rather than the shared text cache, since its alpha pulses
+        self.action_surface = self.text_font.render("Click a button to continue...", True, (255, 255, 255))
+
         # Additional visual elements
         self.flash_alpha = 255
         self.message_alpha = 0
@@ -65,18 +74,23 @@ class GameOverScreen:
             return 'menu'
         return None
     
-    def draw(self, surface):
-        """Draw the game over screen"""
-        # Draw background (darker for defeat, brighter for victory)
+    def render_background(self):
+        """Backdrop drawn behind everything (darker for defeat, brighter for victory)"""
+        background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
         if self.is_victory:
             # Gradient background for victory
             for y in range(0, WINDOW_HEIGHT, 2):
                 color_value = max(10, min(40, 10 + int(y / WINDOW_HEIGHT * 50)))
                 color = (0, color_value, color_value * 2)
-                pygame.draw.line(surface, color, (0, y), (WINDOW_WIDTH, y))
+                pygame.draw.line(background, color, (0, y), (WINDOW_WIDTH, y))
         else:
             # Darker solid background for defeat
-            surface.fill((20, 0, 0))
+            background.fill((20, 0, 0))
+        return background
+
+    def draw(self, surface):
+        """Draw the game over screen"""
+        surface.blit(self.background, (0, 0))
             
         # Draw main title
         if self.is_victory:
@@ -89,8 +103,8 @@ class GameOverScreen:
             subtitle_text = "The corporate invaders have reached the ecosystem core"
         
         # Draw title with glow effect
-        title_shadow = self.title_font.render(title_text, True, (0, 0, 0))
-        title = self.title_font.render(title_text, True, title_color)
+        title_shadow = render_text(self.title_font, title_text, (0, 0, 0))
+        title = render_text(self.title_font, title_text, title_color)
         
         # Multiple shadows for pseudo-glow effect
         shadow_offsets = [(3, 3), (2, 2), (1, 1), (-1, -1), (-2, -2), (-3, -3)]
@@ -106,7 +120,7 @@ class GameOverScreen:
         surface.blit(title, title_rect)
         
         # Draw subtitle
-        subtitle = self.subtitle_font.render(subtitle_text, True, (200, 200, 200))
+        subtitle = render_text(self.subtitle_font, subtitle_text, (200, 200, 200))
         subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//3 + 60))
         surface.blit(subtitle, subtitle_rect)
         
@@ -114,7 +128,7 @@ class GameOverScreen:
         y_offset = WINDOW_HEIGHT//3 + 120
         for stat, value in self.statistics.items():
             stat_text = f"{stat}: {value}"
-            stat_surface = self.text_font.render(stat_text, True, (200, 200, 200))
+            stat_surface = render_text(self.text_font, stat_text, (200, 200, 200))
             stat_rect = stat_surface.get_rect(center=(WINDOW_WIDTH//2, y_offset))
             surface.blit(stat_surface, stat_rect)
             y_offset += 30
@@ -127,14 +141,11 @@ class GameOverScreen:
         
         # Draw flash effect when screen first appears
         if self.flash_alpha > 0:
-            flash_color = (255, 255, 255) if self.is_victory else (255, 0, 0)
-            flash_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            flash_surface.fill((*flash_color, int(self.flash_alpha)))
-            surface.blit(flash_surface, (0, 0))
+            self.flash_surface.set_alpha(int(self.flash_alpha))
+            surface.blit(self.flash_surface, (0, 0))
             
         # Draw pulsing action message
-        action_text = "Click a button to continue..."
-        action_surface = self.text_font.render(action_text, True, (255, 255, 255))
+        action_surface = self.action_surface
         action_surface.set_alpha(int(self.message_alpha))
         action_rect = action_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT - 50))
         surface.blit(action_surface, action_rect)
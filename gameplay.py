@@ -13,25 +13,54 @@ from combine import CombineManager
 from tooltip import get_tower_tooltip_text, get_enemy_tooltip_text
 from auto_collect import check_auto_collect
 from sediment_generator import SedimentGenerator
-import random
+from simulation import Simulation
+from rng import keyed_random
+from compositor import Compositor
+from text_cache import render_text
 
-class GameplayManager:
-    def __init__(self, biome, level):
-        self.biome = biome
-        self.level = level
+_tower_images = None
+
+def load_tower_images():
+    """Load PNG images for towers with fallback for missing assets, on first use only"""
+    global _tower_images
+    if _tower_images is not None:
+        return _tower_images
+    
+    _tower_images = {}
+    tower_types = [
+        'BlackSmoker', 'RiftiaTubeWorm', 'BlueCilliates', 'SquatLobster',
+        'SpiderCrab', 'GiantSquid', 'ColossalSquid', 'DumboOctopus'
+    ]
+    
+    # Create a default surface for missing assets
+    default_surface = pygame.Surface((32, 32))  # Adjust size as needed
+    default_surface.fill((100, 100, 100))  # Gray color
+    pygame.draw.rect(default_surface, (150, 150, 150), (8, 8, 16, 16))  # Simple shape
+    
+    for tower_name in tower_types:
+        try:
+            img_path = f'assets/{tower_name}.png'
+            _tower_images[tower_name] = pygame.image.load(img_path).convert_alpha()
+        except (FileNotFoundError, pygame.error):
+            # Use default surface for missing assets
+            _tower_images[tower_name] = default_surface.copy()
+    return _tower_images
+
+class GameplayManager(Simulation):
+    def __init__(self, biome, level, rng=None, sediment_generator=None):
+        super().__init__(biome, level, rng)
         
-        # Initialize sediment generator
-        self.sediment_generator = SedimentGenerator(biome, level)
+        # Initialize sediment generator, unless a LevelLoader already prepared it
+        self.sediment_generator = sediment_generator or SedimentGenerator(biome, level)
         self.background = self.sediment_generator.get_background()
+        self.board_frames = {}  # Parallax offsets -> the whole board pre-blended at that sway
+        
+        self.glow_cache = {}  # (glow colour, grid x, grid y) -> (glow surface, screen position)
+        self.glow_cache_version = None
         
-        self.towers = []
-        self.enemies = []
-        self.projectiles = []
         self.tooltip = Tooltip()
         self.hovering_tower = None
         self.hovering_enemy = None
-        self.wave_manager = WaveManager(level)
-        self.paused = False
         
         # Tower placement preview
         self.placement_preview = None
@@ -45,27 +74,6 @@ class GameplayManager:
         # Initialize combine manager
         self.combine_manager = CombineManager()
         
-        # Shop system
-        self.shop = Shop(biome)
-        
-        # Initialize resources
-        self.resources = {
-            'sulfides': INITIAL_RESOURCES,
-            'methane': INITIAL_RESOURCES,
-            'salt': INITIAL_RESOURCES,
-            'lipids': INITIAL_RESOURCES
-        }
-        
-        # Set native resource based on biome
-        if self.biome == Biome.HYDROTHERMAL:
-            self.native_resource = 'sulfides'
-        elif self.biome == Biome.COLDSEEP:
-            self.native_resource = 'methane'
-        elif self.biome == Biome.BRINE_POOL:
-            self.native_resource = 'salt'
-        elif self.biome == Biome.WHALEFALL:
-            self.native_resource = 'lipids'
-        
         # Initialize UI components
         self.grid = GridDisplay()
         self.resource_display = ResourceDisplay(10, 10)
@@ -78,6 +86,7 @@ class GameplayManager:
         )
         self.pause_overlay = PauseOverlay()
         self.pause_font = get_font(FONT_SIZE_MEDIUM)  # Added to provide a font for combine instructions
+        self.sell_font = get_font(FONT_SIZE_SMALL)
 
         # Initialize PauseScreen
         self.pause_screen = PauseScreen()
@@ -85,43 +94,20 @@ class GameplayManager:
         # Initialize sell bin
         self.sell_bin_rect = pygame.Rect(10, WINDOW_HEIGHT - 90, 80, 80)
         self.hovering_sell_bin = False
+        self.shop_rect = pygame.Rect(WINDOW_WIDTH - SIDEBAR_WIDTH, 0, SIDEBAR_WIDTH, WINDOW_HEIGHT)
+        
+        # Long-lived render layers, each redrawn only when what it shows changes
+        self.compositor = Compositor((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.compositor.add_layer('background', self.draw_background_layer, composite=False)
+        self.compositor.add_layer('world', self.draw_world_layer)
+        self.compositor.add_layer('effects', self.draw_effects_layer, transparent=True)
+        self.compositor.add_layer('hud', self.draw_hud_layer, transparent=True)
+        self.world_regions = None  # Areas the world layer's entities covered on its last redraw, until marked
+        self.marked_world_regions = []  # Areas marked on the last world redraw, cleared when it next changes
+        
+        # Tower images are loaded once per process and shared by every level
+        self.tower_images = load_tower_images()
         
-        self.resource_orbs = []  # Add list to track active resource orbs
-        
-        # Load PNG images for towers with fallback for missing assets
-        self.tower_images = {}
-        tower_types = [
-            'BlackSmoker', 'RiftiaTubeWorm', 'BlueCilliates', 'SquatLobster',
-            'SpiderCrab', 'GiantSquid', 'ColossalSquid', 'DumboOctopus'
-        ]
-        
-        # Create a default surface for missing assets
-        default_surface = pygame.Surface((32, 32))  # Adjust size as needed
-        default_surface.fill((100, 100, 100))  # Gray color
-        pygame.draw.rect(default_surface, (150, 150, 150), (8, 8, 16, 16))  # Simple shape
-        
-        for tower_name in tower_types:
-            try:
-                img_path = f'assets/{tower_name}.png'
-                self.tower_images[tower_name] = pygame.image.load(img_path).convert_alpha()
-            except (FileNotFoundError, pygame.error):
-                # Use default surface for missing assets
-                self.tower_images[tower_name] = default_surface.copy()
-        
-    def get_tower_sell_value(self, tower):
-        """Calculate refund value for selling a tower (50% of purchase cost)"""
-        tower_costs = {}
-        
-        if tower.name in TOWER_COSTS:
-            base_costs = TOWER_COSTS[tower.name].copy()
-            multiplier = STAR_COST_MULTIPLIERS.get(tower.stars, 1.0)
-            
-            # Calculate 50% refund of the purchase cost
-            for resource, cost in base_costs.items():
-                tower_costs[resource] = int(cost * multiplier * 0.5)
-                
-        return tower_costs
-
     def get_grid_pos(self, mouse_pos):
         """Convert mouse position to grid position"""
         if mouse_pos[0] > SIDEBAR_WIDTH:
@@ -131,49 +117,6 @@ class GameplayManager:
                 return grid_x, grid_y
         return None
 
-    def is_valid_placement(self, grid_x, grid_y):
-        """Check if tower placement is valid"""
-        if not (0 <= grid_x < GRID_COLS and 0 <= grid_y < GRID_ROWS):
-            return False
-            
-        # Check if cell is empty
-        for tower in self.towers:
-            if tower.x == grid_x and tower.y == grid_y:
-                return False
-        return True
-
-    def create_tower(self, tower_name, grid_x, grid_y, star_level=1):
-        """Create a new tower of the appropriate type"""
-        tower = None
-        
-        # Handle tower types
-        if tower_name in ['BlackSmoker', 'BubblePlume', 'BrinePool', 'OsedaxWorm', 'Nautilus']:
-            tower = ResourceTower(grid_x, grid_y, tower_name, self, self.biome)
-        elif tower_name in ['RiftiaTubeWorm', 'Rockfish', 'Hagfish', 'Muusoctopus', 'GiantSquid']:
-            tower = ProjectileTower(grid_x, grid_y, tower_name, self, self.biome)
-        elif tower_name in ['SquatLobster', 'SpiderCrab', 'Chimaera', 'SleeperShark', 'ColossalSquid']:
-            tower = TankTower(grid_x, grid_y, tower_name, self, self.biome)
-        elif tower_name in ['BlueCilliates', 'VesicomyidaeClams', 'MuscleBed', 'DumboOctopus', 'Beggiatoa']:
-            tower = EffectTower(grid_x, grid_y, tower_name, self, self.biome)
-                
-        if tower:
-            tower.stars = star_level
-            tower._setup_tower_properties()
-        return tower
-
-    def place_tower(self, tower_type, grid_x, grid_y):
-        """Place a new tower on the grid"""
-        if tower_type == "basic":
-            tower_name = "RiftiaTubeWorm"  # Default basic tower
-        elif tower_type == "frost":
-            tower_name = "Rockfish"  # Default frost tower
-        else:
-            return
-            
-        tower = self.create_tower(tower_name, grid_x, grid_y)
-        if tower:
-            self.towers.append(tower)
-
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
@@ -199,12 +142,10 @@ class GameplayManager:
             mouse_x, mouse_y = event.pos
             
             # First check for resource orb clicks
-            for orb in self.resource_orbs[:]:  # Use slice to avoid modification during iteration
+            for i, orb in enumerate(self.resource_orbs):
                 if orb.contains_point(mouse_x, mouse_y) and orb.active:
                     # Collect the resource
-                    self.resources[orb.resource_type] += orb.amount
-                    orb.active = False
-                    self.resource_orbs.remove(orb)
+                    self.collect_orb(i)
                     return  # Don't process other clicks if we collected a resource
             
             # Handle pause button
@@ -214,7 +155,7 @@ class GameplayManager:
                 
             # Handle shop refresh button and interactions
             if self.shop.refresh_button.rect.collidepoint(mouse_x, mouse_y):
-                self.shop.try_refresh_shop(self.resources)
+                self.refresh_shop()
                 return
                 
             # Handle shop interactions
@@ -227,11 +168,7 @@ class GameplayManager:
                 grid_x, grid_y = grid_pos
                 
                 # Check if clicking on existing tower
-                clicked_tower = None
-                for tower in self.towers:
-                    if tower.x == grid_x and tower.y == grid_y:
-                        clicked_tower = tower
-                        break
+                clicked_tower = self.tower_at(grid_x, grid_y)
                 
                 if clicked_tower:
                     if event.button == 1:  # Left click
@@ -251,22 +188,17 @@ class GameplayManager:
                             )
                     elif event.button == 3:  # Right click
                         if not self.combine_manager.is_combining:
-                            self.combine_manager.start_combining(clicked_tower, self.towers)
+                            self.combine_manager.start_combining(clicked_tower, self)
                 elif self.combine_manager.is_combining and len(self.combine_manager.combining_towers) == 3:
                     # Try to place combined tower
-                    self.combine_manager.complete_combine(grid_pos, self.create_tower)
+                    self.combine_manager.complete_combine(grid_pos)
                 elif self.shop.selected_tower:
                     # Try to place new tower from shop
-                    if self.is_valid_placement(grid_x, grid_y):
-                        tower_name, star_level = self.shop.selected_tower
-                        new_tower = self.create_tower(tower_name, grid_x, grid_y, star_level)
-                        if new_tower:
-                            for i, slot in enumerate(self.shop.slots):
-                                if slot['tower'] == self.shop.selected_tower:
-                                    if self.shop.purchase_tower(i, self.resources):
-                                        self.towers.append(new_tower)
-                                        self.shop.selected_tower = None
-                                    break
+                    for i, slot in enumerate(self.shop.slots):
+                        if slot['tower'] == self.shop.selected_tower:
+                            if self.buy_tower(i, grid_x, grid_y):
+                                self.shop.selected_tower = None
+                            break
                         
         elif event.type == pygame.MOUSEBUTTONUP:
             if self.dragging_tower:
@@ -274,18 +206,13 @@ class GameplayManager:
                 
                 # Check if tower was dropped on sell bin
                 if self.sell_bin_rect.collidepoint(mouse_pos):
-                    # Get sell value and add to resources
-                    sell_value = self.get_tower_sell_value(self.dragging_tower)
-                    for resource, amount in sell_value.items():
-                        self.resources[resource] += amount
-                    
-                    # Remove the tower
-                    self.towers.remove(self.dragging_tower)
+                    # Refund half the cost and remove the tower
+                    self.sell_tower(self.dragging_tower.x, self.dragging_tower.y)
                 else:
                     # Normal tower placement
                     grid_pos = self.get_grid_pos(mouse_pos)
-                    if grid_pos and self.is_valid_placement(*grid_pos):
-                        self.dragging_tower.x, self.dragging_tower.y = grid_pos
+                    if grid_pos:
+                        self.drag_tower(self.dragging_tower.x, self.dragging_tower.y, *grid_pos)
                 
                 self.dragging_tower = None
                 self.drag_start_pos = None
@@ -323,95 +250,14 @@ class GameplayManager:
                     self.combine_manager.cancel_combine()
 
     def update(self, dt):
-        """Update game state"""
-        if self.paused:
-            return None
-            
-        # Update towers and collect spawned orbs
-        for tower in self.towers[:]:
-            result = tower.update(dt, self)
-            
-            # Handle spawned resource orbs
-            if isinstance(result, list) and len(result) > 0 and hasattr(result[0], 'resource_type'):
-                self.resource_orbs.extend(result)
-            
-            if tower.health <= 0:
-                self.towers.remove(tower)
-                
-        # Update resource orbs and check for auto-collection
-        for orb in self.resource_orbs[:]:
-            if orb.update(dt):  # Returns True when orb should be removed
-                if orb.active:  # If orb is still active, auto-collect it
-                    self.resources[orb.resource_type] += orb.collect(auto_collected=True)
-                self.resource_orbs.remove(orb)
-                continue
-                
-            # Check for auto-collection by appropriate towers
-            for tower in self.towers:
-                if check_auto_collect(orb, tower):
-                    self.resources[orb.resource_type] += orb.collect(auto_collected=True)
-                    self.resource_orbs.remove(orb)
-                    break
-
-        # Update wave state and spawn enemies
-        if not self.wave_manager.update(dt, self.enemies):
-            # No more waves and all enemies defeated
-            if len(self.enemies) == 0:
-                return GameState.VICTORY
-                
-        # Update towers and handle resource generation
-        for tower in self.towers[:]:
-            result = tower.update(dt, self)
-            
-            if isinstance(tower, ResourceTower) and result:
-                # Add any spawned resource orbs
-                self.resource_orbs.extend(result)
-            elif isinstance(tower, ProjectileTower) and result:
-                self.projectiles.append(Projectile(
-                    result['x'], result['y'],
-                    result['damage'], result['color'],
-                    result['target']))
-                    
-            # Remove destroyed towers
-            if tower.health <= 0:
-                self.towers.remove(tower)
-                
-        # Update resource orbs and check for auto-collection
-        for orb in self.resource_orbs[:]:
-            if not orb.update(dt):
-                self.resource_orbs.remove(orb)
-                continue
-                
-            # Check for auto-collection by appropriate towers
-            for tower in self.towers:
-                if check_auto_collect(orb, tower):
-                    self.resources[orb.resource_type] += orb.amount
-                    orb.active = False
-                    self.resource_orbs.remove(orb)
-                    break
-                
-        # Update enemies
-        for enemy in self.enemies[:]:
-            enemy.update(dt, self.towers)
-            
-            if enemy.x < SIDEBAR_WIDTH:  # Enemy reached base
-                return GameState.GAME_OVER
-            elif enemy.is_dead():
-                reward = enemy.get_reward()
-                self.resources[self.native_resource] += reward
-                self.enemies.remove(enemy)
-                # Track enemy kill for shop free refreshes
-                self.shop.add_enemy_kill()
-                
-        # Update projectiles
-        for projectile in self.projectiles[:]:
-            if projectile.update(dt):
-                self.projectiles.remove(projectile)
-                
+        """Update game state and animated background"""
+        state = super().update(dt)
+        
         # Update sediment generator for animated elements
-        self.sediment_generator.update(dt)
+        if state == GameState.GAMEPLAY:
+            self.sediment_generator.update(dt)
                 
-        return GameState.GAMEPLAY
+        return state
 
     def handle_hover(self, mouse_pos):
         """Handle mouse hover for tooltips"""
@@ -425,19 +271,19 @@ class GameplayManager:
             grid_y = mouse_y // CELL_HEIGHT
             
             # Then check towers
-            for tower in self.towers:
-                if tower.x == grid_x and tower.y == grid_y:
-                    self.hovering_tower = tower.name
-                    tooltip_text = get_tower_tooltip_text(tower.name).copy()
-                    if tower.level > 1:
-                        tooltip_text.append(f"Level: {tower.level}")
-                    if hasattr(tower, 'projectile_damage'):
-                        tooltip_text.append(f"Current Damage: {tower.projectile_damage}")
-                    if hasattr(tower, 'health'):
-                        tooltip_text.append(f"Current Health: {tower.health}/{tower.max_health}")
-                    self.tooltip.set_content(tooltip_text)
-                    self.tooltip.show(mouse_x + 15, mouse_y + 15)
-                    return
+            tower = self.tower_at(grid_x, grid_y)
+            if tower:
+                self.hovering_tower = tower.name
+                tooltip_text = get_tower_tooltip_text(tower.name)
+                if tower.level > 1:
+                    tooltip_text.append(f"Level: {tower.level}")
+                if hasattr(tower, 'projectile_damage'):
+                    tooltip_text.append(f"Current Damage: {tower.projectile_damage}")
+                if hasattr(tower, 'health'):
+                    tooltip_text.append(f"Current Health: {tower.health}/{tower.max_health}")
+                self.tooltip.set_content(tooltip_text)
+                self.tooltip.show(mouse_x + 15, mouse_y + 15)
+                return
                     
         # Check for enemy hover
         for enemy in self.enemies:
@@ -448,7 +294,7 @@ class GameplayManager:
             )
             if enemy_rect.collidepoint(mouse_x, mouse_y):
                 self.hovering_enemy = enemy.enemy_type
-                tooltip_text = get_enemy_tooltip_text(enemy.enemy_type).copy()
+                tooltip_text = get_enemy_tooltip_text(enemy.enemy_type)
                 tooltip_text.append(f"Current Health: {enemy.health}/{enemy.max_health}")
                 self.tooltip.set_content(tooltip_text)
                 self.tooltip.show(mouse_x + 15, mouse_y + 15)
@@ -490,16 +336,28 @@ class GameplayManager:
         pygame.draw.rect(surface, (80, 80, 80), lid_rect)
         
         # Draw "SELL" text
-        sell_font = get_font(FONT_SIZE_SMALL)
-        sell_text = sell_font.render("SELL", True, (255, 255, 255))
+        sell_text = render_text(self.sell_font, "SELL", (255, 255, 255))
         text_rect = sell_text.get_rect(center=(self.sell_bin_rect.centerx, self.sell_bin_rect.bottom - 10))
         surface.blit(sell_text, text_rect)
 
-    def draw_tower_effects(self, surface, tower):
-        """Draw shadow and glow effects for a tower"""
+    def glow_color_for(self, tower):
+        """Glow colour for the tower's category"""
+        # Very subtle glow colors - much more transparent now (alpha reduced to 12)
+        if isinstance(tower, ResourceTower):
+            return (255, 230, 180, 1)  # Very subtle golden glow
+        elif isinstance(tower, ProjectileTower):
+            return (180, 210, 255, 1)  # Very subtle blue glow
+        elif isinstance(tower, TankTower):
+            return (255, 190, 190, 1)  # Very subtle red glow
+        elif isinstance(tower, EffectTower):
+            return (190, 255, 190, 1)  # Very subtle green glow
+        return (235, 235, 235, 1)  # Very subtle white glow
+
+    def render_tower_glow(self, glow_color, grid_x, grid_y):
+        """Build the pixelated glow for one grid cell, returning (surface, screen position)"""
         # Calculate tower center position
-        tower_x = tower.x * CELL_WIDTH + SIDEBAR_WIDTH + CELL_WIDTH/2
-        tower_y = tower.y * CELL_HEIGHT + CELL_HEIGHT/2
+        tower_x = grid_x * CELL_WIDTH + SIDEBAR_WIDTH + CELL_WIDTH/2
+        tower_y = grid_y * CELL_HEIGHT + CELL_HEIGHT/2
 
         glow_size = int(CELL_WIDTH * 1.3)  # Slightly larger than the tower
         
@@ -507,24 +365,10 @@ class GameplayManager:
         small_size = 6  # Very small for even chunkier pixelation
         small_glow = pygame.Surface((small_size, small_size), pygame.SRCALPHA)
         
-        # Very subtle glow colors - much more transparent now (alpha reduced to 12)
-        if isinstance(tower, ResourceTower):
-            glow_color = (255, 230, 180, 1)  # Very subtle golden glow
-        elif isinstance(tower, ProjectileTower):
-            glow_color = (180, 210, 255, 1)  # Very subtle blue glow
-        elif isinstance(tower, TankTower):
-            glow_color = (255, 190, 190, 1)  # Very subtle red glow
-        elif isinstance(tower, EffectTower):
-            glow_color = (190, 255, 190, 1)  # Very subtle green glow
-        else:
-            glow_color = (235, 235, 235, 1)  # Very subtle white glow
-        
         # Use fixed noise pattern (based on tower position) to avoid wiggling
         # This makes the noise "attached" to the tower position instead of random each frame
-        noise_seed = hash(f"{tower.x}{tower.y}") % 1000  # Deterministic seed based on tower position
-        random.seed(noise_seed)
-        noise_map = [[random.uniform(0.7, 1.0) for _ in range(small_size)] for _ in range(small_size)]
-        random.seed()  # Reset the random seed
+        noise_rng = keyed_random('glow', grid_x, grid_y)  # Same pattern every frame and every run
+        noise_map = [[noise_rng.uniform(0.7, 1.0) for _ in range(small_size)] for _ in range(small_size)]
         
         # Draw a noisy, imperfect glow on the small surface
         for y in range(small_size):
@@ -554,85 +398,228 @@ class GameplayManager:
         
         # Add a very minimal fixed offset based on tower position (no randomness for stability)
         # This gives each tower a slightly unique look but doesn't change frame to frame
-        offset_x = ((tower.x * 3) % 3) - 1
-        offset_y = ((tower.y * 3) % 3) - 1
+        offset_x = ((grid_x * 3) % 3) - 1
+        offset_y = ((grid_y * 3) % 3) - 1
+        
+        return pixelated_glow, (int(tower_x - glow_size/2) + offset_x,
+                                int(tower_y - glow_size/2) + offset_y)
+
+    def draw_tower_effects(self, surface, tower):
+        """Draw shadow and glow effects for a tower, returning the area covered"""
+        # Drop glows for cells that are no longer occupied once the layout changes
+        if self.glow_cache_version != self.layout_version:
+            occupied = {(self.glow_color_for(t), t.x, t.y) for t in self.towers}
+            self.glow_cache = {key: glow for key, glow in self.glow_cache.items() if key in occupied}
+            self.glow_cache_version = self.layout_version
+
+        key = (self.glow_color_for(tower), tower.x, tower.y)
+        glow = self.glow_cache.get(key)
+        if glow is None:
+            glow = self.render_tower_glow(*key)
+            self.glow_cache[key] = glow
         
         # Blit the pixelated glow
-        surface.blit(pixelated_glow,
-                   (int(tower_x - glow_size/2) + offset_x,
-                    int(tower_y - glow_size/2) + offset_y),
-                   special_flags=pygame.BLEND_ADD)
+        return surface.blit(glow[0], glow[1], special_flags=pygame.BLEND_ADD)
 
     def draw(self, surface):
+        # Sediment only needs repainting when the sway moves a layer by a whole pixel
+        self.compositor.set_state('background', self.sediment_generator.parallax_offsets())
+        
+        # The world only moves when the simulation ticks or the player changes the board
+        self.compositor.set_state('world', self.world_state())
+        
+        # Placement and drag previews follow the mouse
+        self.compositor.set_state('effects', self.effects_state())
+        
+        # HUD text and hover state only change on input or when resources/waves tick over
+        self.pause_button.text = "Resume" if self.paused else "Pause"
+        self.compositor.set_state('hud', self.hud_state())
+        
+        self.compositor.compose(surface)
+
+    def draw_background_layer(self, surface, offsets):
+        """Static board at the given sway, one opaque blit of a frame pre-blended
+        the first time the sway reaches those offsets"""
+        frame = self.board_frames.get(offsets)
+        if frame is None:
+            frame = pygame.Surface(surface.get_size(), 0, surface)
+            self.draw_board(frame, offsets)
+            self.board_frames[offsets] = frame
+        surface.blit(frame, (0, 0))
+
+    def draw_board(self, surface, offsets):
+        """Background, swaying sediment, lane markings and grid"""
+        surface.fill(COLOR_BACKGROUND)
+        
         # Draw background with sediment first (sediment should be visible underneath everything)
         surface.blit(self.background, (SIDEBAR_WIDTH, 0))
         
-        # Create a new surface for this frame
-        frame_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        
         # Draw the sediment generator's animated elements
-        self.sediment_generator.draw(frame_surface)
+        self.sediment_generator.draw(surface, offsets)
         
         # Draw background grid
-        self.grid.draw(frame_surface)
+        self.grid.draw(surface)
+
+    def world_state(self):
+        """What the world layer shows: the board under it, the tick, the tower
+        layout, orbs collected between ticks and the combine selection"""
+        combine = self.combine_manager
+        selected = tuple((tower.x, tower.y) for tower in combine.combining_towers)
+        return (self.tick, self.layout_version, len(self.resource_orbs), combine.is_combining,
+                selected, combine.combine_preview, self.sediment_generator.parallax_offsets())
+
+    def draw_world_layer(self, surface, state):
+        """Towers, orbs, enemies and projectiles over a copy of the board.
+        Records the area each of them drew for mark_dirty."""
+        surface.blit(self.compositor.surface('background'), (0, 0))
+        regions = []
 
         # Draw towers
         for tower in self.towers:
-            self.draw_tower_effects(frame_surface, tower)
-            tower.draw(frame_surface)
+            regions.append(self.draw_tower_effects(surface, tower))
+            regions.append(tower.draw(surface))
 
         # Draw combine manager elements
-        self.combine_manager.draw_combine_preview(frame_surface)
-        self.combine_manager.draw_combine_instructions(frame_surface, self.pause_font)
+        self.combine_manager.draw_combine_preview(surface)
+        self.combine_manager.draw_combine_instructions(surface, self.pause_font)
         
-        # Draw resource orbs before enemies so they appear under them
-        for orb in self.resource_orbs:
-            orb.draw(frame_surface)
-
         # Draw enemies and projectiles
         for enemy in self.enemies:
-            enemy.draw(frame_surface)
+            regions.append(enemy.draw(surface))
         for projectile in self.projectiles:
-            projectile.draw(frame_surface)
+            regions.append(projectile.draw(surface))
         
         # Draw resource orbs on the topmost layer
-        for orb in self.resource_orbs:
-            orb.draw(frame_surface)
+        regions.extend(self.resource_orbs.draw(surface))
+        self.world_regions = [rect for rect in regions if rect]
+
+    def effects_state(self):
+        """What the effects layer shows: the placement preview and the dragged tower"""
+        preview = None
+        if self.placement_preview and self.shop.selected_tower:
+            preview = (self.placement_preview, self.placement_valid)
+        dragging = None
+        if self.dragging_tower:
+            mouse_pos = pygame.mouse.get_pos()
+            dragging = (self.dragging_tower.name,
+                        int((mouse_pos[0] - SIDEBAR_WIDTH) / CELL_WIDTH),
+                        int(mouse_pos[1] / CELL_HEIGHT))
+        return preview, dragging
+
+    def draw_effects_layer(self, surface, state):
+        """Placement and drag previews from effects_state(); returns the cells drawn"""
+        preview, dragging = state
+        regions = []
+        
+        # Draw tower placement preview
+        if preview:
+            TowerPreview.draw(surface, *preview)
+            regions.append(self.cell_rect(*preview[0]))
         
+        # Draw dragging tower
+        if dragging:
+            name, grid_x, grid_y = dragging
+            color = TOWER_COLORS.get(name, (100, 100, 100))
+            TowerPreview.draw(surface, (grid_x, grid_y), True, color)
+            regions.append(self.cell_rect(grid_x, grid_y))
+        return regions
+
+    def cell_rect(self, grid_x, grid_y):
+        """Screen rect of a grid cell"""
+        return pygame.Rect(grid_x * CELL_WIDTH + SIDEBAR_WIDTH, grid_y * CELL_HEIGHT, CELL_WIDTH, CELL_HEIGHT)
+
+    def resource_rect(self):
+        """Screen area covered by the resource readout"""
+        lines = [f"{resource}: {amount}" for resource, amount in self.resources.items()]
+        width = max((self.resource_display.font.size(line)[0] for line in lines), default=0)
+        return pygame.Rect(0, 0, self.resource_display.x + width,
+                           self.resource_display.y + self.resource_display.spacing * len(lines))
+
+    def wave_rect(self, wave_status):
+        """Screen area covered by the wave status text"""
+        return pygame.Rect((self.wave_info.x, self.wave_info.y), self.wave_info.font.size(wave_status))
+
+    def shop_state(self):
+        """Everything the shop column shows: slots, affordability, kill progress and hover"""
+        mouse_pos = pygame.mouse.get_pos()
+        return (tuple(slot['tower'] for slot in self.shop.slots), tuple(self.resources.values()),
+                self.shop.enemy_kills, self.shop.free_refresh_index, self.shop.refresh_cost,
+                mouse_pos if self.shop_rect.collidepoint(mouse_pos) else None)
+
+    def hud_state(self):
+        """Everything the HUD layer shows, so it is redrawn only when this changes"""
+        tooltip = None
+        if self.tooltip.visible:
+            tooltip = (tuple(self.tooltip.content), tuple(self.tooltip.rect))
+        pause_hover = tuple(button.hover for button in self.pause_screen.buttons) if self.paused else None
+        return (tuple(self.resources.items()), self.wave_manager.get_wave_status(), self.hovering_sell_bin,
+                self.pause_button.text, self.pause_button.hover, pause_hover, tooltip, self.shop_state())
+
+    def draw_hud_layer(self, surface, state):
+        """Sidebar readouts, buttons, tooltips and the shop; returns the areas drawn"""
         # Draw resources in sidebar
-        self.resource_display.draw(frame_surface, self.resources)
+        self.resource_display.draw(surface, self.resources)
 
         # Draw wave info
         wave_status = self.wave_manager.get_wave_status()
-        self.wave_info.draw(frame_surface, wave_status)
+        self.wave_info.draw(surface, wave_status)
 
         # Draw sell bin
-        self.draw_sell_bin(frame_surface)
+        self.draw_sell_bin(surface)
 
         # Draw pause button
-        self.pause_button.text = "Resume" if self.paused else "Pause"
-        self.pause_button.draw(frame_surface)
+        self.pause_button.draw(surface)
 
         # Draw pause overlay when paused
         if self.paused:
-            self.pause_screen.draw(frame_surface)
-
-        # Draw tower placement preview
-        if self.placement_preview and self.shop.selected_tower:
-            TowerPreview.draw(frame_surface, self.placement_preview, self.placement_valid)
-        
-        # Draw dragging tower
-        if self.dragging_tower:
-            mouse_pos = pygame.mouse.get_pos()
-            color = TOWER_COLORS.get(self.dragging_tower.name, (100, 100, 100))
-            TowerPreview.draw(frame_surface, 
-                            (int((mouse_pos[0] - SIDEBAR_WIDTH) / CELL_WIDTH),
-                             int(mouse_pos[1] / CELL_HEIGHT)),
-                            True, color)
+            self.pause_screen.draw(surface)
 
         # Draw remaining UI elements
-        self.tooltip.draw(frame_surface)
-        self.shop.draw(frame_surface, self.resources)
+        self.tooltip.draw(surface)
+        self.shop.draw(surface, self.resources)
         
-        # Blit the frame surface onto the main surface
-        surface.blit(frame_surface, (0, 0))
+        if self.paused:
+            return None  # The pause screen covers the whole window
+        regions = [self.resource_rect(), self.wave_rect(wave_status), self.sell_bin_rect,
+                   self.pause_button.rect, self.shop_rect]
+        for tooltip in (self.tooltip, self.shop.tooltip, self.shop.refresh_tooltip):
+            if tooltip.visible:
+                regions.append(tooltip.rect)
+        return regions
+
+    def mark_dirty(self, tracker):
+        """Report the screen regions the last draw changed to a DirtyRectTracker"""
+        # When the world was redrawn, every sprite's new area changed and so did the
+        # areas of the last redraw, where sprites that moved or went away were
+        world_changes = []
+        if self.world_regions is not None:
+            world_changes = self.marked_world_regions + self.world_regions
+            self.marked_world_regions = self.world_regions
+            self.world_regions = None
+
+        # Anything that repaints the board as a whole forces a full update
+        board = (self.sediment_generator.parallax_offsets(), self.layout_version, self.paused,
+                 self.combine_manager.is_combining, self.dragging_tower is not None,
+                 self.placement_preview if self.shop.selected_tower else None)
+        if tracker.changed('board', board) or self.paused or self.dragging_tower or self.combine_manager.is_combining:
+            tracker.mark_all()
+            return
+
+        for rect in world_changes:
+            tracker.mark(rect)
+
+        # HUD elements only when what they show has changed
+        tracker.mark_if_changed('resources', tuple(self.resources.items()), self.resource_rect())
+        wave_status = self.wave_manager.get_wave_status()
+        tracker.mark_if_changed('wave', wave_status, self.wave_rect(wave_status))
+        tracker.mark_if_changed('sell_bin', self.hovering_sell_bin, self.sell_bin_rect.inflate(2, 2))
+        tracker.mark_if_changed('pause_button', (self.pause_button.text, self.pause_button.hover),
+                                self.pause_button.rect.inflate(2, 2))
+
+        # Shop column: slot contents, affordability, kill progress and hover
+        tracker.mark_if_changed('shop', self.shop_state(), self.shop_rect)
+
+        # Tooltips follow the mouse, so cover them whenever they are up
+        for tooltip in (self.tooltip, self.shop.tooltip, self.shop.refresh_tooltip):
+            if tooltip.visible:
+                tracker.mark(tooltip.rect)
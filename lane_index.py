@@ -0,0 +1,75 @@
+import bisect
+from config import CELL_HEIGHT
+
+class LaneIndex:
+    """Solid towers bucketed by lane and sorted by column, for enemy collision queries.
+
+    Rebuilt only when the tower layout changes. Blocked/free results for the
+    pathing probes are cached until then as well, since a stuck enemy probes
+    the same spot every frame.
+    """
+    MAX_CACHED_PROBES = 4096
+
+    def __init__(self):
+        self.lanes = {}  # lane -> [(left edge, tower list order, tower)] sorted by left edge
+        self.lane_lefts = {}  # lane -> left edges only, for bisecting
+        self.max_width = 0
+        self.max_height = 0
+        self.version = None
+        self.probe_cache = {}  # (x, y, w, h) -> blocked
+
+    def sync(self, towers, version):
+        """Rebuild the index if the layout has changed since the last build"""
+        if version == self.version:
+            return
+        self.version = version
+        self.lanes = {}
+        self.max_width = 0
+        self.max_height = 0
+        self.probe_cache.clear()
+
+        for order, tower in enumerate(towers):
+            if not tower.has_collision:
+                continue
+            rect = tower.collision_rect
+            lane = rect.top // CELL_HEIGHT
+            self.lanes.setdefault(lane, []).append((rect.left, order, tower))
+            self.max_width = max(self.max_width, rect.width)
+            self.max_height = max(self.max_height, rect.height)
+
+        for entries in self.lanes.values():
+            entries.sort(key=lambda entry: (entry[0], entry[1]))
+        self.lane_lefts = {lane: [entry[0] for entry in entries] for lane, entries in self.lanes.items()}
+
+    def candidates(self, rect):
+        """Return (tower list order, tower) pairs whose collision box could touch rect"""
+        found = []
+        first_lane = (rect.top - self.max_height + 1) // CELL_HEIGHT
+        last_lane = (rect.bottom - 1) // CELL_HEIGHT
+        for lane in range(first_lane, last_lane + 1):
+            entries = self.lanes.get(lane)
+            if not entries:
+                continue
+            lefts = self.lane_lefts[lane]
+            start = bisect.bisect_right(lefts, rect.left - self.max_width)
+            end = bisect.bisect_left(lefts, rect.right)
+            for _, order, tower in entries[start:end]:
+                found.append((order, tower))
+        return found
+
+    def colliding_candidates(self, rect):
+        """Towers that could touch rect, in tower list order so results match a full scan"""
+        found = self.candidates(rect)
+        found.sort(key=lambda entry: entry[0])
+        return [tower for _, tower in found]
+
+    def is_blocked(self, rect):
+        """Whether any solid tower overlaps rect, cached until the layout changes"""
+        key = (rect.x, rect.y, rect.width, rect.height)
+        blocked = self.probe_cache.get(key)
+        if blocked is None:
+            blocked = any(tower.check_collision(rect) for _, tower in self.candidates(rect))
+            if len(self.probe_cache) >= self.MAX_CACHED_PROBES:
+                self.probe_cache.clear()
+            self.probe_cache[key] = blocked
+        return blocked
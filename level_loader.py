@@ -0,0 +1,45 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from sediment_generator import SedimentGenerator
+
+class LevelLoader:
+    """Prepares level backgrounds on a worker thread so the main loop never blocks on them.
+
+    Sediment generation is NumPy work plus plain surface operations, none of
+    which touch the display, so it is safe off the main thread. Finished
+    generators are kept per (biome, level) until a level claims one.
+    """
+    MAX_PREPARED = 4  # Hovered levels kept ready; oldest is dropped first
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='level-loader')
+        self.prepared = OrderedDict()  # (biome, level) -> Future of SedimentGenerator
+
+    def prefetch(self, biome, level):
+        """Start preparing a level if it is not already in progress"""
+        key = (biome, level)
+        if key in self.prepared:
+            self.prepared.move_to_end(key)
+            return
+        self.prepared[key] = self.executor.submit(SedimentGenerator, biome, level)
+        while len(self.prepared) > self.MAX_PREPARED:
+            _, future = self.prepared.popitem(last=False)
+            future.cancel()  # Only stops it if the worker has not started it yet
+
+    def ready(self, biome, level):
+        """Whether the level's background has finished preparing (starting it if needed)"""
+        self.prefetch(biome, level)
+        return self.prepared[(biome, level)].done()
+
+    def take(self, biome, level):
+        """Hand over the prepared generator; each one backs a single level instance.
+        If preparing it failed, the level is generated here instead."""
+        self.prefetch(biome, level)
+        try:
+            return self.prepared.pop((biome, level)).result()
+        except Exception as e:
+            print(f"Error preparing level in the background, loading it directly: {e}")
+            return SedimentGenerator(biome, level)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
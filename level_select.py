@@ -3,6 +3,7 @@ import json
 import os
 from config import *
 from ui import Button
+from text_cache import render_text
 
 class LevelSelectScreen:
     def __init__(self):
@@ -43,7 +44,7 @@ class LevelSelectScreen:
         self.level_buttons = {}
         self.initialize_level_buttons()
         
-        # Add a tracker for button hover states
+        # (biome, level) of the unlocked level button under the mouse
         self.hover_button = None
         
         # Debug flag to track clicks
@@ -166,8 +167,17 @@ class LevelSelectScreen:
                 tab['button'].hover = tab['button'].rect.collidepoint(mouse_pos)
             
             # Update level button hover states
+            hovered = None
             for button_data in self.level_buttons[self.current_biome]:
                 button_data['hover'] = button_data['rect'].collidepoint(mouse_pos) and button_data['unlocked']
+                if button_data['hover']:
+                    hovered = (self.current_biome, button_data['level'])
+            
+            # Let the game start preparing a level as soon as it is pointed at
+            if hovered != self.hover_button:
+                self.hover_button = hovered
+                if hovered:
+                    return {'action': 'prefetch_level', 'biome': hovered[0], 'level': hovered[1]}
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             mouse_pos = event.pos
@@ -204,7 +214,7 @@ class LevelSelectScreen:
         # Draw title
         biome_name = self.current_biome.name.capitalize()
         title_text = f"{biome_name} Levels"
-        title_surface = self.font_large.render(title_text, True, COLOR_TEXT)
+        title_surface = render_text(self.font_large, title_text, COLOR_TEXT)
         title_rect = title_surface.get_rect(center=(WINDOW_WIDTH // 2, 20))
         surface.blit(title_surface, title_rect)
         
@@ -252,7 +262,7 @@ class LevelSelectScreen:
             pygame.draw.rect(surface, (255, 255, 255), button_rect, width=2, border_radius=5)
             
             # Draw level number
-            level_text = self.font_medium.render(str(level_num), True, text_color)
+            level_text = render_text(self.font_medium, str(level_num), text_color)
             level_rect = level_text.get_rect(center=button_rect.center)
             surface.blit(level_text, level_rect)
             
@@ -287,5 +297,5 @@ class LevelSelectScreen:
         # Draw debug info if a click was recorded but did not trigger a level
         if self.debug_last_click:
             debug_text = f"Last click: {self.debug_last_click}"
-            debug_surface = self.font_small.render(debug_text, True, (255, 255, 255))
+            debug_surface = render_text(self.font_small, debug_text, (255, 255, 255))
             surface.blit(debug_surface, (10, WINDOW_HEIGHT - 20))
\ No newline at end of file
@@ -0,0 +1,40 @@
+import math
+import pygame
+from config import *
+from text_cache import render_text
+
+class LoadingScreen:
+    """Shown while a level is prepared in the background"""
+    def __init__(self):
+        self.title_font = get_font(FONT_SIZE_LARGE)
+        self.text_font = get_font(FONT_SIZE_MEDIUM)
+        self.biome = None
+        self.level = None
+        self.time = 0
+
+    def start(self, biome, level):
+        self.biome = biome
+        self.level = level
+        self.time = 0
+
+    def update(self, dt):
+        self.time += dt
+
+    def draw(self, surface):
+        surface.fill(COLOR_BACKGROUND)
+
+        title = render_text(self.title_font, f"{self.biome.name.capitalize()} - Level {self.level}", COLOR_TEXT)
+        surface.blit(title, title.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 40)))
+
+        # Cycle the dots so the screen visibly stays alive
+        dots = "." * (int(self.time * 3) % 4)
+        text = render_text(self.text_font, f"Loading{dots}", COLOR_TEXT)
+        surface.blit(text, text.get_rect(midleft=(WINDOW_WIDTH // 2 - 50, WINDOW_HEIGHT // 2 + 20)))
+
+        # Orbiting pixel spinner
+        for i in range(8):
+            angle = self.time * 4 + i * math.pi / 4
+            shade = 80 + 175 * i // 7
+            x = WINDOW_WIDTH // 2 + math.cos(angle) * 20
+            y = WINDOW_HEIGHT // 2 + 80 + math.sin(angle) * 20
+            pygame.draw.rect(surface, (shade, shade, shade), (int(x) - 3, int(y) - 3, 6, 6))
@@ -0,0 +1,107 @@
+import numpy as np
+
+# Perlin's reference permutation, the same table the noise package uses
+_PERM_BASE = [
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
+    140, 36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148,
+    247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32,
+    57, 177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175,
+    74, 165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122,
+    60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54,
+    65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169,
+    200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64,
+    52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212,
+    207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213,
+    119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9,
+    129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104,
+    218, 246, 97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241,
+    81, 51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157,
+    184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93,
+    222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+]
+PERM = np.array(_PERM_BASE * 2, dtype=np.int32)
+
+GRAD3 = np.array([
+    (1, 1, 0), (-1, 1, 0), (1, -1, 0), (-1, -1, 0),
+    (1, 0, 1), (-1, 0, 1), (1, 0, -1), (-1, 0, -1),
+    (0, 1, 1), (0, -1, 1), (0, 1, -1), (0, -1, -1),
+    (1, 0, -1), (-1, 0, -1), (0, -1, 1), (0, 1, 1)
+], dtype=np.float32)
+
+def _perm(index):
+    # The C table is read without bounds checks; with base > 1 an index can pass 511, so wrap it
+    return PERM[index & 511]
+
+def _grad3(hash_, x, y, z):
+    g = GRAD3[hash_ & 15]
+    return x * g[..., 0] + y * g[..., 1] + z * g[..., 2]
+
+def _lerp(t, a, b):
+    return a + t * (b - a)
+
+def _fade(t):
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+def _noise3(x, y, z, repeatx, repeaty, repeatz, base):
+    """One octave of improved Perlin noise over float32 arrays"""
+    i = np.floor(np.fmod(x, np.float32(repeatx))).astype(np.int32)
+    j = np.floor(np.fmod(y, np.float32(repeaty))).astype(np.int32)
+    k = np.floor(np.fmod(z, np.float32(repeatz))).astype(np.int32)
+    ii = np.fmod(i + 1, repeatx)
+    jj = np.fmod(j + 1, repeaty)
+    kk = np.fmod(k + 1, repeatz)
+    i = (i & 255) + base
+    j = (j & 255) + base
+    k = (k & 255) + base
+    ii = (ii & 255) + base
+    jj = (jj & 255) + base
+    kk = (kk & 255) + base
+
+    x = x - np.floor(x)
+    y = y - np.floor(y)
+    z = z - np.floor(z)
+    fx, fy, fz = _fade(x), _fade(y), _fade(z)
+
+    a = _perm(i)
+    aa = _perm(a + j)
+    ab = _perm(a + jj)
+    b = _perm(ii)
+    ba = _perm(b + j)
+    bb = _perm(b + jj)
+
+    one = np.float32(1)
+    return _lerp(fz, _lerp(fy, _lerp(fx, _grad3(_perm(aa + k), x, y, z),
+                                         _grad3(_perm(ba + k), x - one, y, z)),
+                               _lerp(fx, _grad3(_perm(ab + k), x, y - one, z),
+                                         _grad3(_perm(bb + k), x - one, y - one, z))),
+                     _lerp(fy, _lerp(fx, _grad3(_perm(aa + kk), x, y, z - one),
+                                         _grad3(_perm(ba + kk), x - one, y, z - one)),
+                               _lerp(fx, _grad3(_perm(ab + kk), x, y - one, z - one),
+                                         _grad3(_perm(bb + kk), x - one, y - one, z - one))))
+
+def pnoise3(x, y, z, octaves=1, persistence=0.5, lacunarity=2.0,
+            repeatx=1024, repeaty=1024, repeatz=1024, base=0):
+    """Vectorized noise.pnoise3: same arguments, arrays in, float64 array out.
+
+    Evaluated in float32 in the same order as the C extension. Values match
+    noise.pnoise3 bit for bit for base 0 or 1 at any coordinates, and on the
+    sediment grids (non-negative coordinates). For larger bases the C code
+    can index past its 512-entry permutation table, mostly for cells just
+    below a multiple of 256 such as small negative coordinates. That is
+    undefined, so those lookups wrap here and the values differ.
+    """
+    x, y, z = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64).astype(np.float32) for v in (x, y, z)))
+    if octaves == 1:
+        return _noise3(x, y, z, repeatx, repeaty, repeatz, base).astype(np.float64)
+
+    freq = np.float32(1)
+    amp = np.float32(1)
+    max_amp = np.float32(0)
+    total = np.zeros(x.shape, dtype=np.float32)
+    for _ in range(octaves):
+        total += _noise3(x * freq, y * freq, z * freq, int(repeatx * freq), int(repeaty * freq),
+                         int(repeatz * freq), base) * amp
+        max_amp += amp
+        freq *= np.float32(lacunarity)
+        amp *= np.float32(persistence)
+    return (total / max_amp).astype(np.float64)
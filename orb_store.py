@@ -0,0 +1,186 @@
+import time
+import numpy as np
+from config import RESOURCE_COLORS
+from auto_collect import get_collector
+from sprite_cache import draw_orb
+
+# Float physics shared by every orb
+ORB_GRAVITY = 200  # Stronger gravity
+ORB_BUOYANCY = 180  # Stronger upward force
+ORB_AIR_RESISTANCE = 0.97  # Slightly less resistance for smoother motion
+ORB_FADE_TIME = 2.0  # Seconds before expiry over which an orb fades out
+
+# Stable numeric id per resource type for the resource_id array
+ORB_RESOURCE_IDS = {resource: i for i, resource in enumerate(RESOURCE_COLORS)}
+
+# Per-orb values kept in structure-of-arrays form, with their dtypes
+ORB_FIELDS = {
+    'x': np.float64,
+    'y': np.float64,
+    'vx': np.float64,
+    'vy': np.float64,
+    'lifetime': np.float64,
+    'age': np.float64,
+    'alpha': np.int16,
+    'active': np.bool_,
+    'collected': np.bool_,
+    'time_offset': np.float64,
+    'glow_intensity': np.float64,
+    'pulse_speed': np.float64,
+    'float_amplitude': np.float64,
+    'float_speed': np.float64,
+    'resource_id': np.int8
+}
+
+class OrbStore:
+    """List-like pool of resource orbs backed by NumPy arrays.
+
+    Live orbs occupy slots 0..len-1 in spawn order, so every per-tick step is a
+    slice of the arrays rather than a masked scatter. Finished orbs are dropped
+    in one compaction pass instead of one list removal each.
+    """
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.arrays = {name: np.zeros(capacity, dtype=dtype) for name, dtype in ORB_FIELDS.items()}
+        self.order = []  # Orb views in spawn order; orb._slot is its index here
+
+    def __len__(self):
+        return len(self.order)
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __getitem__(self, index):
+        return self.order[index]
+
+    def __contains__(self, orb):
+        return orb._store is self
+
+    def _live(self):
+        """Views of the arrays over the occupied slots"""
+        count = len(self.order)
+        return {name: array[:count] for name, array in self.arrays.items()}
+
+    def _grow(self):
+        """Double capacity, keeping existing slots in place"""
+        new_capacity = self.capacity * 2
+        for name, array in self.arrays.items():
+            grown = np.zeros(new_capacity, dtype=array.dtype)
+            grown[:self.capacity] = array
+            self.arrays[name] = grown
+        self.capacity = new_capacity
+
+    def append(self, orb):
+        """Move a newly spawned orb's values into the next free slot"""
+        slot = len(self.order)
+        if slot == self.capacity:
+            self._grow()
+        for field, value in orb._detached.items():
+            self.arrays[field][slot] = value
+        orb._store = self
+        orb._slot = slot
+        orb._detached = None
+        self.order.append(orb)
+
+    def extend(self, orbs):
+        for orb in orbs:
+            self.append(orb)
+
+    def remove(self, orb):
+        """Detach a single orb, shifting the later ones down"""
+        keep = np.ones(len(self.order), dtype=np.bool_)
+        keep[orb._slot] = False
+        self._keep(keep)
+
+    def compact(self):
+        """Drop every expired or collected orb in one pass"""
+        if not self.order:
+            return
+        a = self._live()
+        keep = a['active'] & ~a['collected']
+        if not keep.all():
+            self._keep(keep)
+
+    def _keep(self, keep):
+        """Pack the kept slots to the front in order, detaching the rest with a snapshot of their values"""
+        for orb in (orb for orb, kept in zip(self.order, keep.tolist()) if not kept):
+            orb._detached = {field: array[orb._slot].item() for field, array in self.arrays.items()}
+            orb._store = None
+            orb._slot = None
+
+        count = len(self.order)
+        kept_count = int(keep.sum())
+        for array in self.arrays.values():
+            array[:kept_count] = array[:count][keep]
+        self.order = [orb for orb in self.order if orb._store is self]
+        for slot, orb in enumerate(self.order):
+            orb._slot = slot
+
+    def update(self, dt):
+        """Advance every orb by dt; returns a mask of the orbs still floating"""
+        if not self.order:
+            return np.zeros(0, dtype=np.bool_)
+        a = self._live()
+
+        # Cleanup compacts every tick, so whole slices are stepped without masking;
+        # orbs that stop floating here are never moved again before they are dropped
+        a['lifetime'] -= dt
+        a['age'] += dt
+        a['active'] &= a['lifetime'] > 0
+
+        # Apply buoyancy against gravity, then air resistance
+        a['vy'] += (ORB_GRAVITY - ORB_BUOYANCY) * dt
+        a['vx'] *= ORB_AIR_RESISTANCE
+        a['vy'] *= ORB_AIR_RESISTANCE
+        a['x'] += a['vx'] * dt
+        a['y'] += a['vy'] * dt
+
+        # Add smooth floating motion
+        a['y'] += np.sin(a['age'] * a['float_speed'] + a['time_offset']) * a['float_amplitude']
+
+        # Gradual fade out near end of lifetime
+        fading = a['lifetime'] < ORB_FADE_TIME
+        if fading.any():
+            a['alpha'][fading] = (255 * (a['lifetime'][fading] / ORB_FADE_TIME)).astype(np.int16)
+        return a['active'].copy()
+
+    def auto_collect(self, towers, floating):
+        """Orbs inside a matching collector tower's area, in spawn order; the first tower in order claims each"""
+        if not floating.any():
+            return []
+        a = self._live()
+        collector = get_collector()
+        # Rect.collidepoint truncates float points towards zero
+        x = np.trunc(a['x'])
+        y = np.trunc(a['y'])
+        remaining = floating.copy()
+        claimed = np.zeros(len(self.order), dtype=np.bool_)
+        for tower in towers:
+            if not remaining.any():
+                break
+            area = collector.collection_area(tower)
+            if area is None:
+                continue
+            collect_type, rect = area
+            inside = remaining & (x >= rect.left) & (x < rect.right) & (y >= rect.top) & (y < rect.bottom)
+            if collect_type != 'all':
+                inside &= a['resource_id'] == ORB_RESOURCE_IDS.get(collect_type, -1)
+            claimed |= inside
+            remaining &= ~inside
+        return [self.order[slot] for slot in np.flatnonzero(claimed)]
+
+    def draw(self, surface):
+        """Blit every active orb from the atlas, with the pulse computed for all of them at once.
+        Returns the areas drawn."""
+        a = self._live()
+        now = time.time()
+        base_alpha = (a['alpha'] * (0.8 + 0.2 * np.sin(now * a['pulse_speed'] + a['time_offset']))).astype(int)
+        sparkle_time = now * 3 + a['time_offset']
+
+        drawn = []
+        for orb, active, x, y, alpha, glow_intensity, sparkle in zip(
+                self.order, a['active'].tolist(), a['x'].tolist(), a['y'].tolist(), base_alpha.tolist(),
+                a['glow_intensity'].tolist(), sparkle_time.tolist()):
+            if active:
+                drawn.append(draw_orb(surface, orb.color, orb.radius, x, y, alpha, glow_intensity, sparkle))
+        return drawn
@@ -6,6 +6,9 @@ from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from config import GameState
 from base_types import BaseTower
 from energy_system import EnergySystem, ENERGY_COSTS, ENERGY_GEN_RATES, BIOME_POWER_MODIFIERS
+from rng import stable_hash, keyed_random
+from sprite_cache import get_burst_sprite, BURST_VARIANTS
+from dirty_rects import union_rects
 
 # Only import types for type checking to avoid circular imports
 if TYPE_CHECKING:
@@ -22,76 +25,16 @@ class Power:
     def on_damage_dealt(self, enemy, damage):
         pass
         
+    def on_damage_dealt_bulk(self, enemies, damages):
+        """Handle a batch of hits at once; damages is an array aligned with enemies"""
+        for enemy, damage in zip(enemies, damages.tolist()):
+            self.on_damage_dealt(enemy, damage)
+        
     def on_damaged(self, attacker, damage):
         pass
 
-class PowerEffect:
-    def __init__(self, x, y, color, duration=0.5, size=32, style='burst'):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.duration = duration
-        self.max_duration = duration
-        self.size = size
-        self.style = style  # 'burst', 'wave', 'spiral', 'rays'
-        self.alpha = 255
-        self.scale = 1.0
-        self.angle = 0
-        self.cell_size = 8  # Size of pixelation cells
-        self.effect_alpha = 60  # Base effect opacity
-        self.effect_pulse_speed = 30  # Speed of alpha pulsing
-        self.alpha_direction = 1  # Direction of alpha pulsing
-
-    def update(self, dt):
-        self.duration -= dt
-        progress = 1 - (self.duration / self.max_duration)
-        self.alpha = int(255 * (1 - progress))
-        self.scale = 1 + progress
-        self.angle += dt * 180  # Rotate 180 degrees per second
-        
-        # Pulse the effect alpha
-        self.effect_alpha += dt * self.effect_pulse_speed * self.alpha_direction
-        if self.effect_alpha > 60:  # Max alpha
-            self.alpha_direction = -1
-        elif self.effect_alpha < 10:  # Min alpha
-            self.alpha_direction = 1
-            
-    def draw(self, surface):
-        if self.duration <= 0:
-            return
-            
-        # Create pixelated effect surface
-        s = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        cells = self.size * 2 // self.cell_size
-        
-        for x in range(cells):
-            for y in range(cells):
-                # Calculate distance from center for circular effect
-                cx = (x * self.cell_size + self.cell_size/2) - self.size
-                cy = (y * self.cell_size + self.cell_size/2) - self.size
-                dist = (cx*cx + cy*cy) ** 0.5
-                
-                if dist <= self.size:
-                    # Calculate alpha based on distance and current effect alpha
-                    alpha = int(max(0, self.effect_alpha * (1 - dist/self.size)))
-                    
-                    # Add some randomization for texture
-                    if random.random() > 0.3:
-                        color = (*self.color, alpha)
-                        pygame.draw.rect(s, color,
-                                      (x * self.cell_size, y * self.cell_size,
-                                       self.cell_size, self.cell_size))
-                       
-        # Draw the effect with rotation and scaling
-        rotated = pygame.transform.rotate(s, self.angle)
-        scaled = pygame.transform.scale(rotated, 
-                                     (int(rotated.get_width() * self.scale),
-                                      int(rotated.get_height() * self.scale)))
-        
-        # Center the effect on its position
-        pos = (self.x - scaled.get_width()//2,
-               self.y - scaled.get_height()//2)
-        surface.blit(scaled, pos)
+# Largest noise transparency factor (noise tops out at 1.3); baked colonies are normalised by it
+COLONY_MAX_NOISE_FACTOR = 0.7 + 1.3 * 0.3
 
 class TowerPower(Power):
     def __init__(self, tower: 'BaseTower'):
@@ -110,8 +53,10 @@ class TowerPower(Power):
         self.effect_radius = CELL_WIDTH  # Default radius
         self.aura_alpha = 35  # Lower base alpha for less opacity
         self.alpha_direction = 1
-        self.grid_seed = hash(f"{tower.x}{tower.y}")  # Fixed seed for this tower's pattern
+        self.grid_seed = stable_hash(tower.x, tower.y)  # Fixed seed for this tower's pattern
         self.colony_noise = {}  # Store noise values for colony shape
+        self.colony_surface = None  # Baked colony pattern at full opacity
+        self.colony_key = None
         
         # Set power-specific effect colors
         if isinstance(self, (HydroPressure, OxygenBurst)):
@@ -131,25 +76,17 @@ class TowerPower(Power):
         """Get deterministic noise value for colony shape"""
         key = f"{x},{y}"
         if key not in self.colony_noise:
-            random.seed(self.grid_seed + hash(key))
+            rng = keyed_random(self.grid_seed, key)
             # Create more organic shapes by using multiple noise frequencies
-            base_noise = random.random()
-            detail_noise = random.random() * 0.3
+            base_noise = rng.random()
+            detail_noise = rng.random() * 0.3
             self.colony_noise[key] = base_noise + detail_noise
-            random.seed()  # Reset seed
         return self.colony_noise[key]
             
-    def draw_area_effect(self, surface, persistent=False):
-        """Draw a standardized area effect for powers"""
-        if not (self.active or persistent):
-            return
-            
-        # Calculate center position
-        center_x = self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH + CELL_WIDTH/2
-        center_y = self.tower.y * CELL_HEIGHT + CELL_HEIGHT/2
-        
-        # Create effect surface with alpha
-        s = pygame.Surface((int(self.effect_radius * 2.2), int(self.effect_radius * 2.2)), pygame.SRCALPHA)
+    def _bake_colony(self):
+        """Render the colony pattern once at full opacity; only its overall alpha changes per frame"""
+        size = int(self.effect_radius * 2.2)
+        s = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Create organic colony pattern
         cells = int(self.effect_radius * 2.2 // self.cell_size)
@@ -167,31 +104,46 @@ class TowerPower(Power):
                 # Modify the distance check with noise to create irregular edges
                 effective_radius = self.effect_radius * (0.8 + noise * 0.4)
                 
-                if base_dist <= effective_radius:
-                    # Use either pulse effect or persistent aura with distance falloff
-                    if persistent:
-                        base_alpha = self.aura_alpha
-                    else:
-                        base_alpha = self.effect_alpha
-                    
+                if base_dist <= effective_radius and noise > 0.3:  # Only draw some cells for more organic look
                     # Calculate alpha with distance falloff and noise
                     dist_factor = 1.0 - (base_dist / effective_radius)
                     noise_factor = 0.7 + (noise * 0.3)  # Noise affects transparency
-                    alpha = int(max(0, base_alpha * dist_factor * noise_factor))
+                    alpha = int(max(0, 255 * dist_factor * noise_factor / COLONY_MAX_NOISE_FACTOR))
                     
-                    if noise > 0.3:  # Only draw some cells for more organic look
-                        # Draw cell with slight random offset
-                        offset_x = int(noise * 2) - 1
-                        offset_y = int((noise * 7919) % 2) - 1  # Use prime for different pattern
-                        
-                        pygame.draw.rect(s, (*self.effect_color, alpha),
-                                       (x * self.cell_size + offset_x,
-                                        y * self.cell_size + offset_y,
-                                        self.cell_size - 1, self.cell_size - 1))
+                    # Draw cell with slight random offset
+                    offset_x = int(noise * 2) - 1
+                    offset_y = int((noise * 7919) % 2) - 1  # Use prime for different pattern
+                    
+                    pygame.draw.rect(s, (*self.effect_color, alpha),
+                                   (x * self.cell_size + offset_x,
+                                    y * self.cell_size + offset_y,
+                                    self.cell_size - 1, self.cell_size - 1))
+        return s
+            
+    def draw_area_effect(self, surface, persistent=False):
+        """Draw a standardized area effect for powers, returning the area it covers"""
+        if not (self.active or persistent):
+            return None
+            
+        # Use either pulse effect or persistent aura
+        base_alpha = self.aura_alpha if persistent else self.effect_alpha
+        if base_alpha <= 0:
+            return None
+            
+        # The pattern is fixed per tower, so rebake only if its shape inputs change
+        key = (self.effect_radius, self.effect_color, self.cell_size)
+        if self.colony_key != key:
+            self.colony_surface = self._bake_colony()
+            self.colony_key = key
+        self.colony_surface.set_alpha(min(255, int(base_alpha * COLONY_MAX_NOISE_FACTOR)))
+            
+        # Calculate center position
+        center_x = self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH + CELL_WIDTH/2
+        center_y = self.tower.y * CELL_HEIGHT + CELL_HEIGHT/2
         
         # Draw the effect centered on the tower
-        surface.blit(s, (center_x - self.effect_radius * 1.1, 
-                        center_y - self.effect_radius * 1.1))
+        return surface.blit(self.colony_surface, (center_x - self.effect_radius * 1.1, 
+                                                  center_y - self.effect_radius * 1.1))
 
     def update(self, dt, game_state):
         # Update energy generation
@@ -228,43 +180,26 @@ class TowerPower(Power):
         self.active = False
 
     def draw(self, surface):
-        """Draw power effect if active"""
+        """Draw power effect if active, returning the area it covers"""
         if self.effect_alpha > 0:
-            # Create pixelated effect surface
+            # Pre-rendered pixelated burst from the sprite cache
             effect_size = int(CELL_WIDTH * 2)
-            s = pygame.Surface((effect_size, effect_size), pygame.SRCALPHA)
+            s = get_burst_sprite(self.effect_color, effect_size // 2, self.effect_alpha, self.cell_size,
+                                 self.tower.cosmetic_rng.randrange(BURST_VARIANTS))
+            if s is None:
+                return None
             
             # Calculate center position
             center_x = self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH + CELL_WIDTH/2
             center_y = self.tower.y * CELL_HEIGHT + CELL_HEIGHT/2
             
-            cells_x = effect_size // self.cell_size
-            cells_y = effect_size // self.cell_size
-            
-            for x in range(cells_x):
-                for y in range(cells_y):
-                    # Calculate distance from center for circular effect
-                    cx = (x * self.cell_size + self.cell_size/2) - effect_size/2
-                    cy = (y * self.cell_size + self.cell_size/2) - effect_size/2
-                    dist = math.sqrt(cx*cx + cy*cy)
-                    
-                    if dist <= effect_size/2:
-                        # Calculate alpha based on distance and current effect alpha
-                        alpha = int(max(0, self.effect_alpha * (1 - dist/(effect_size/2))))
-                        color = (*self.effect_color, alpha)
-                        
-                        # Add some randomization for pixelated effect
-                        if random.random() > 0.3:
-                            pygame.draw.rect(s, color,
-                                          (x * self.cell_size, y * self.cell_size,
-                                           self.cell_size, self.cell_size))
-            
             # Draw the effect centered on the tower
-            surface.blit(s, (center_x - effect_size/2, center_y - effect_size/2))
+            return surface.blit(s, (center_x - effect_size/2, center_y - effect_size/2))
+        return None
     
     def draw_energy_bar(self, surface, x, y):
         """Draw the energy bar for this tower power"""
-        self.energy.draw(surface, x, y)
+        return self.energy.draw(surface, x, y)
 
 # Resource Tower Powers
 class HydroPressure(TowerPower):
@@ -274,6 +209,7 @@ class HydroPressure(TowerPower):
         self.radius = 2 * CELL_WIDTH
         self.boost_amount = 0.3 * tower.stars  # Reduced to 30/60/90% boost
         self.active_duration = 4.0  # Shorter duration
+        self.boosted_towers = []  # Towers given this activation's boost, undone on deactivate
         
     def update(self, dt, game_state):
         energy_ready = super().update(dt, game_state)
@@ -282,16 +218,26 @@ class HydroPressure(TowerPower):
         if energy_ready and not self.active:
             if self.activate():
                 self.active_duration = 4.0
-            
-        if self.active:
-            for other_tower in game_state.towers:
-                if other_tower != self.tower and hasattr(other_tower, 'resource_amounts'):
-                    dx = (other_tower.x - self.tower.x) * CELL_WIDTH
-                    dy = (other_tower.y - self.tower.y) * CELL_HEIGHT
-                    if (dx*dx + dy*dy) <= self.radius*self.radius:
-                        # Apply temporary boost that doesn't compound
-                        for resource in other_tower.resource_amounts:
-                            other_tower.resource_amounts[resource] *= (1 + self.boost_amount)
+                self.apply_boost(game_state.towers)
+                
+    def apply_boost(self, towers):
+        """Boost towers in range once for this activation, so the boost never compounds"""
+        for other_tower in towers:
+            if other_tower != self.tower and hasattr(other_tower, 'resource_amounts'):
+                dx = (other_tower.x - self.tower.x) * CELL_WIDTH
+                dy = (other_tower.y - self.tower.y) * CELL_HEIGHT
+                if (dx*dx + dy*dy) <= self.radius*self.radius:
+                    for resource in other_tower.resource_amounts:
+                        other_tower.resource_amounts[resource] *= (1 + self.boost_amount)
+                    self.boosted_towers.append(other_tower)
+                    
+    def deactivate(self):
+        """Take back the temporary boost"""
+        super().deactivate()
+        for other_tower in self.boosted_towers:
+            for resource in other_tower.resource_amounts:
+                other_tower.resource_amounts[resource] /= (1 + self.boost_amount)
+        self.boosted_towers = []
 
 class MethaneEruption(TowerPower):
     """BubblePlume: Periodically releases methane explosions"""
@@ -309,11 +255,10 @@ class MethaneEruption(TowerPower):
             if self.activate():
                 # Create explosion effect
                 self.effect_alpha = 60  # Bright flash
-                for enemy in game_state.enemies:
-                    dx = (enemy.x - (self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH))
-                    dy = (enemy.y - (self.tower.y * CELL_HEIGHT))
-                    if (dx*dx + dy*dy) <= self.radius*self.radius:
-                        enemy.take_damage(self.damage)
+                origin_x = self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH
+                origin_y = self.tower.y * CELL_HEIGHT
+                for enemy in game_state.enemy_grid.query_radius(origin_x, origin_y, self.radius):
+                    enemy.take_damage(self.damage)
 
 class BrineSpray(TowerPower):
     """BrinePool: Sprays corrosive brine that slows enemies"""
@@ -328,12 +273,11 @@ class BrineSpray(TowerPower):
         
         if energy_ready:
             if self.activate():
-                for enemy in game_state.enemies:
-                    dx = (enemy.x - (self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH))
-                    dy = (enemy.y - (self.tower.y * CELL_HEIGHT))
-                    if (dx*dx + dy*dy) <= self.radius*self.radius:
-                        enemy.speed_multiplier = max(0.1, 1 - self.slow_factor)
-                        enemy.slow_duration = self.slow_duration
+                origin_x = self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH
+                origin_y = self.tower.y * CELL_HEIGHT
+                for enemy in game_state.enemy_grid.query_radius(origin_x, origin_y, self.radius):
+                    enemy.speed_multiplier = max(0.1, 1 - self.slow_factor)
+                    enemy.slow_duration = self.slow_duration
 
 class LipidSiphon(TowerPower):
     """OsedaxWorm: Drains resources from enemies to boost production"""
@@ -347,13 +291,12 @@ class LipidSiphon(TowerPower):
         
         if energy_ready:
             if self.activate():
-                for enemy in game_state.enemies:
-                    dx = (enemy.x - (self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH))
-                    dy = (enemy.y - (self.tower.y * CELL_HEIGHT))
-                    if (dx*dx + dy*dy) <= self.radius*self.radius:
-                        enemy.take_damage(self.drain_amount)
-                        for resource in self.tower.resource_amounts:
-                            self.tower.resource_amounts[resource] += 1
+                origin_x = self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH
+                origin_y = self.tower.y * CELL_HEIGHT
+                for enemy in game_state.enemy_grid.query_radius(origin_x, origin_y, self.radius):
+                    enemy.take_damage(self.drain_amount)
+                    for resource in self.tower.resource_amounts:
+                        self.tower.resource_amounts[resource] += 1
 
 # Projectile Tower Powers
 class VenomShot(TowerPower):
@@ -366,7 +309,7 @@ class VenomShot(TowerPower):
         
     def on_hit(self, target):
         # For passive powers that trigger on hit, try to use energy
-        if self.energy.use_energy() and random.random() < self.poison_chance:
+        if self.energy.use_energy() and self.tower.rng.random() < self.poison_chance:
             target.poisoned = True
             target.poison_damage = self.poison_damage
             target.poison_duration = self.poison_duration
@@ -383,12 +326,11 @@ class SonicPulse(TowerPower):
         
         if energy_ready:
             if self.activate():
-                for enemy in game_state.enemies:
-                    dx = (enemy.x - (self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH))
-                    dy = (enemy.y - (self.tower.y * CELL_HEIGHT))
-                    if (dx*dx + dy*dy) <= self.radius*self.radius:
-                        enemy.is_stunned = True
-                        enemy.stun_timer = self.stun_duration
+                origin_x = self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH
+                origin_y = self.tower.y * CELL_HEIGHT
+                for enemy in game_state.enemy_grid.query_radius(origin_x, origin_y, self.radius):
+                    enemy.is_stunned = True
+                    enemy.stun_timer = self.stun_duration
 
 class ElectricShock(TowerPower):
     """Hagfish: Chain lightning between enemies"""
@@ -410,7 +352,8 @@ class ElectricShock(TowerPower):
                 next_target = None
                 min_dist = self.chain_range
                 
-                for enemy in self.tower.game_state.enemies:
+                enemy_grid = self.tower.game_state.enemy_grid
+                for enemy in enemy_grid.query_radius(current_target.x, current_target.y, self.chain_range):
                     if enemy not in hit_enemies:
                         dx = enemy.x - current_target.x
                         dy = enemy.y - current_target.y
@@ -441,12 +384,11 @@ class InkCloud(TowerPower):
         if energy_ready:
             if self.activate():
                 # Create ink cloud effect
-                for enemy in game_state.enemies:
-                    dx = (enemy.x - (self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH))
-                    dy = (enemy.y - (self.tower.y * CELL_HEIGHT))
-                    if (dx*dx + dy*dy) <= self.cloud_radius*self.cloud_radius:
-                        enemy.speed_multiplier *= 0.5
-                        enemy.take_damage(self.damage)
+                origin_x = self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH
+                origin_y = self.tower.y * CELL_HEIGHT
+                for enemy in game_state.enemy_grid.query_radius(origin_x, origin_y, self.cloud_radius):
+                    enemy.speed_multiplier *= 0.5
+                    enemy.take_damage(self.damage)
                 self.active_duration = self.cloud_duration
 
 # Tank Tower Powers
@@ -538,23 +480,18 @@ class ChainReaction(TowerPower):
             chained = [enemy]  # Track who we've already hit
             current_damage = self.chain_damage
             
-            for potential in self.tower.game_state.enemies:
+            enemy_grid = self.tower.game_state.enemy_grid
+            for potential in enemy_grid.query_radius(center_x, center_y, self.effect_radius):
                 if potential not in chained:
-                    dx = potential.x - center_x
-                    dy = potential.y - center_y
-                    dist = (dx*dx + dy*dy) ** 0.5
-                    
-                    if dist <= self.effect_radius:
-                        potential.take_damage(current_damage)
-                        chained.append(potential)
-                        current_damage *= 0.7  # Reduce chain damage
+                    potential.take_damage(current_damage)
+                    chained.append(potential)
+                    current_damage *= 0.7  # Reduce chain damage
                         
             # Visual feedback
             self.effect_alpha = 40
     
     def draw(self, surface):
-        self.draw_area_effect(surface, persistent=True)
-        super().draw(surface)
+        return union_rects(self.draw_area_effect(surface, persistent=True), super().draw(surface))
 
 class FilterFeeding(TowerPower):
     """VesicomyidaeClams: Converts damage dealt to resources"""
@@ -569,7 +506,14 @@ class FilterFeeding(TowerPower):
     def on_damage_dealt(self, enemy, damage):
         # Store damage for conversion
         self.stored_damage += damage * self.conversion_rate
+        self._convert_stored_damage()
+        
+    def on_damage_dealt_bulk(self, enemies, damages):
+        # Conversion only depends on the total, so take the whole batch at once
+        self.stored_damage += damages.sum().item() * self.conversion_rate
+        self._convert_stored_damage()
         
+    def _convert_stored_damage(self):
         # Convert stored damage to resources when threshold is reached
         while self.stored_damage >= self.conversion_threshold:
             self.stored_damage -= self.conversion_threshold
@@ -580,8 +524,7 @@ class FilterFeeding(TowerPower):
                 self.effect_alpha = 40
     
     def draw(self, surface):
-        self.draw_area_effect(surface, persistent=True)
-        super().draw(surface)
+        return union_rects(self.draw_area_effect(surface, persistent=True), super().draw(surface))
 
 class MusclePulse(TowerPower):
     """MuscleBed: Pulses that push enemies back"""
@@ -619,8 +562,7 @@ class MusclePulse(TowerPower):
             self.effect_alpha = 40
     
     def draw(self, surface):
-        self.draw_area_effect(surface, persistent=True)
-        super().draw(surface)
+        return union_rects(self.draw_area_effect(surface, persistent=True), super().draw(surface))
 
 class BacterialBloom(TowerPower):
     """Power for Beggiatoa: Creates a toxic area that damages enemies over time"""
@@ -644,8 +586,7 @@ class BacterialBloom(TowerPower):
             self.effect_alpha = 40
     
     def draw(self, surface):
-        self.draw_area_effect(surface, persistent=True)
-        super().draw(surface)
+        return union_rects(self.draw_area_effect(surface, persistent=True), super().draw(surface))
 
 # Rare Tower Powers
 class TentacleSweep(TowerPower):
@@ -664,14 +605,12 @@ class TentacleSweep(TowerPower):
                 center_x = self.tower.x * CELL_WIDTH + SIDEBAR_WIDTH
                 center_y = self.tower.y * CELL_HEIGHT
                 
-                for enemy in game_state.enemies:
+                for enemy in game_state.enemy_grid.query_radius(center_x, center_y, self.range):
                     dx = enemy.x - center_x
                     dy = enemy.y - center_y
-                    dist = (dx*dx + dy*dy) ** 0.5
-                    if dist <= self.range:
-                        angle = math.degrees(math.atan2(dy, dx))
-                        if abs(angle) <= self.sweep_angle/2:
-                            enemy.take_damage(self.sweep_damage)
+                    angle = math.degrees(math.atan2(dy, dx))
+                    if abs(angle) <= self.sweep_angle/2:
+                        enemy.take_damage(self.sweep_damage)
 
 class DeepseaKing(TowerPower):
     """ColossalSquid: Dominates nearby towers"""
@@ -809,5 +748,4 @@ class BacterialBloom(TowerPower):
             self.effect_alpha = 40
     
     def draw(self, surface):
-        self.draw_area_effect(surface, persistent=True)
-        super().draw(surface)
+        return union_rects(self.draw_area_effect(surface, persistent=True), super().draw(surface))
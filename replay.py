@@ -0,0 +1,66 @@
+import json
+from collections import deque
+from config import Biome
+
+# Bump when the command set or file layout changes
+REPLAY_VERSION = 1
+
+# Recorded command name -> Simulation method that performs it
+COMMANDS = {
+    'buy': 'buy_tower',
+    'drag': 'drag_tower',
+    'sell': 'sell_tower',
+    'combine': 'combine_towers',
+    'refresh': 'refresh_shop',
+    'orb': 'collect_orb'
+}
+
+class InputRecorder:
+    """Captures player commands with the tick they were issued on"""
+    def __init__(self, biome, level, seed):
+        self.biome = biome
+        self.level = level
+        self.seed = seed
+        self.commands = []  # [tick, command, *args]
+
+    def record(self, tick, command, *args):
+        """Store one successful command"""
+        self.commands.append([tick, command, *args])
+
+    def to_dict(self):
+        return {
+            'version': REPLAY_VERSION,
+            'biome': self.biome.name,
+            'level': self.level,
+            'seed': self.seed,
+            'commands': self.commands
+        }
+
+    def save(self, path):
+        """Write the recording as compact JSON"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+class ReplayPlayer:
+    """Feeds recorded commands back into a Simulation at the ticks they happened"""
+    def __init__(self, data):
+        if data.get('version') != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        self.biome = Biome[data['biome']]
+        self.level = data['level']
+        self.seed = data['seed']
+        self.pending = deque(data['commands'])
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+
+    def apply(self, sim):
+        """Run every command due at or before the simulation's current tick"""
+        while self.pending and self.pending[0][0] <= sim.tick:
+            _, command, *args = self.pending.popleft()
+            getattr(sim, COMMANDS[command])(*args)
+
+    def finished(self):
+        return not self.pending
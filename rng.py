@@ -0,0 +1,24 @@
+import random
+import zlib
+
+def stable_hash(*parts):
+    """Hash of the given values that is identical in every process, unlike hash() on strings"""
+    return zlib.crc32(repr(parts).encode('utf-8'))
+
+def keyed_random(*key):
+    """Generator fixed by key, for patterns that must look the same every frame and every run"""
+    return random.Random(stable_hash(*key))
+
+class GameRNG:
+    """Random number streams for one game.
+
+    sim drives gameplay (spawn lanes, shop rolls, pathing, orb launches) and is
+    all a seeded run needs to replay exactly. cosmetic is for visual-only
+    variation, so drawing more or fewer frames never shifts the simulation.
+    """
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.seed = seed
+        self.sim = random.Random(stable_hash('sim', seed))
+        self.cosmetic = random.Random(stable_hash('cosmetic', seed))
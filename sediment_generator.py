@@ -1,11 +1,12 @@
 import pygame
 import numpy as np
-import noise
 import math
-import random
 import colorsys
 from config import *
 from enum import Enum, auto
+from rng import keyed_random
+from noise_field import pnoise3
+import background_cache
 
 class SedimentType(Enum):
     VOLCANIC_SAND = auto()    # Black smoker deposits, rich in sulfides
@@ -19,38 +20,17 @@ class ForamType(Enum):
     PLANKTIC = auto()         # Surface-dwelling species
     BENTHIC = auto()          # Bottom-dwelling species
 
+# Bump whenever a change alters the generated layers, so stale cached backgrounds are ignored
+GENERATOR_VERSION = 2
+
 class SedimentGenerator:
-    def __init__(self, biome, level):
-        # Foram patterns for different species (4x4 pixel patterns)
-        self.foram_patterns = {
-            ForamType.GLOBIGERINA: [
-                [0,1,1,0],
-                [1,1,1,1],
-                [1,1,1,1],
-                [0,1,1,0]
-            ],
-            ForamType.RADIOLARIA: [
-                [0,1,1,0],
-                [1,0,0,1],
-                [1,0,0,1],
-                [0,1,1,0]
-            ],
-            ForamType.PLANKTIC: [
-                [0,1,1,0],
-                [1,1,1,1],
-                [1,0,0,1],
-                [0,1,1,0]
-            ],
-            ForamType.BENTHIC: [
-                [1,1,0,1],
-                [1,0,0,1],
-                [1,0,0,1],
-                [1,1,1,1]
-            ]
-        }
-        
+    def __init__(self, biome, level, use_cache=True):
         self.biome = biome
         self.level = level
+        self.rng = keyed_random('sediment', biome.name, level)  # Same seabed for a level on every run
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))  # Bulk per-chunk variation
+        self.base_sediment = None  # Noise map shared by every layer, built on first use
+        self.use_cache = use_cache  # Load/store the parallax layers in background_cache
         self.width = WINDOW_WIDTH - SIDEBAR_WIDTH
         self.height = WINDOW_HEIGHT
         
@@ -66,7 +46,6 @@ class SedimentGenerator:
         self.grid_height = self.height // self.chunk_size
         
         # Enhanced 3D effect settings
-        self.perspective_strength = 0.4  # Increased for more pronounced effect
         self.view_angle = 35  # Slightly increased angle for better depth
         self.parallax_layers = 3
         self.sway_time = 0
@@ -129,54 +108,95 @@ class SedimentGenerator:
             ]
         }
         
-        # Noise layer properties
-        self.layer_scales = [4.0, 8.0, 16.0]
-        self.layer_weights = [0.5, 0.3, 0.2]
+        # Foram patterns for different species (4x4 pixel patterns)
+        self.foram_patterns = {
+            ForamType.GLOBIGERINA: [
+                [0,1,1,0],
+                [1,1,1,1],
+                [1,1,1,1],
+                [0,1,1,0]
+            ],
+            ForamType.RADIOLARIA: [
+                [0,1,1,0],
+                [1,0,0,1],
+                [1,0,0,1],
+                [0,1,1,0]
+            ],
+            ForamType.PLANKTIC: [
+                [0,1,1,0],
+                [1,1,1,1],
+                [1,0,0,1],
+                [0,1,1,0]
+            ],
+            ForamType.BENTHIC: [
+                [1,1,0,1],
+                [1,0,0,1],
+                [1,0,0,1],
+                [1,1,1,1]
+            ]
+        }
         
         # Initialize surfaces for parallax layers
         self.parallax_surfaces = self.generate_parallax_layers()
+        self.flat_layers = None  # Opaque versions of the parallax layers, built on first draw
+        self.lane_bands = None  # [(lane marking strip, position)], built on first use
         
     def generate_parallax_layers(self):
-        """Generate multiple sediment layers for parallax effect"""
-        layers = []
-        for i in range(self.parallax_layers):
-            layer = self.generate_sediment_layer(depth_offset=i/self.parallax_layers)
-            layers.append(layer)
-        return layers
-        
-    def generate_sediment_layer(self, depth_offset=0):
-        """Generate a single sediment layer with perspective"""
-        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        """Generate multiple sediment layers for parallax effect, reusing the on-disk cache when allowed"""
+        size = (self.width, self.height)
+        chunks = background_cache.load_layers(self.biome, self.level, size, GENERATOR_VERSION) if self.use_cache else None
+        expected = (self.parallax_layers, self.grid_height, self.grid_width, 3)
+        self.loaded_from_cache = chunks is not None and chunks.shape == expected
+        if not self.loaded_from_cache:
+            chunks = np.stack([self.generate_layer_chunks(depth_offset=i/self.parallax_layers)
+                               for i in range(self.parallax_layers)])
+            if self.use_cache:
+                background_cache.save_layers(self.biome, self.level, size, GENERATOR_VERSION, chunks)
+        self.layer_chunks = chunks
+        
+        return [self.chunks_to_surface(layer, self.layer_alpha(i/self.parallax_layers))
+                for i, layer in enumerate(chunks)]
+        
+    def generate_layer_chunks(self, depth_offset=0):
+        """Colour of every chunk of one sediment layer, as a (grid_height, grid_width, 3) uint8 array"""
         noise_map = self.generate_base_sediment()
         
-        for grid_y in range(self.grid_height):
-            depth = (grid_y / self.grid_height + depth_offset) % 1.0
-            
-            for grid_x in range(self.grid_width):
-                noise_val = noise_map[grid_y][grid_x]
-                color_idx = min(len(self.palettes[self.biome])-1,
-                              int((noise_val + depth) / 2 * len(self.palettes[self.biome])))
-                color = self.palettes[self.biome][color_idx]
-                
-                # Add variation
-                variation = random.randint(-10, 10)
-                color = tuple(max(0, min(255, c + variation)) for c in color)
-                
-                # Apply depth-based alpha
-                alpha = int(255 * (1 - depth_offset * 0.5))
-                color = (*color, alpha)
-                
-                chunk_rect = pygame.Rect(
-                    grid_x * self.chunk_size,
-                    grid_y * self.chunk_size,
-                    self.chunk_size,
-                    self.chunk_size
-                )
-                pygame.draw.rect(surface, color, chunk_rect)
+        # Depth wraps per layer so each one shifts the palette bands
+        depth = ((np.arange(self.grid_height) / self.grid_height + depth_offset) % 1.0)[:, None]
+        colors = self.palette_colors(noise_map, depth)
+        
+        # Add variation
+        return np.clip(colors + self.chunk_variation(), 0, 255).astype(np.uint8)
+
+    def layer_alpha(self, depth_offset):
+        """Apply depth-based alpha: deeper layers are more see-through"""
+        return int(255 * (1 - depth_offset * 0.5))
+
+    def palette_colors(self, noise_map, depth):
+        """Look up the biome palette colour of every chunk from its noise value and depth"""
+        palette = np.array(self.palettes[self.biome], dtype=np.int32)
+        color_idx = np.minimum(len(palette) - 1, ((noise_map + depth) / 2 * len(palette)).astype(np.int32))
+        return palette[color_idx]
+
+    def chunk_variation(self):
+        """Slight random brightness shift per chunk, -10..10"""
+        return self.np_rng.integers(-10, 11, size=(self.grid_height, self.grid_width, 1))
+
+    def chunks_to_surface(self, colors, alpha):
+        """Turn a (grid_height, grid_width, 3) colour grid into chunky pixels on a new surface"""
+        # One pixel per chunk, then a nearest-neighbour scale makes the chunks
+        chunks = pygame.Surface((self.grid_width, self.grid_height), pygame.SRCALPHA)
+        rgb = pygame.surfarray.pixels3d(chunks)
+        rgb[:] = colors.transpose(1, 0, 2)
+        del rgb
+        chunks.fill((0, 0, 0, alpha), special_flags=pygame.BLEND_RGBA_MAX)
         
+        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        surface.blit(pygame.transform.scale(chunks, (self.grid_width * self.chunk_size,
+                                                     self.grid_height * self.chunk_size)), (0, 0))
         return surface
 
-    def generate_lane_markings(self, surface):
+    def generate_lane_markings(self):
         """Generate subtle lane markings for enemy paths"""
         path_color = self.path_colors[self.biome]['path']
         glow_color = self.path_colors[self.biome]['glow']
@@ -221,124 +241,6 @@ class SedimentGenerator:
         
         return lane_surface
 
-    def generate_layer(self, scale, octaves):
-        """Generate a single noise layer with perspective distortion"""
-        noise_map = np.zeros((self.grid_height, self.grid_width))
-        
-        for y in range(self.grid_height):
-            # Calculate depth factor (0 near, 1 far)
-            depth = y / self.grid_height
-            
-            # Apply perspective distortion
-            perspective_y = y + (depth * self.perspective_strength * self.grid_height)
-            
-            for x in range(self.grid_width):
-                # Adjust x based on perspective
-                perspective_x = x + (depth * math.sin(math.radians(self.view_angle)) * self.grid_width * 0.2)
-                
-                noise_map[y][x] = noise.pnoise3(
-                    perspective_x/scale, 
-                    perspective_y/scale,
-                    self.level/10.0,
-                    octaves=octaves,
-                    persistence=0.5,
-                    lacunarity=2.0,
-                    base=self.level + int(scale)
-                )
-        return noise_map
-        
-    def generate_base_sediment(self):
-        """Generate multi-layered chunky sediment"""
-        combined_map = np.zeros((self.grid_height, self.grid_width))
-        
-        octaves = 4  # Controls the level of detail
-        persistence = 0.5  # Controls how much each octave contributes
-        lacunarity = 2.0  # Controls how frequency increases each octave
-        
-        for i in range(octaves):
-            frequency = lacunarity ** i
-            amplitude = persistence ** i
-            
-            for y in range(self.grid_height):
-                for x in range(self.grid_width):
-                    # Generate coherent noise
-                    value = noise.pnoise3(
-                        x * frequency / self.grid_width,
-                        y * frequency / self.grid_height,
-                        self.level / 10.0,  # Use level as z-coordinate for variation
-                        octaves=1,
-                        persistence=0.5,
-                        lacunarity=2.0,
-                        base=self.level + i  # Different base for each octave
-                    )
-                    combined_map[y][x] += value * amplitude
-                    
-        # Normalize to 0-1 range
-        combined_map = (combined_map - combined_map.min()) / (combined_map.max() - combined_map.min())
-        return combined_map
-        
-    def generate_sediment_surface(self):
-        """Generate complete sediment surface with chunky pixels and depth effect"""
-        base_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        noise_map = self.generate_base_sediment()
-        
-        # Get color palette for current biome
-        palette = self.palettes[self.biome]
-        
-        # Create chunky pixel array
-        for grid_y in range(self.grid_height):
-            # Calculate depth factor for shading (0 = near, 1 = far)
-            depth = grid_y / self.grid_height
-            
-            for grid_x in range(self.grid_width):
-                noise_val = noise_map[grid_y][grid_x]
-                
-                # Add biome-specific patterns
-                if self.biome == Biome.HYDROTHERMAL:
-                    if noise_val > 0.8:
-                        noise_val = 0.95
-                elif self.biome == Biome.COLDSEEP:
-                    if noise_val > 0.7 and random.random() < 0.1:
-                        noise_val = 0.9
-                elif self.biome == Biome.BRINE_POOL:
-                    if noise_val > 0.6:
-                        noise_val = min(1.0, noise_val * 1.3)
-                elif self.biome == Biome.WHALEFALL:
-                    if noise_val < 0.3:
-                        noise_val *= 0.7
-                
-                # Apply depth-based color selection
-                color_idx = min(len(palette)-1, int((noise_val + depth) / 2 * len(palette)))
-                color = palette[color_idx]
-                
-                # Add slight random variation to chunk
-                variation = random.randint(-10, 10)
-                color = tuple(max(0, min(255, c + variation)) for c in color)
-                
-                # Draw chunky pixel
-                chunk_rect = pygame.Rect(
-                    grid_x * self.chunk_size,
-                    grid_y * self.chunk_size,
-                    self.chunk_size,
-                    self.chunk_size
-                )
-                pygame.draw.rect(base_surface, color, chunk_rect)
-                
-                # Add simple shading for 3D effect
-                if noise_val > 0.5:
-                    highlight = pygame.Surface((self.chunk_size, self.chunk_size), pygame.SRCALPHA)
-                    highlight.fill((255, 255, 255, 30))  # Subtle white highlight
-                    base_surface.blit(highlight, chunk_rect)
-                elif noise_val < 0.3:
-                    shadow = pygame.Surface((self.chunk_size, self.chunk_size), pygame.SRCALPHA)
-                    shadow.fill((0, 0, 0, 30))  # Subtle shadow
-                    base_surface.blit(shadow, chunk_rect)
-        
-        # Add foraminifera at a larger scale
-        self.add_foraminifera(base_surface)
-        
-        return base_surface
-        
     def add_foraminifera(self, surface):
         """Add biome-appropriate foraminifera with depth scaling"""
         biome_forams = {
@@ -348,30 +250,39 @@ class SedimentGenerator:
             Biome.WHALEFALL: [ForamType.BENTHIC, ForamType.GLOBIGERINA]  # Organic matter processors
         }
         
-        foram_count = random.randint(20, 30)  # Reduced count for chunky style
+        foram_count = self.rng.randint(20, 30)  # Reduced count for chunky style
         available_types = biome_forams.get(self.biome, list(ForamType))
-        
+        xs, ys, patterns, colors = [], [], [], []
         for _ in range(foram_count):
-            x = random.randint(0, self.width - 16)  # Larger spacing
-            y = random.randint(0, self.height - 16)
-            foram_type = random.choice(available_types)
-            pattern = self.foram_patterns[foram_type]
-            
-            # Scale foram size based on depth
-            depth = y / self.height
-            scale = 2 - depth  # Larger at bottom, smaller at top
-            
-            color = self.get_foram_color(foram_type, depth)
-            
-            # Draw scaled foram
-            for py, row in enumerate(pattern):
-                for px, pixel in enumerate(row):
-                    if pixel:
-                        pos_x = int(x + px * scale)
-                        pos_y = int(y + py * scale)
-                        if 0 <= pos_x < self.width and 0 <= pos_y < self.height:
-                            rect = pygame.Rect(pos_x, pos_y, max(1, int(scale)), max(1, int(scale)))
-                            pygame.draw.rect(surface, color, rect)
+            xs.append(self.rng.randint(0, self.width - 16))  # Larger spacing
+            ys.append(self.rng.randint(0, self.height - 16))
+            foram_type = self.rng.choice(available_types)
+            patterns.append(self.foram_patterns[foram_type])
+            colors.append(self.get_foram_color(foram_type, ys[-1] / self.height))
+        xs, ys, colors = np.array(xs), np.array(ys), np.array(colors)
+        
+        # Scale foram size based on depth: larger at bottom, smaller at top
+        scale = 2 - ys / self.height
+        
+        # Top-left corner and colour of every set pattern pixel of every foram
+        foram, py, px = np.nonzero(np.array(patterns))
+        pos_x = (xs[foram] + px * scale[foram]).astype(np.int64)
+        pos_y = (ys[foram] + py * scale[foram]).astype(np.int64)
+        size = np.maximum(1, scale.astype(np.int64))[foram]
+        inside = (pos_x < self.width) & (pos_y < self.height)
+        pos_x, pos_y, size, foram = pos_x[inside], pos_y[inside], size[inside], foram[inside]
+        
+        # Each pixel covers a size x size block, clipped to the surface
+        width, height = surface.get_size()
+        rgb = pygame.surfarray.pixels3d(surface)
+        alphas = pygame.surfarray.pixels_alpha(surface) if surface.get_flags() & pygame.SRCALPHA else None
+        for dx in range(size.max(initial=1)):
+            for dy in range(size.max(initial=1)):
+                block = (size > dx) & (size > dy) & (pos_x + dx < width) & (pos_y + dy < height)
+                rgb[pos_x[block] + dx, pos_y[block] + dy] = colors[foram[block]]
+                if alphas is not None:
+                    alphas[pos_x[block] + dx, pos_y[block] + dy] = 255
+        del rgb, alphas
                             
     def get_foram_color(self, foram_type, depth=0):
         """Get scientifically accurate foram coloring with depth adjustment"""
@@ -388,26 +299,100 @@ class SedimentGenerator:
         color = tuple(int(c * darkness) for c in base)
         
         variance = 15
-        return tuple(max(0, min(255, c + random.randint(-variance, variance))) for c in color)
+        return tuple(max(0, min(255, c + self.rng.randint(-variance, variance))) for c in color)
+
+    def generate_base_sediment(self):
+        """Generate multi-layered chunky sediment"""
+        if self.base_sediment is not None:
+            return self.base_sediment  # Depends only on the level, so every layer shares it
+        
+        combined_map = np.zeros((self.grid_height, self.grid_width))
+        y, x = np.mgrid[0:self.grid_height, 0:self.grid_width]
+        
+        octaves = 4  # Controls the level of detail
+        persistence = 0.5  # Controls how much each octave contributes
+        lacunarity = 2.0  # Controls how frequency increases each octave
+        
+        for i in range(octaves):
+            frequency = lacunarity ** i
+            amplitude = persistence ** i
+            
+            # Generate coherent noise for the whole grid at once
+            value = pnoise3(
+                x * frequency / self.grid_width,
+                y * frequency / self.grid_height,
+                self.level / 10.0,  # Use level as z-coordinate for variation
+                octaves=1,
+                persistence=0.5,
+                lacunarity=2.0,
+                base=self.level + i  # Different base for each octave
+            )
+            combined_map += value * amplitude
+                    
+        # Normalize to 0-1 range
+        combined_map = (combined_map - combined_map.min()) / (combined_map.max() - combined_map.min())
+        self.base_sediment = combined_map
+        return combined_map
         
     def update(self, dt):
         """Update animated elements"""
         self.sway_time += dt * 0.5
 
-    def draw(self, surface):
-        """Draw all background elements with parallax effect"""
-        # Draw parallax layers
-        for i, layer in enumerate(self.parallax_surfaces):
+    def parallax_offsets(self):
+        """Whole-pixel horizontal offset of each parallax layer at the current sway time"""
+        offsets = []
+        for i in range(len(self.parallax_surfaces)):
             # Calculate parallax offset based on layer depth
             depth = i / len(self.parallax_surfaces)
-            offset_x = math.sin(self.sway_time) * (20 * (1 - depth))
-            
+            offsets.append(int(math.sin(self.sway_time) * (20 * (1 - depth))))
+        return tuple(offsets)
+
+    def flatten_parallax_layers(self):
+        """Opaque copies of the parallax layers carrying their depth alpha as surface alpha.
+
+        Every chunk of a layer shares one alpha, so a plain surface with set_alpha
+        blends the same as the per-pixel version and is much cheaper to blit.
+        """
+        area = pygame.Rect(0, 0, self.grid_width * self.chunk_size, self.grid_height * self.chunk_size)
+        flat_layers = []
+        for layer in self.parallax_surfaces:
+            flat = pygame.Surface(area.size)
+            flat.blit(layer, (0, 0), area, special_flags=pygame.BLEND_RGB_ADD)  # Copy colour, drop alpha
+            alpha = layer.get_at((0, 0)).a
+            if alpha < 255:
+                flat.set_alpha(alpha)
+            flat_layers.append(flat)
+        return flat_layers
+
+    def get_lane_bands(self):
+        """Lane markings cropped to the band each lane actually covers, built once"""
+        if self.lane_bands is None:
+            lane_surface = self.generate_lane_markings()
+            self.lane_bands = []
+            for row in range(self.grid_rows):
+                band = pygame.Rect(0, row * self.cell_height, self.width, self.cell_height).clip(lane_surface.get_rect())
+                strip = lane_surface.subsurface(band)
+                used = strip.get_bounding_rect()
+                if used.width and used.height:
+                    self.lane_bands.append((strip.subsurface(used).copy(), (used.x, band.y + used.y)))
+        return self.lane_bands
+
+    def draw_lane_markings(self, surface):
+        for band, pos in self.get_lane_bands():
+            surface.blit(band, pos)
+
+    def draw(self, surface, offsets=None):
+        """Draw all background elements with parallax effect, at parallax_offsets() unless given"""
+        if self.flat_layers is None:
+            self.flat_layers = self.flatten_parallax_layers()
+        
+        # Draw parallax layers
+        for layer, offset_x in zip(self.flat_layers, offsets or self.parallax_offsets()):
             # Draw layer with offset
-            surface.blit(layer, (int(offset_x), 0))
+            surface.blit(layer, (offset_x, 0))
         
         # Draw lane markings over the base layers
-        lane_surface = self.generate_lane_markings(surface)
-        surface.blit(lane_surface, (0, 0))
+        self.draw_lane_markings(surface)
 
     def get_background(self):
         """Generate and return the complete background surface"""
@@ -424,7 +409,6 @@ class SedimentGenerator:
             background.blit(layer, (int(offset_x), 0))
         
         # Draw lane markings
-        lane_surface = self.generate_lane_markings(background)
-        background.blit(lane_surface, (0, 0))
+        self.draw_lane_markings(background)
         
         return background
\ No newline at end of file
@@ -3,14 +3,17 @@ import random
 from config import *
 from ui import Button, Tooltip
 from tooltip import get_tower_tooltip_text
+from text_cache import render_text
 
 class Shop:
-    def __init__(self, biome):
+    def __init__(self, biome, rng=None):
         self.biome = biome
+        self.rng = rng if rng is not None else random  # Simulation stream for shop rolls
         self.slots = []
         self.selected_tower = None
         self.refresh_cost = SHOP_REFRESH_COST
         self.native_resource = self._get_native_resource()
+        self.font = get_font(FONT_SIZE_SMALL)
         self.setup_shop()
         self.refresh_shop()
         
@@ -93,17 +96,17 @@ class Shop:
                 break
                 
             # Determine if this slot will be a rare tower (15% chance)
-            if rare_towers and random.random() < 0.15:
-                tower_name = random.choice(rare_towers)
+            if rare_towers and self.rng.random() < 0.15:
+                tower_name = self.rng.choice(rare_towers)
                 rare_towers.remove(tower_name)
             elif available_towers:
-                tower_name = random.choice(available_towers)
+                tower_name = self.rng.choice(available_towers)
                 available_towers.remove(tower_name)
             else:
                 continue
             
             # Determine star level based on improved probabilities
-            rand = random.random()
+            rand = self.rng.random()
             if rand > 0.98:  # 2% chance for 3-star
                 star_level = 3
             elif rand > 0.85:  # 13% chance for 2-star
@@ -197,7 +200,7 @@ class Shop:
         pygame.draw.rect(surface, COLOR_UI_BG, shop_bg)
         
         # Draw slots
-        font = get_font(FONT_SIZE_SMALL)
+        font = self.font
         for i, slot in enumerate(self.slots):
             if slot['tower']:
                 tower_name, star_level = slot['tower']
@@ -209,7 +212,7 @@ class Shop:
                 pygame.draw.rect(surface, bg_color, slot['rect'])
                 
                 # Draw tower name
-                name_text = font.render(tower_name, True, COLOR_TEXT)
+                name_text = render_text(font, tower_name, COLOR_TEXT)
                 name_rect = name_text.get_rect(center=(slot['rect'].centerx, slot['rect'].top + 20))
                 surface.blit(name_text, name_rect)
                 
@@ -229,7 +232,7 @@ class Shop:
                     for resource, amount in costs.items():
                         sufficient = resources.get(resource, 0) >= amount
                         color = (0, 255, 0) if sufficient else (255, 0, 0)
-                        cost_text.append(font.render(f"{resource}: {amount}", True, color))
+                        cost_text.append(render_text(font, f"{resource}: {amount}", color))
                     
                     y_offset = slot['rect'].bottom - 40
                     for text in cost_text:
@@ -239,7 +242,7 @@ class Shop:
             else:
                 # Draw empty slot
                 pygame.draw.rect(surface, (50, 50, 50), slot['rect'])
-                text = font.render("SOLD", True, COLOR_TEXT)
+                text = render_text(font, "SOLD", COLOR_TEXT)
                 text_rect = text.get_rect(center=slot['rect'].center)
                 surface.blit(text, text_rect)
         
@@ -259,7 +262,7 @@ class Shop:
         refresh_status, status_color = self.get_refresh_status(resources)
         
         # Draw refresh status text with better positioning
-        status_text = font.render(refresh_status, True, status_color)
+        status_text = render_text(font, refresh_status, status_color)
         status_rect = status_text.get_rect(
             centerx=self.refresh_button.rect.centerx,
             top=self.refresh_button.rect.bottom + 5
@@ -285,7 +288,7 @@ class Shop:
             
             # Draw kills progress text with better positioning
             kills_text = f"{self.enemy_kills}/{next_threshold} kills"
-            kills_surface = font.render(kills_text, True, COLOR_TEXT)
+            kills_surface = render_text(font, kills_text, COLOR_TEXT)
             kills_rect = kills_surface.get_rect(
                 centerx=self.refresh_button.rect.centerx,
                 top=self.progress_rect.bottom + 5
@@ -0,0 +1,485 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# Keep stdout clean for the JSON report when run from the command line
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+from config import *
+from tower import ResourceTower, ProjectileTower, TankTower, EffectTower, Projectile, apply_effect_fields
+from shop import Shop
+from wave_manager import WaveManager
+from spatial_hash import SpatialHash
+from enemy_store import EnemyStore
+from orb_store import OrbStore
+from lane_index import LaneIndex
+from rng import GameRNG
+from replay import ReplayPlayer
+
+# Fixed simulation step, matches the 60 FPS cap of the windowed game
+FIXED_DT = 1.0 / 60.0
+
+class Simulation:
+    """Game state and rules for a single level, with no display dependencies"""
+    def __init__(self, biome, level, rng=None):
+        self.biome = biome
+        self.level = level
+        self.rng = rng if rng is not None else GameRNG()  # Simulation and cosmetic random streams
+
+        self.towers = []
+        self.tower_grid = [[None] * GRID_COLS for _ in range(GRID_ROWS)]  # Tower in each cell, by [row][col]
+        self.layout_version = 0  # Bumped whenever a tower is added, removed or moved
+        self.lane_index = LaneIndex()  # Solid towers by lane for enemy collision
+        self.enemies = EnemyStore()  # Array-backed, iterates like a list
+        self.projectiles = []
+        self.resource_orbs = OrbStore()  # Array-backed, iterates like a list
+        self.auto_collect = True  # Towers pick up matching orbs that drift over them
+        self._enemy_grid = SpatialHash(CELL_WIDTH)  # Read through the enemy_grid property
+        self._enemy_grid_source = None  # (store, version) the grid was last built from
+        self.phase_times = None  # Seconds spent per update phase, once enable_phase_timing is called
+        self.tick = 0  # Completed updates, used to timestamp recorded inputs
+        self.recorder = None  # InputRecorder capturing player commands, if any
+        self.wave_manager = WaveManager(level, self.rng.sim)
+        self.paused = False
+
+        # Shop system
+        self.shop = Shop(biome, self.rng.sim)
+
+        # Initialize resources
+        self.resources = {
+            'sulfides': INITIAL_RESOURCES,
+            'methane': INITIAL_RESOURCES,
+            'salt': INITIAL_RESOURCES,
+            'lipids': INITIAL_RESOURCES
+        }
+
+        # Set native resource based on biome
+        if self.biome == Biome.HYDROTHERMAL:
+            self.native_resource = 'sulfides'
+        elif self.biome == Biome.COLDSEEP:
+            self.native_resource = 'methane'
+        elif self.biome == Biome.BRINE_POOL:
+            self.native_resource = 'salt'
+        elif self.biome == Biome.WHALEFALL:
+            self.native_resource = 'lipids'
+
+    @property
+    def enemy_grid(self):
+        """Spatial hash of the enemies, rebuilt on demand whenever they have spawned, moved or died since the last query"""
+        source = (self.enemies, self.enemies.version)
+        if self._enemy_grid_source != source:
+            self._enemy_grid.rebuild(self.enemies)
+            self._enemy_grid_source = source
+        return self._enemy_grid
+
+    def get_tower_sell_value(self, tower):
+        """Calculate refund value for selling a tower (50% of purchase cost)"""
+        tower_costs = {}
+
+        if tower.name in TOWER_COSTS:
+            base_costs = TOWER_COSTS[tower.name].copy()
+            multiplier = STAR_COST_MULTIPLIERS.get(tower.stars, 1.0)
+
+            # Calculate 50% refund of the purchase cost
+            for resource, cost in base_costs.items():
+                tower_costs[resource] = int(cost * multiplier * 0.5)
+
+        return tower_costs
+
+    def is_valid_placement(self, grid_x, grid_y):
+        """Check if tower placement is valid"""
+        if not (0 <= grid_x < GRID_COLS and 0 <= grid_y < GRID_ROWS):
+            return False
+
+        # Check if cell is empty
+        return self.tower_grid[grid_y][grid_x] is None
+
+    def tower_at(self, grid_x, grid_y):
+        """Get the tower occupying a grid cell, or None"""
+        if not (0 <= grid_x < GRID_COLS and 0 <= grid_y < GRID_ROWS):
+            return None
+        return self.tower_grid[grid_y][grid_x]
+
+    def add_tower(self, tower):
+        """Put a tower on the board and mark its cell occupied"""
+        self.towers.append(tower)
+        self.tower_grid[tower.y][tower.x] = tower
+        self.layout_version += 1
+
+    def remove_tower(self, tower):
+        """Take a tower off the board (sold, combined or destroyed)"""
+        self.towers.remove(tower)
+        if self.tower_grid[tower.y][tower.x] is tower:
+            self.tower_grid[tower.y][tower.x] = None
+        self.layout_version += 1
+
+    def move_tower(self, tower, grid_x, grid_y):
+        """Move a tower to another cell, keeping the occupancy grid in step"""
+        if self.tower_grid[tower.y][tower.x] is tower:
+            self.tower_grid[tower.y][tower.x] = None
+        tower.x, tower.y = grid_x, grid_y
+        tower.update_collision_rect()
+        self.tower_grid[grid_y][grid_x] = tower
+        self.layout_version += 1
+
+    def create_tower(self, tower_name, grid_x, grid_y, star_level=1):
+        """Create a new tower of the appropriate type"""
+        tower = None
+
+        # Handle tower types
+        if tower_name in ['BlackSmoker', 'BubblePlume', 'BrinePool', 'OsedaxWorm', 'Nautilus']:
+            tower = ResourceTower(grid_x, grid_y, tower_name, self, self.biome)
+        elif tower_name in ['RiftiaTubeWorm', 'Rockfish', 'Hagfish', 'Muusoctopus', 'GiantSquid']:
+            tower = ProjectileTower(grid_x, grid_y, tower_name, self, self.biome)
+        elif tower_name in ['SquatLobster', 'SpiderCrab', 'Chimaera', 'SleeperShark', 'ColossalSquid']:
+            tower = TankTower(grid_x, grid_y, tower_name, self, self.biome)
+        elif tower_name in ['BlueCilliates', 'VesicomyidaeClams', 'MuscleBed', 'DumboOctopus', 'Beggiatoa']:
+            tower = EffectTower(grid_x, grid_y, tower_name, self, self.biome)
+
+        if tower:
+            tower.stars = star_level
+            tower._setup_tower_properties()
+        return tower
+
+    def place_tower(self, tower_type, grid_x, grid_y):
+        """Place a new tower on the grid"""
+        if tower_type == "basic":
+            tower_name = "RiftiaTubeWorm"  # Default basic tower
+        elif tower_type == "frost":
+            tower_name = "Rockfish"  # Default frost tower
+        else:
+            return
+
+        tower = self.create_tower(tower_name, grid_x, grid_y)
+        if tower:
+            self.add_tower(tower)
+
+    def _record(self, command, *args):
+        """Pass a successful player command to the recorder, if one is attached"""
+        if self.recorder is not None:
+            self.recorder.record(self.tick, command, *args)
+
+    def buy_tower(self, slot_index, grid_x, grid_y):
+        """Buy the tower in a shop slot and place it. Returns the new tower or None"""
+        tower_info = self.shop.slots[slot_index]['tower']
+        if not tower_info or not self.is_valid_placement(grid_x, grid_y):
+            return None
+        if not self.shop.can_afford_tower(tower_info, self.resources):
+            return None
+
+        tower_name, star_level = tower_info
+        tower = self.create_tower(tower_name, grid_x, grid_y, star_level)
+        if tower and self.shop.purchase_tower(slot_index, self.resources):
+            self.add_tower(tower)
+            self._record('buy', slot_index, grid_x, grid_y)
+            return tower
+        return None
+
+    def drag_tower(self, from_x, from_y, to_x, to_y):
+        """Move the tower in one cell to an empty cell"""
+        tower = self.tower_at(from_x, from_y)
+        if tower and self.is_valid_placement(to_x, to_y):
+            self.move_tower(tower, to_x, to_y)
+            self._record('drag', from_x, from_y, to_x, to_y)
+            return True
+        return False
+
+    def sell_tower(self, grid_x, grid_y):
+        """Sell the tower in a cell for half its cost"""
+        tower = self.tower_at(grid_x, grid_y)
+        if not tower:
+            return False
+
+        for resource, amount in self.get_tower_sell_value(tower).items():
+            self.resources[resource] += amount
+        self.remove_tower(tower)
+        self._record('sell', grid_x, grid_y)
+        return True
+
+    def combine_towers(self, cells, grid_x, grid_y):
+        """Merge three identical towers at the given cells into one with an extra star"""
+        towers = [self.tower_at(x, y) for x, y in cells]
+        if len(towers) != 3 or None in towers or len(set(towers)) != 3:
+            return None
+        base_tower = towers[0]
+        if base_tower.stars >= 3 or any(t.name != base_tower.name or t.stars != base_tower.stars for t in towers):
+            return None
+
+        # Target cell must be empty or one of the towers being merged
+        if not (0 <= grid_x < GRID_COLS and 0 <= grid_y < GRID_ROWS):
+            return None
+        occupant = self.tower_at(grid_x, grid_y)
+        if occupant is not None and occupant not in towers:
+            return None
+
+        new_tower = self.create_tower(base_tower.name, grid_x, grid_y, base_tower.stars + 1)
+        if not new_tower:
+            return None
+        for tower in towers:
+            self.remove_tower(tower)
+        self.add_tower(new_tower)
+        self._record('combine', [list(cell) for cell in cells], grid_x, grid_y)
+        return new_tower
+
+    def refresh_shop(self):
+        """Reroll the shop, free or paid"""
+        if self.shop.try_refresh_shop(self.resources):
+            self._record('refresh')
+            return True
+        return False
+
+    def collect_orb(self, orb_index):
+        """Collect a resource orb by hand for the manual bonus"""
+        if not 0 <= orb_index < len(self.resource_orbs):
+            return False
+        orb = self.resource_orbs[orb_index]
+        if not orb.active:
+            return False
+
+        self.resources[orb.resource_type] += orb.collect()
+        self.resource_orbs.remove(orb)
+        self._record('orb', orb_index)
+        return True
+
+    # Tick pipeline, run in this order; each phase is a method named _update_<phase>
+    PHASES = ('waves', 'towers', 'projectiles', 'enemies', 'orbs', 'cleanup')
+
+    def enable_phase_timing(self):
+        """Start accumulating wall time spent in each phase into phase_times"""
+        self.phase_times = {phase: 0.0 for phase in self.PHASES}
+
+    def update(self, dt):
+        """Update game state, running each phase of the tick once"""
+        if self.paused:
+            return None
+        self.tick += 1
+
+        phase_times = self.phase_times
+        for phase in self.PHASES:
+            start = time.perf_counter() if phase_times is not None else 0
+            state = getattr(self, '_update_' + phase)(dt)
+            if phase_times is not None:
+                phase_times[phase] += time.perf_counter() - start
+            if state is not None:
+                return state
+
+        return GameState.GAMEPLAY
+
+    def _update_waves(self, dt):
+        """Advance the wave timer and spawn enemies"""
+        if not self.wave_manager.update(dt, self.enemies):
+            # No more waves and all enemies defeated
+            if len(self.enemies) == 0:
+                return GameState.VICTORY
+        return None
+
+    def _update_towers(self, dt):
+        """Update every tower once, collecting spawned orbs and projectiles"""
+        for tower in self.towers:
+            result = tower.update(dt, self)
+
+            if isinstance(tower, ResourceTower) and result:
+                # Add any spawned resource orbs
+                self.resource_orbs.extend(result)
+            elif isinstance(tower, ProjectileTower) and result:
+                self.projectiles.append(Projectile(
+                    result['x'], result['y'],
+                    result['damage'], result['color'],
+                    result['target']))
+
+        # Area damage from every effect field that charged this tick
+        apply_effect_fields(dt, self.towers, self)
+        return None
+
+    def _update_projectiles(self, dt):
+        """Move projectiles and resolve hits"""
+        for projectile in self.projectiles:
+            projectile.update(dt)
+        return None
+
+    def _update_enemies(self, dt):
+        """Move enemies in one vectorized step and check for breaches"""
+        self.lane_index.sync(self.towers, self.layout_version)
+        self.enemies.update(dt, self.towers, self.lane_index, self)
+        for enemy in self.enemies:
+            if enemy.x < SIDEBAR_WIDTH:  # Enemy reached base
+                return GameState.GAME_OVER
+        return None
+
+    def _update_orbs(self, dt):
+        """Float resource orbs in one vectorized step and let matching towers auto-collect them"""
+        floating = self.resource_orbs.update(dt)
+        if not self.auto_collect:  # Left for the player
+            return None
+
+        for orb in self.resource_orbs.auto_collect(self.towers, floating):
+            self.resources[orb.resource_type] += orb.collect(auto_collected=True)
+        return None
+
+    def _update_cleanup(self, dt):
+        """Remove everything that finished this tick and pay out kill rewards"""
+        for enemy in self.enemies[:]:
+            if enemy.is_dead():
+                reward = enemy.get_reward()
+                self.resources[self.native_resource] += reward
+                self.enemies.remove(enemy)
+                # Track enemy kill for shop free refreshes
+                self.shop.add_enemy_kill()
+
+        for tower in self.towers[:]:
+            if tower.health <= 0:
+                self.remove_tower(tower)
+
+        self.projectiles[:] = [projectile for projectile in self.projectiles if projectile.active]
+        self.resource_orbs.compact()
+        return None
+
+def _biome_tower(biome, tower_type):
+    """Get the name of a biome's tower of the given type"""
+    return TOWER_DEFINITIONS[biome][tower_type]['name']
+
+def _starter_layout(biome):
+    """One resource tower, a shooter and a tank in every lane"""
+    layout = []
+    for row in range(GRID_ROWS):
+        layout.append((_biome_tower(biome, TowerType.RESOURCE), 0, row, 1))
+        layout.append((_biome_tower(biome, TowerType.PROJECTILE), 1, row, 1))
+        layout.append((_biome_tower(biome, TowerType.TANK), 4, row, 1))
+    return layout
+
+def _full_grid_layout(biome):
+    """Every cell filled: resources, shooters, effect fields and a tank wall"""
+    columns = [
+        _biome_tower(biome, TowerType.RESOURCE),
+        _biome_tower(biome, TowerType.PROJECTILE),
+        _biome_tower(biome, TowerType.PROJECTILE),
+        'GiantSquid',
+        _biome_tower(biome, TowerType.EFFECT),
+        'DumboOctopus',
+        'Beggiatoa',
+        _biome_tower(biome, TowerType.TANK),
+        'ColossalSquid'
+    ]
+    return [(name, col, row, 1) for col, name in enumerate(columns) for row in range(GRID_ROWS)]
+
+# Built-in tower layouts, selectable by name from the command line
+LAYOUTS = {
+    'empty': lambda biome: [],
+    'starter': _starter_layout,
+    'full_grid': _full_grid_layout
+}
+
+def load_layout(layout, biome):
+    """Resolve a layout name or JSON file into (name, x, y, stars) tuples"""
+    if layout in LAYOUTS:
+        return LAYOUTS[layout](biome)
+
+    with open(layout, 'r') as f:
+        entries = json.load(f)
+    return [(entry['name'], entry['x'], entry['y'], entry.get('stars', 1)) for entry in entries]
+
+class HeadlessEngine:
+    """Steps a Simulation at a fixed dt with no window, as fast as possible"""
+    def __init__(self, biome, level, layout=(), dt=FIXED_DT, seed=None, player=None):
+        self.sim = Simulation(biome, level, GameRNG(seed))
+        self.player = player  # ReplayPlayer feeding recorded inputs, if any
+        self.dt = dt
+        self.tick = 0
+        self.state = GameState.GAMEPLAY
+
+        for tower_name, grid_x, grid_y, stars in layout:
+            if self.sim.is_valid_placement(grid_x, grid_y):
+                tower = self.sim.create_tower(tower_name, grid_x, grid_y, stars)
+                if tower:
+                    self.sim.add_tower(tower)
+
+    def step(self):
+        """Advance the simulation by one fixed tick"""
+        if self.player:
+            self.player.apply(self.sim)
+        self.state = self.sim.update(self.dt)
+        self.tick += 1
+        return self.state
+
+    def run(self, ticks):
+        """Run until the level ends or the tick budget is used, then report results"""
+        start = time.perf_counter()
+        while self.tick < ticks and self.state == GameState.GAMEPLAY:
+            self.step()
+        wall_time = time.perf_counter() - start
+        return self.get_results(wall_time)
+
+    def get_results(self, wall_time):
+        """Summarise the run as a JSON-serialisable dict"""
+        sim_time = self.tick * self.dt
+        if self.state == GameState.VICTORY:
+            outcome = 'victory'
+        elif self.state == GameState.GAME_OVER:
+            outcome = 'game_over'
+        else:
+            outcome = 'running'
+
+        return {
+            'biome': self.sim.biome.name,
+            'level': self.sim.level,
+            'outcome': outcome,
+            'ticks': self.tick,
+            'sim_seconds': round(sim_time, 3),
+            'wall_seconds': round(wall_time, 4),
+            'ticks_per_second': round(self.tick / wall_time, 1) if wall_time > 0 else None,
+            'speedup': round(sim_time / wall_time, 1) if wall_time > 0 else None,
+            'wave': self.sim.wave_manager.current_wave,
+            'total_waves': len(self.sim.wave_manager.waves),
+            'towers': len(self.sim.towers),
+            'enemies': len(self.sim.enemies),
+            'kills': self.sim.shop.enemy_kills,
+            'resources': {name: round(amount, 2) for name, amount in self.sim.resources.items()},
+            'phase_seconds': ({phase: round(seconds, 4) for phase, seconds in self.sim.phase_times.items()}
+                              if self.sim.phase_times is not None else None)
+        }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a level headlessly and print JSON results")
+    parser.add_argument('--biome', default='HYDROTHERMAL', choices=[biome.name for biome in Biome],
+                        type=str.upper)
+    parser.add_argument('--level', type=int, default=1)
+    parser.add_argument('--layout', default='starter',
+                        help=f"built-in layout ({', '.join(LAYOUTS)}) or path to a JSON layout file")
+    parser.add_argument('--ticks', type=int, default=60 * 60 * 10,
+                        help="maximum number of fixed ticks to simulate")
+    parser.add_argument('--dt', type=float, default=FIXED_DT)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--profile-phases', action='store_true',
+                        help="report wall time spent in each update phase")
+    parser.add_argument('--replay', default=None,
+                        help="replay a recorded session; its biome, level and seed override the flags")
+    args = parser.parse_args(argv)
+
+    # Fonts are still needed by the shop and wave widgets, so bring up pygame without a window
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.font.init()
+
+    if args.replay:
+        player = ReplayPlayer.load(args.replay)
+        args.layout = 'empty'  # Recorded sessions start from an empty board
+        engine = HeadlessEngine(player.biome, player.level, (), args.dt, player.seed, player)
+    else:
+        biome = Biome[args.biome]
+        engine = HeadlessEngine(biome, args.level, load_layout(args.layout, biome), args.dt, args.seed)
+    if args.profile_phases:
+        engine.sim.enable_phase_timing()
+    results = engine.run(args.ticks)
+    results['layout'] = args.layout
+    results['seed'] = engine.sim.rng.seed
+
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+    pygame.quit()
+
+if __name__ == '__main__':
+    main()
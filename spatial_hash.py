@@ -0,0 +1,72 @@
+from collections import defaultdict
+
+class SpatialHash:
+    """Uniform grid of entities keyed by cell for range queries"""
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)  # (cell_x, cell_y) -> [(insert order, entity)]
+        self.count = 0
+
+    def clear(self):
+        """Remove all entities from the grid"""
+        self.cells.clear()
+        self.count = 0
+
+    def insert(self, entity):
+        """Add an entity using its current x/y position"""
+        key = (int(entity.x // self.cell_size), int(entity.y // self.cell_size))
+        self.cells[key].append((self.count, entity))
+        self.count += 1
+
+    def rebuild(self, entities):
+        """Re-bucket every entity; queries only see positions as of the last rebuild"""
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def _candidates(self, x, y, radius):
+        """Yield (insert order, entity) pairs from every cell overlapping the query circle"""
+        min_x = int((x - radius) // self.cell_size)
+        max_x = int((x + radius) // self.cell_size)
+        min_y = int((y - radius) // self.cell_size)
+        max_y = int((y + radius) // self.cell_size)
+
+        # Walk whichever is smaller: the covered cells or the occupied ones
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self.cells):
+            for (cell_x, cell_y), bucket in self.cells.items():
+                if min_x <= cell_x <= max_x and min_y <= cell_y <= max_y:
+                    yield from bucket
+        else:
+            for cell_x in range(min_x, max_x + 1):
+                for cell_y in range(min_y, max_y + 1):
+                    bucket = self.cells.get((cell_x, cell_y))
+                    if bucket:
+                        yield from bucket
+
+    def query_radius(self, x, y, radius):
+        """Return entities within radius of (x, y), in the order they were inserted"""
+        radius_sq = radius * radius
+        found = []
+        for order, entity in self._candidates(x, y, radius):
+            dx = entity.x - x
+            dy = entity.y - y
+            if dx*dx + dy*dy <= radius_sq:
+                found.append((order, entity))
+        found.sort(key=lambda item: item[0])
+        return [entity for _, entity in found]
+
+    def nearest(self, x, y, radius, predicate=None):
+        """Return the closest entity within radius that passes predicate, or None.
+        Ties go to the entity inserted first."""
+        best = None
+        best_key = (radius * radius, float('inf'))
+        for order, entity in self._candidates(x, y, radius):
+            if predicate and not predicate(entity):
+                continue
+            dx = entity.x - x
+            dy = entity.y - y
+            key = (dx*dx + dy*dy, order)
+            if key <= best_key:
+                best = entity
+                best_key = key
+        return best
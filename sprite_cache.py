@@ -0,0 +1,102 @@
+import math
+import pygame
+from rng import keyed_random
+
+# Effect alpha is quantised to this step so nearby values share one sprite
+BURST_ALPHA_STEP = 4
+# Texture variants per burst; picking one per frame keeps the old shimmer
+BURST_VARIANTS = 4
+# Resource orb atlas: one row per glow level, one column per sparkle phase
+ORB_GLOW_LEVELS = (0.8, 0.9, 1.0, 1.1, 1.2)
+ORB_SPARKLE_FRAMES = 24
+
+_bursts = {}  # (color, size, cell_size, alpha bucket, variant) -> Surface
+_orb_atlases = {}  # (color, radius) -> Surface of ORB_GLOW_LEVELS x ORB_SPARKLE_FRAMES orb frames
+
+def alpha_bucket(alpha):
+    """Round an alpha value to the nearest cached step"""
+    return int(round(alpha / BURST_ALPHA_STEP)) * BURST_ALPHA_STEP
+
+def _render_burst(color, size, cell_size, alpha, variant):
+    """Pixelated disc of radius size whose cells fade out towards the edge"""
+    diameter = size * 2
+    surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+    texture = keyed_random('burst', variant)
+    cells = diameter // cell_size
+
+    for x in range(cells):
+        for y in range(cells):
+            # Calculate distance from center for circular effect
+            cx = (x * cell_size + cell_size/2) - size
+            cy = (y * cell_size + cell_size/2) - size
+            dist = math.sqrt(cx*cx + cy*cy)
+
+            # Skip some cells for a pixelated texture
+            if dist <= size and texture.random() > 0.3:
+                cell_alpha = int(max(0, alpha * (1 - dist/size)))
+                pygame.draw.rect(surface, (*color, cell_alpha),
+                                 (x * cell_size, y * cell_size, cell_size, cell_size))
+    return surface
+
+def get_burst_sprite(color, size, alpha, cell_size=8, variant=0):
+    """Pre-rendered burst sprite for (color, size, alpha bucket), or None when fully transparent"""
+    bucket = alpha_bucket(alpha)
+    if bucket <= 0:
+        return None
+    key = (tuple(color), size, cell_size, bucket, variant % BURST_VARIANTS)
+    sprite = _bursts.get(key)
+    if sprite is None:
+        sprite = _render_burst(key[0], size, cell_size, bucket, key[4])
+        _bursts[key] = sprite
+    return sprite
+
+def _render_orb(surface, color, radius, glow_intensity, sparkle_time):
+    """Glowing orb with highlight and three sparkles at full alpha, centred in surface"""
+    center = (radius * 1.5, radius * 1.5)
+
+    # Draw outer glow
+    for r in range(6, 0, -1):
+        glow_alpha = int((255 // (r + 2)) * glow_intensity)
+        pygame.draw.circle(surface, (*color, glow_alpha), center, radius + r)
+
+    # Draw main orb body
+    pygame.draw.circle(surface, (*color, 255), center, radius)
+
+    # Add highlight for shininess
+    pygame.draw.circle(surface, (255, 255, 255, int(255 * 0.7)), (center[0] - 2, center[1] - 2), radius // 2)
+
+    # Draw small sparkles
+    for i in range(3):
+        angle = sparkle_time + (i * math.pi * 2 / 3)
+        sparkle_x = center[0] + math.cos(angle) * (radius - 2)
+        sparkle_y = center[1] + math.sin(angle) * (radius - 2)
+        sparkle_alpha = int(255 * 0.5 * (0.7 + 0.3 * math.sin(sparkle_time + i)))
+        pygame.draw.circle(surface, (255, 255, 255, sparkle_alpha), (sparkle_x, sparkle_y), 1)
+
+def get_orb_atlas(color, radius):
+    """Every glow level and sparkle phase of one orb colour, rendered once"""
+    key = (tuple(color), radius)
+    atlas = _orb_atlases.get(key)
+    if atlas is None:
+        size = radius * 3
+        atlas = pygame.Surface((size * ORB_SPARKLE_FRAMES, size * len(ORB_GLOW_LEVELS)), pygame.SRCALPHA)
+        for row, glow_intensity in enumerate(ORB_GLOW_LEVELS):
+            for column in range(ORB_SPARKLE_FRAMES):
+                # Each frame is drawn into its own cell so the glow clips exactly like a lone orb
+                cell = atlas.subsurface((column * size, row * size, size, size))
+                _render_orb(cell, key[0], radius, glow_intensity, column * math.pi * 2 / ORB_SPARKLE_FRAMES)
+        _orb_atlases[key] = atlas
+    return atlas
+
+def draw_orb(surface, color, radius, x, y, alpha, glow_intensity, sparkle_time):
+    """Blit the atlas frame nearest to glow_intensity and sparkle_time, faded to alpha; returns the area covered"""
+    if alpha <= 0:
+        return None
+    atlas = get_orb_atlas(color, radius)
+    size = radius * 3
+    row = min(range(len(ORB_GLOW_LEVELS)), key=lambda i: abs(ORB_GLOW_LEVELS[i] - glow_intensity))
+    column = int(round(sparkle_time % (math.pi * 2) / (math.pi * 2) * ORB_SPARKLE_FRAMES)) % ORB_SPARKLE_FRAMES
+    # Every orb shape scales with the pulsed alpha, so per-surface alpha stands in for re-rendering
+    atlas.set_alpha(alpha)
+    return surface.blit(atlas, (int(x - radius * 1.5), int(y - radius * 1.5)),
+                        (column * size, row * size, size, size))
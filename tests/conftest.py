@@ -0,0 +1,11 @@
+import os
+import sys
+
+# Modules live at the repository root, and the shop needs fonts but no window
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+pygame.font.init()
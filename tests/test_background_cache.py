@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import background_cache
+from config import Biome
+from sediment_generator import GENERATOR_VERSION, SedimentGenerator
+
+SIZE = (64, 32)
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(background_cache, 'CACHE_DIR', str(tmp_path / 'backgrounds'))
+    return tmp_path / 'backgrounds'
+
+def test_saved_layers_load_back_and_missing_or_corrupt_files_do_not():
+    chunks = np.arange(2 * 4 * 8 * 3, dtype=np.uint8).reshape(2, 4, 8, 3)
+    assert background_cache.load_layers(Biome.COLDSEEP, 3, SIZE, 1) is None
+    background_cache.save_layers(Biome.COLDSEEP, 3, SIZE, 1, chunks)
+    assert np.array_equal(background_cache.load_layers(Biome.COLDSEEP, 3, SIZE, 1), chunks)
+    assert background_cache.load_layers(Biome.COLDSEEP, 3, SIZE, 2) is None  # Other generator version
+
+    with open(background_cache.cache_path(Biome.COLDSEEP, 4, SIZE, 1), 'wb') as f:
+        f.write(b'not an npz')
+    assert background_cache.load_layers(Biome.COLDSEEP, 4, SIZE, 1) is None
+
+def test_unwritable_cache_is_skipped(cache_dir):
+    cache_dir.parent.joinpath('backgrounds').write_text('a file where the directory should be')
+    background_cache.save_layers(Biome.COLDSEEP, 3, SIZE, 1, np.zeros((1, 1, 1, 3), np.uint8))
+    assert background_cache.load_layers(Biome.COLDSEEP, 3, SIZE, 1) is None
+
+def test_generator_reuses_its_cached_layers(cache_dir):
+    first = SedimentGenerator(Biome.BRINE_POOL, 5)
+    second = SedimentGenerator(Biome.BRINE_POOL, 5)
+    assert not first.loaded_from_cache and second.loaded_from_cache
+    assert np.array_equal(first.layer_chunks, second.layer_chunks)
+
+    # Layers baked for another grid shape are regenerated rather than trusted
+    size = (first.width, first.height)
+    background_cache.save_layers(Biome.BRINE_POOL, 5, size, GENERATOR_VERSION, first.layer_chunks[:1])
+    assert not SedimentGenerator(Biome.BRINE_POOL, 5).loaded_from_cache
+
+def test_main_bakes_only_missing_levels(capsys):
+    background_cache.main(['--biome', 'WHALEFALL', '--levels', '2'])
+    background_cache.main(['--biome', 'WHALEFALL', '--levels', '2'])
+    first, second = capsys.readouterr().out.splitlines()
+    assert first.startswith('baked 2 backgrounds') and second.startswith('baked 0 backgrounds')
+    assert SedimentGenerator(Biome.WHALEFALL, 2).loaded_from_cache
@@ -0,0 +1,97 @@
+import pygame
+import pytest
+
+from compositor import Compositor, merge_rects
+from config import Biome, WINDOW_WIDTH, WINDOW_HEIGHT
+from rng import GameRNG
+from simulation import FIXED_DT
+
+class Recorder:
+    """Layer draw callback that fills its regions and remembers the states it was given"""
+    def __init__(self, color, regions=None):
+        self.color = color
+        self.regions = regions
+        self.states = []
+
+    def __call__(self, surface, state):
+        self.states.append(state)
+        for rect in self.regions or [surface.get_rect()]:
+            surface.fill(self.color, rect)
+        return self.regions
+
+@pytest.fixture
+def screen():
+    pygame.display.init()
+    surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    from tower import initialize_tower_images
+    initialize_tower_images()
+    yield surface
+
+def test_merge_rects_unions_overlaps_and_drops_empty_rects():
+    merged = merge_rects([(0, 0, 10, 10), (5, 5, 10, 10), (40, 40, 0, 5), (50, 50, 2, 2)])
+    assert sorted(map(tuple, merged)) == [(0, 0, 15, 15), (50, 50, 2, 2)]
+
+def test_layers_redraw_only_when_state_changes_or_invalidated():
+    target = pygame.Surface((20, 20))
+    compositor = Compositor((20, 20))
+    draw = Recorder((10, 20, 30))
+    compositor.add_layer('base', draw)
+
+    compositor.set_state('base', 1)
+    compositor.compose(target)
+    compositor.set_state('base', 1)
+    compositor.compose(target)
+    assert draw.states == [1]
+
+    compositor.set_state('base', 2)
+    compositor.compose(target)
+    compositor.invalidate('base')
+    compositor.compose(target)
+    assert draw.states == [1, 2, 2]
+    assert target.get_at((0, 0))[:3] == (10, 20, 30)
+
+def test_transparent_layers_blend_only_their_regions():
+    target = pygame.Surface((20, 20))
+    compositor = Compositor((20, 20))
+    compositor.add_layer('source', Recorder((200, 0, 0)), composite=False)
+    compositor.add_layer('base', Recorder((0, 0, 200)))
+    compositor.add_layer('top', Recorder((0, 200, 0, 255), [pygame.Rect(2, 2, 4, 4)]), transparent=True)
+    compositor.compose(target)
+
+    assert target.get_at((3, 3))[:3] == (0, 200, 0)
+    assert target.get_at((10, 10))[:3] == (0, 0, 200)  # Non-composite source never reaches the target
+    assert compositor.surface('source').get_at((0, 0))[:3] == (200, 0, 0)
+
+def test_world_layer_is_only_redrawn_when_the_simulation_moves(screen):
+    from gameplay import GameplayManager
+    gameplay = GameplayManager(Biome.HYDROTHERMAL, 1, GameRNG(3))
+    world = gameplay.compositor.by_name['world']
+    calls = []
+    draw = world.draw
+    world.draw = lambda surface, state: calls.append(state) or draw(surface, state)
+
+    gameplay.draw(screen)
+    gameplay.draw(screen)
+    assert len(calls) == 1
+    assert gameplay.world_regions is not None
+
+    gameplay.world_regions = None  # As mark_dirty leaves it; frames without a redraw report nothing new
+    gameplay.draw(screen)
+    assert gameplay.world_regions is None
+
+    gameplay.update(FIXED_DT)
+    gameplay.draw(screen)
+    assert len(calls) == 2
+
+def test_background_layer_reuses_one_pre_blended_board_per_sway(screen):
+    from gameplay import GameplayManager
+    gameplay = GameplayManager(Biome.HYDROTHERMAL, 1, GameRNG(3))
+    offsets = gameplay.sediment_generator.parallax_offsets()
+    layer = pygame.Surface(screen.get_size(), 0, screen)
+    gameplay.draw_background_layer(layer, offsets)
+    gameplay.draw_background_layer(layer, offsets)
+    assert list(gameplay.board_frames) == [offsets]
+
+    direct = pygame.Surface(screen.get_size(), 0, screen)
+    gameplay.draw_board(direct, offsets)
+    assert pygame.image.tobytes(layer, 'RGB') == pygame.image.tobytes(direct, 'RGB')
@@ -0,0 +1,16 @@
+import config
+from config import get_font
+
+def test_each_font_size_is_loaded_once():
+    assert get_font(18) is get_font(18)
+    assert get_font(18) is not get_font(19)
+    assert get_font(18).get_height() < get_font(36).get_height()
+
+def test_missing_font_falls_back_once_with_a_single_warning(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(config, '_fonts', {})
+    monkeypatch.setattr(config, '_missing_fonts', set())
+    path = str(tmp_path / 'missing.ttf')
+    first = get_font(20, path)
+    assert get_font(20, path) is first
+    get_font(22, path)
+    assert capsys.readouterr().out.count("Warning: Could not load") == 1
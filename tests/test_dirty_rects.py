@@ -0,0 +1,94 @@
+import numpy as np
+import pygame
+import pytest
+
+from config import Biome, COLOR_BACKGROUND, WINDOW_WIDTH, WINDOW_HEIGHT
+from dirty_rects import DirtyRectTracker, union_rects
+from enemy import Enemy
+from rng import GameRNG
+from simulation import FIXED_DT, load_layout
+
+class RecordingTracker(DirtyRectTracker):
+    """Presents into an off-screen copy of the display, so stale pixels can be compared"""
+    def __init__(self, size):
+        super().__init__(size)
+        self.shown = pygame.Surface(size)
+        self.frame = None
+        self.presented = []
+
+    def present(self):
+        rects = self.rects + self.previous
+        if self.full:
+            self.shown.blit(self.frame, (0, 0))
+        for rect in rects:
+            self.shown.blit(self.frame, rect, rect)
+        self.presented = rects
+        self.previous = self.rects
+        self.rects = []
+        self.full = False
+
+@pytest.fixture
+def screen():
+    pygame.display.init()
+    surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    from tower import initialize_tower_images
+    initialize_tower_images()
+    yield surface
+
+def new_gameplay():
+    from gameplay import GameplayManager
+    gameplay = GameplayManager(Biome.HYDROTHERMAL, 1, GameRNG(3))
+    for name, x, y, stars in load_layout('starter', Biome.HYDROTHERMAL):
+        gameplay.add_tower(gameplay.create_tower(name, x, y, stars))
+    return gameplay
+
+def draw_frame(gameplay, screen, tracker):
+    screen.fill(COLOR_BACKGROUND)
+    gameplay.draw(screen)
+    tracker.frame = screen
+    gameplay.mark_dirty(tracker)
+    tracker.present()
+
+def test_union_rects_skips_missing_and_empty_rects():
+    assert union_rects(None, pygame.Rect(0, 0, 0, 0)) is None
+    assert union_rects(pygame.Rect(0, 0, 2, 2), None, pygame.Rect(5, 5, 1, 1)) == pygame.Rect(0, 0, 6, 6)
+
+def test_marks_are_clipped_and_signatures_only_fire_on_change():
+    tracker = DirtyRectTracker((100, 100))
+    tracker.mark(pygame.Rect(90, 90, 20, 20))
+    tracker.mark(pygame.Rect(200, 200, 5, 5))
+    assert tracker.rects == [pygame.Rect(90, 90, 10, 10)]
+    assert tracker.changed('hud', 1)
+    assert not tracker.changed('hud', 1)
+    tracker.mark_if_changed('hud', 1, pygame.Rect(0, 0, 5, 5))
+    assert len(tracker.rects) == 1
+
+def test_moved_and_removed_enemies_leave_no_stale_pixels(screen):
+    gameplay = new_gameplay()
+    tracker = RecordingTracker(screen.get_size())
+    walker, doomed = Enemy(1, 'DrillingMech', gameplay.rng.sim), Enemy(3, 'ExosuitDiver', gameplay.rng.sim)
+    gameplay.enemies.append(walker)
+    gameplay.enemies.append(doomed)
+    draw_frame(gameplay, screen, tracker)
+    old_walker, old_doomed = walker.draw(pygame.Surface(screen.get_size())), doomed.draw(pygame.Surface(screen.get_size()))
+
+    walker.x -= 60
+    gameplay.enemies.remove(doomed)
+    gameplay.update(FIXED_DT)
+    draw_frame(gameplay, screen, tracker)
+
+    for old in (old_walker, old_doomed):
+        assert old.collidelist(tracker.presented) >= 0
+        assert old.unionall([rect for rect in tracker.presented if rect.colliderect(old)]).contains(old)
+    assert np.array_equal(pygame.surfarray.array3d(tracker.shown), pygame.surfarray.array3d(screen))
+
+def test_presented_frames_match_full_redraws(screen):
+    gameplay = new_gameplay()
+    tracker = RecordingTracker(screen.get_size())
+    rng = gameplay.rng.sim
+    for tick in range(240):
+        if tick % 40 == 0:
+            gameplay.enemies.append(Enemy(tick // 40 % 5, 'ScoutDrone', rng))
+        gameplay.update(FIXED_DT)
+        draw_frame(gameplay, screen, tracker)
+        assert np.array_equal(pygame.surfarray.array3d(tracker.shown), pygame.surfarray.array3d(screen)), tick
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from config import Biome, CELL_WIDTH, CELL_HEIGHT, SIDEBAR_WIDTH
+from enemy import Enemy
+from simulation import HeadlessEngine
+from tower import EffectTower, apply_effect_fields
+
+ENEMY_TYPES = ['ScoutDrone', 'DrillingMech', 'HarvesterDrone', 'SeabedCrawler', 'VortexGenerator']
+
+def field_scene():
+    """Three overlapping effect towers with armoured and shielded enemies between them"""
+    layout = [('BlueCilliates', 2, 1, 1), ('BlueCilliates', 3, 2, 2), ('BlueCilliates', 2, 3, 1)]
+    sim = HeadlessEngine(Biome.HYDROTHERMAL, 1, layout, seed=9).sim
+    rng = random.Random(4)
+    for i in range(15):
+        enemy = Enemy(i % 5, ENEMY_TYPES[i % len(ENEMY_TYPES)], rng)
+        enemy.x = SIDEBAR_WIDTH + rng.uniform(0, 6) * CELL_WIDTH
+        enemy.y = rng.uniform(0, 5) * CELL_HEIGHT
+        enemy.shield_amount = 3.0  # Only HarvesterDrone's energy_shield reads it
+        sim.enemies.append(enemy)
+    for i, tower in enumerate(sim.towers):
+        tower.effect_damage = 15.0 * (i + 1)
+        tower.damage_timer = 0.1
+        tower.damage_ready = True
+    return sim
+
+def per_tower_loop(dt, towers, game_state):
+    """The original EffectTower damage step, one tower and one enemy at a time"""
+    for tower in towers:
+        center_x = tower.x * CELL_WIDTH + SIDEBAR_WIDTH + CELL_WIDTH/2
+        center_y = tower.y * CELL_HEIGHT + CELL_HEIGHT/2
+        radius_px = tower.effect_radius * CELL_WIDTH
+        affected = []
+        for enemy in game_state.enemies:
+            dist = ((enemy.x - center_x)**2 + (enemy.y - center_y)**2) ** 0.5
+            if dist <= radius_px:
+                interval_damage = tower.effect_damage * (1.0 - dist / radius_px) * tower.damage_timer
+                enemy.take_damage(interval_damage)
+                if tower.power:
+                    tower.power.on_damage_dealt(enemy, interval_damage)
+                affected.append(enemy)
+        tower.finish_damage_tick(dt, game_state, affected)
+
+def test_batched_fields_match_the_per_tower_loop():
+    batched, reference = field_scene(), field_scene()
+    affected = apply_effect_fields(0.1, batched.towers, batched)
+    per_tower_loop(0.1, reference.towers, reference)
+
+    assert [e.health for e in batched.enemies] == pytest.approx([e.health for e in reference.enemies])
+    assert [e.shield_amount for e in batched.enemies] == pytest.approx([e.shield_amount for e in reference.enemies])
+    for tower, expected in zip(batched.towers, reference.towers):
+        assert {batched.enemies.order.index(e) for e in affected[tower]} == \
+               {reference.enemies.order.index(e) for e in expected.affected_enemies}
+        assert affected[tower]
+        assert set(affected[tower]) == tower.affected_enemies
+        assert not tower.damage_ready and tower.damage_timer == 0
+
+def test_only_ready_towers_fire():
+    sim = field_scene()
+    idle = sim.towers[0]
+    idle.damage_ready = False
+    before = [e.health for e in sim.enemies]
+    affected = apply_effect_fields(0.1, sim.towers, sim)
+    assert idle not in affected
+    assert idle.damage_timer == 0.1
+    assert any(e.health < h for e, h in zip(sim.enemies, before))
+    assert all(isinstance(tower, EffectTower) for tower in affected)
@@ -0,0 +1,50 @@
+import random
+
+from config import Biome
+from enemy import Enemy
+from enemy_store import EnemyStore
+from simulation import HeadlessEngine
+
+def test_removed_slot_is_reused_without_touching_the_snapshot():
+    rng = random.Random(0)
+    store = EnemyStore(capacity=4)
+    first, second, third = (Enemy(row, 'ScoutDrone', rng) for row in range(3))
+    for enemy in (first, second, third):
+        store.append(enemy)
+    second.health = 7.5
+    freed_slot = second._slot
+
+    store.remove(second)
+    replacement = Enemy(4, 'DrillingMech', rng)
+    store.append(replacement)
+    replacement.health = 123.0
+
+    assert replacement._slot == freed_slot
+    assert second not in store
+    assert second.health == 7.5
+    assert list(store) == [first, third, replacement]
+    assert [enemy.y for enemy in store] == [first.y, third.y, replacement.y]
+
+    second.health = 1.0  # Writes to a detached enemy stay on the snapshot
+    assert replacement.health == 123.0
+
+def test_store_grows_past_capacity_and_keeps_values():
+    rng = random.Random(0)
+    store = EnemyStore(capacity=2)
+    enemies = [Enemy(row % 5, 'ScoutDrone', rng) for row in range(5)]
+    for i, enemy in enumerate(enemies):
+        enemy.health = float(i)
+        store.append(enemy)
+    assert store.capacity >= 5
+    assert [enemy.health for enemy in store] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+def test_headless_ticks_run_enemy_abilities():
+    engine = HeadlessEngine(Biome.HYDROTHERMAL, 1, seed=5)
+    swarm = Enemy(2, 'NaniteSwarm', random.Random(0))
+    engine.sim.enemies.append(swarm)
+    engine.step()
+
+    clones = [enemy for enemy in engine.sim.enemies if enemy is not swarm]
+    assert clones == swarm.clones
+    assert len(clones) == 1
+    assert 'divide' not in clones[0].abilities
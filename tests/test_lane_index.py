@@ -0,0 +1,51 @@
+import random
+
+import pygame
+
+from config import Biome, CELL_WIDTH, CELL_HEIGHT, SIDEBAR_WIDTH, GRID_COLS, GRID_ROWS
+from lane_index import LaneIndex
+from simulation import HeadlessEngine
+
+def scattered_sim():
+    sim = HeadlessEngine(Biome.COLDSEEP, 1, seed=6).sim
+    rng = random.Random(6)
+    names = ['SquatLobster', 'RiftiaTubeWorm', 'BlackSmoker', 'BlueCilliates']
+    for _ in range(25):
+        col, row = rng.randrange(GRID_COLS), rng.randrange(GRID_ROWS)
+        if sim.is_valid_placement(col, row):
+            sim.add_tower(sim.create_tower(rng.choice(names), col, row))
+    return sim
+
+def random_rects(count, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield pygame.Rect(SIDEBAR_WIDTH + rng.randint(-40, GRID_COLS * CELL_WIDTH),
+                          rng.randint(-40, GRID_ROWS * CELL_HEIGHT),
+                          rng.randint(1, 80), rng.randint(1, 80))
+
+def test_colliding_candidates_cover_a_full_scan_in_tower_order():
+    sim = scattered_sim()
+    index = LaneIndex()
+    index.sync(sim.towers, sim.layout_version)
+    for rect in random_rects(300, 1):
+        expected = [t for t in sim.towers if t.check_collision(rect)]
+        found = [t for t in index.colliding_candidates(rect) if t.check_collision(rect)]
+        assert found == expected
+        assert index.is_blocked(rect) == bool(expected)
+
+def test_probe_cache_is_dropped_when_the_layout_changes():
+    sim = HeadlessEngine(Biome.COLDSEEP, 1, seed=6).sim
+    tank = sim.create_tower('SquatLobster', 2, 2)
+    sim.add_tower(tank)
+    index = LaneIndex()
+    index.sync(sim.towers, sim.layout_version)
+    probe = tank.collision_rect.copy()
+    assert index.is_blocked(probe)
+
+    index.sync(sim.towers, sim.layout_version)  # Same version: nothing is rebuilt
+    assert index.probe_cache
+
+    sim.move_tower(tank, 6, 4)
+    index.sync(sim.towers, sim.layout_version)
+    assert not index.is_blocked(probe)
+    assert index.is_blocked(tank.collision_rect)
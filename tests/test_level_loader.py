@@ -0,0 +1,40 @@
+import threading
+
+import pygame
+
+import level_loader
+import text_cache
+from config import Biome, WINDOW_WIDTH, WINDOW_HEIGHT
+from level_loader import LevelLoader
+from loading_screen import LoadingScreen
+
+class FakeGenerator:
+    """Stands in for SedimentGenerator, failing whenever it is built on the loader's thread"""
+    def __init__(self, biome, level):
+        if threading.current_thread().name.startswith('level-loader'):
+            raise MemoryError("no room for the background")
+        self.key = (biome, level)
+
+def test_take_loads_directly_when_background_preparation_failed(monkeypatch, capsys):
+    monkeypatch.setattr(level_loader, 'SedimentGenerator', FakeGenerator)
+    loader = LevelLoader()
+    try:
+        loader.prefetch(Biome.COLDSEEP, 2)
+        loader.prepared[(Biome.COLDSEEP, 2)].exception()  # Wait for the worker
+        assert loader.ready(Biome.COLDSEEP, 2)
+
+        generator = loader.take(Biome.COLDSEEP, 2)
+    finally:
+        loader.shutdown()
+    assert generator.key == (Biome.COLDSEEP, 2)
+    assert (Biome.COLDSEEP, 2) not in loader.prepared
+    assert "no room for the background" in capsys.readouterr().out
+
+def test_loading_screen_renders_its_text_through_the_cache():
+    text_cache._text_surfaces.clear()
+    screen = LoadingScreen()
+    screen.start(Biome.WHALEFALL, 7)
+    surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    screen.draw(surface)
+    screen.draw(surface)
+    assert sorted(key[2] for key in text_cache._text_surfaces) == ["Loading", "Whalefall - Level 7"]
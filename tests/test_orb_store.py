@@ -0,0 +1,77 @@
+import math
+import random
+
+from orb_store import ORB_AIR_RESISTANCE, ORB_BUOYANCY, ORB_FADE_TIME, ORB_GRAVITY, OrbStore
+from resource_orb import ResourceOrb
+
+def new_orbs(count, rng):
+    return [ResourceOrb(10.0 * i, 20.0 * i, 'sulfides', i + 1, rng=rng) for i in range(count)]
+
+def step_orb(values, dt):
+    """One orb's float step, written out per orb"""
+    values = dict(values)
+    values['lifetime'] -= dt
+    values['age'] += dt
+    values['active'] = values['active'] and values['lifetime'] > 0
+    values['vy'] += (ORB_GRAVITY - ORB_BUOYANCY) * dt
+    values['vx'] *= ORB_AIR_RESISTANCE
+    values['vy'] *= ORB_AIR_RESISTANCE
+    values['x'] += values['vx'] * dt
+    values['y'] += values['vy'] * dt
+    values['y'] += math.sin(values['age'] * values['float_speed'] + values['time_offset']) * values['float_amplitude']
+    if values['lifetime'] < ORB_FADE_TIME:
+        values['alpha'] = int(255 * (values['lifetime'] / ORB_FADE_TIME))
+    return values
+
+def orb_values(orb):
+    return {'x': orb.x, 'y': orb.y, 'vx': orb.velocity_x, 'vy': orb.velocity_y, 'lifetime': orb.lifetime,
+            'age': orb.age, 'active': orb.active, 'alpha': orb.alpha, 'time_offset': orb.time_offset,
+            'float_speed': orb.float_speed, 'float_amplitude': orb.float_amplitude}
+
+def test_array_step_matches_stepping_each_orb():
+    store = OrbStore(capacity=2)  # Grows while appending
+    orbs = new_orbs(5, random.Random(1))
+    orbs[3].lifetime = 0.5  # Fades and expires within the run
+    store.extend(orbs)
+    expected = [orb_values(orb) for orb in orbs]
+
+    # Stepped and compacted each tick, as the simulation does
+    for _ in range(40):
+        floating = store.update(1 / 60)
+        expected = [step_orb(values, 1 / 60) for values in expected]
+        assert floating.tolist() == [values['active'] for values in expected]
+        store.compact()
+        expected = [values for values in expected if values['active']]
+        assert [orb_values(orb) for orb in store] == expected
+    assert orbs[3] not in store and len(store) == 4
+    assert not orbs[3].active
+
+def test_orb_store_compaction_keeps_later_orbs_intact():
+    store = OrbStore(capacity=2)
+    orbs = new_orbs(4, random.Random(0))
+    store.extend(orbs)
+    positions = [(orb.x, orb.y) for orb in orbs]
+
+    orbs[1].collect()
+    store.compact()
+
+    assert list(store) == [orbs[0], orbs[2], orbs[3]]
+    assert [(orb.x, orb.y) for orb in store] == [positions[0], positions[2], positions[3]]
+    assert [orb._slot for orb in store] == [0, 1, 2]
+    assert orbs[1] not in store
+    assert (orbs[1].x, orbs[1].y) == positions[1]
+
+def test_removed_orb_keeps_a_snapshot_of_its_values():
+    store = OrbStore()
+    orbs = new_orbs(3, random.Random(2))
+    store.extend(orbs)
+    store.update(0.1)
+    x = orbs[0].x
+
+    store.remove(orbs[0])
+    orbs[0].x = -1.0  # Writes to a detached orb stay on the snapshot
+    store.update(0.1)
+
+    assert list(store) == orbs[1:]
+    assert orbs[0].x == -1.0 and orbs[0].lifetime == 15.0 - 0.1
+    assert orbs[1].x != x
@@ -0,0 +1,55 @@
+import pytest
+
+from config import Biome
+from replay import InputRecorder, ReplayPlayer, REPLAY_VERSION
+from simulation import HeadlessEngine
+
+# Fields that depend on how fast the machine ran, not on the simulation
+WALL_TIME_FIELDS = ('wall_seconds', 'ticks_per_second', 'speedup')
+
+def sim_results(engine, ticks):
+    results = engine.run(ticks)
+    for field in WALL_TIME_FIELDS:
+        del results[field]
+    return results
+
+def recorded_run(ticks=1200):
+    """Play a level by hand: buy from the shop every two seconds and reroll once"""
+    engine = HeadlessEngine(Biome.COLDSEEP, 1, seed=11)
+    recorder = InputRecorder(Biome.COLDSEEP, 1, 11)
+    engine.sim.recorder = recorder
+    while engine.tick < ticks:
+        if engine.tick % 120 == 0:
+            cell = (engine.tick // 120) % 4, (engine.tick // 120) % 5
+            for slot in range(len(engine.sim.shop.slots)):
+                if engine.sim.buy_tower(slot, *cell):
+                    break
+        if engine.tick == 600:
+            engine.sim.refresh_shop()
+        engine.step()
+    return engine, recorder
+
+def test_replay_reproduces_recorded_run(tmp_path):
+    engine, recorder = recorded_run()
+    assert recorder.commands  # The run must have issued something to replay
+    recorded = sim_results(engine, engine.tick)
+
+    path = tmp_path / 'run.json'
+    recorder.save(path)
+    player = ReplayPlayer.load(path)
+    replayed = sim_results(HeadlessEngine(player.biome, player.level, seed=player.seed, player=player), engine.tick)
+    assert replayed == recorded
+    assert player.finished()
+
+def test_failed_commands_are_not_recorded():
+    engine = HeadlessEngine(Biome.COLDSEEP, 1, seed=11)
+    engine.sim.recorder = InputRecorder(Biome.COLDSEEP, 1, 11)
+    assert not engine.sim.sell_tower(0, 0)
+    assert engine.sim.buy_tower(0, -1, 0) is None
+    assert engine.sim.recorder.commands == []
+
+def test_unknown_version_is_rejected():
+    data = InputRecorder(Biome.COLDSEEP, 1, 11).to_dict()
+    data['version'] = REPLAY_VERSION + 1
+    with pytest.raises(ValueError):
+        ReplayPlayer(data)
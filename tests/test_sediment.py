@@ -0,0 +1,58 @@
+import random
+
+import numpy as np
+import pygame
+import pytest
+
+from config import Biome
+from noise_field import pnoise3
+from sediment_generator import SedimentGenerator
+
+# Values from the noise C extension (noise.pnoise3) for inputs the vectorized version reproduces exactly
+@pytest.mark.parametrize('point, kwargs, expected', [
+    ((0.1, 0.2, 0.3), {}, 0.3846237063407898),
+    ((1.5, 2.25, -0.75), {}, -0.08395767211914062),
+    ((12.7, 3.3, 0.5), {'octaves': 4, 'persistence': 0.6}, -0.3074275553226471),
+    ((40.25, 7.5, 1.0), {'octaves': 3, 'base': 1}, 0.056640625),
+    ((0.33, 100.9, 5.5), {'octaves': 2, 'repeatx': 16, 'repeaty': 16, 'repeatz': 16}, -0.04648048058152199),
+])
+def test_pnoise3_matches_reference_values(point, kwargs, expected):
+    assert float(pnoise3(*point, **kwargs)) == expected
+
+def test_pnoise3_evaluates_grids_like_single_points():
+    xs, ys = np.meshgrid(np.linspace(0, 9, 7), np.linspace(0, 4, 5))
+    grid = pnoise3(xs, ys, 0.5, octaves=3)
+    assert grid.shape == xs.shape
+    assert all(grid[i, j] == pnoise3(xs[i, j], ys[i, j], 0.5, octaves=3)
+               for i in range(xs.shape[0]) for j in range(xs.shape[1]))
+
+def draw_forams_per_pixel(generator, surface):
+    """The original foram drawing, one rect per pattern pixel"""
+    biome_forams = {Biome.HYDROTHERMAL: ['BENTHIC'], Biome.COLDSEEP: ['BENTHIC', 'PLANKTIC'],
+                    Biome.BRINE_POOL: ['BENTHIC'], Biome.WHALEFALL: ['BENTHIC', 'GLOBIGERINA']}
+    types = {foram_type.name: foram_type for foram_type in generator.foram_patterns}
+    for _ in range(generator.rng.randint(20, 30)):
+        x = generator.rng.randint(0, generator.width - 16)
+        y = generator.rng.randint(0, generator.height - 16)
+        foram_type = types[generator.rng.choice(biome_forams[generator.biome])]
+        depth = y / generator.height
+        scale = 2 - depth
+        color = generator.get_foram_color(foram_type, depth)
+        for py, row in enumerate(generator.foram_patterns[foram_type]):
+            for px, pixel in enumerate(row):
+                pos_x, pos_y = int(x + px * scale), int(y + py * scale)
+                if pixel and 0 <= pos_x < generator.width and 0 <= pos_y < generator.height:
+                    pygame.draw.rect(surface, color, (pos_x, pos_y, max(1, int(scale)), max(1, int(scale))))
+
+@pytest.mark.parametrize('biome', [Biome.COLDSEEP, Biome.WHALEFALL])
+def test_add_foraminifera_matches_per_pixel_drawing(biome):
+    generator = SedimentGenerator(biome, 2, use_cache=False)
+    state = generator.rng.getstate()
+    expected = pygame.Surface((generator.width, generator.height), pygame.SRCALPHA)
+    draw_forams_per_pixel(generator, expected)
+
+    generator.rng.setstate(state)
+    surface = pygame.Surface((generator.width, generator.height), pygame.SRCALPHA)
+    generator.add_foraminifera(surface)
+    assert pygame.image.tobytes(surface, 'RGBA') == pygame.image.tobytes(expected, 'RGBA')
+    assert surface.get_bounding_rect().width > 0
@@ -0,0 +1,13 @@
+import math
+
+from config import Biome
+from simulation import HeadlessEngine, load_layout
+
+def test_resources_stay_finite_over_a_long_run():
+    # Neighbouring BlackSmokers boost each other's output through HydroPressure
+    engine = HeadlessEngine(Biome.HYDROTHERMAL, 1, load_layout('starter', Biome.HYDROTHERMAL), seed=3)
+    results = engine.run(6000)
+    for resource, amount in engine.sim.resources.items():
+        assert math.isfinite(amount), resource
+        assert amount < 1e6, resource
+    assert results['ticks'] == 6000
@@ -0,0 +1,48 @@
+import random
+
+from config import Biome, CELL_WIDTH
+from enemy import Enemy
+from simulation import HeadlessEngine
+from spatial_hash import SpatialHash
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+def brute_force_radius(points, x, y, radius):
+    return [p for p in points if (p.x - x) ** 2 + (p.y - y) ** 2 <= radius * radius]
+
+def test_query_radius_matches_brute_force_in_insert_order():
+    rng = random.Random(1)
+    points = [Point(rng.uniform(-200, 1200), rng.uniform(-200, 800)) for _ in range(300)]
+    grid = SpatialHash(64)
+    grid.rebuild(points)
+    for _ in range(50):
+        x, y, radius = rng.uniform(0, 1000), rng.uniform(0, 600), rng.uniform(0, 400)
+        assert grid.query_radius(x, y, radius) == brute_force_radius(points, x, y, radius)
+
+def test_nearest_prefers_closest_then_first_inserted():
+    a, b, c = Point(10, 0), Point(-10, 0), Point(5, 0)
+    grid = SpatialHash(8)
+    grid.rebuild([a, b, c])
+    assert grid.nearest(0, 0, 100) is c
+    assert grid.nearest(0, 0, 100, predicate=lambda p: p is not c) is a  # a and b tie; a went in first
+    assert grid.nearest(0, 0, 4) is None
+
+def test_enemy_grid_sees_spawned_moved_and_removed_enemies():
+    sim = HeadlessEngine(Biome.HYDROTHERMAL, 1, seed=2).sim
+    rng = random.Random(0)
+    first = Enemy(1, 'ScoutDrone', rng)
+    sim.enemies.append(first)
+    assert sim.enemy_grid.query_radius(first.x, first.y, 1) == [first]
+
+    spawned = Enemy(3, 'ScoutDrone', rng)  # As a divide or drone deploy would mid-tick
+    sim.enemies.append(spawned)
+    assert sim.enemy_grid.query_radius(spawned.x, spawned.y, 1) == [spawned]
+
+    first.x -= 3 * CELL_WIDTH  # Knocked back outside any update
+    assert sim.enemy_grid.query_radius(first.x, first.y, 1) == [first]
+
+    sim.enemies.remove(spawned)
+    assert sim.enemy_grid.query_radius(spawned.x, spawned.y, 1) == []
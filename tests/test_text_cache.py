@@ -0,0 +1,37 @@
+import pygame
+import pytest
+
+import text_cache
+from config import get_font
+from text_cache import render_text
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    text_cache._text_surfaces.clear()
+    yield
+    text_cache._text_surfaces.clear()
+
+def test_same_string_reuses_its_surface_and_matches_a_fresh_render():
+    font = get_font(20)
+    first = render_text(font, "Wave 3/10", (255, 255, 255))
+    assert render_text(font, "Wave 3/10", [255, 255, 255]) is first
+    fresh = font.render("Wave 3/10", True, (255, 255, 255))
+    assert pygame.image.tobytes(first, 'RGBA') == pygame.image.tobytes(fresh, 'RGBA')
+
+def test_colour_antialiasing_and_font_size_are_cached_separately():
+    small, large = get_font(16), get_font(24)
+    surfaces = {id(render_text(small, "Kelp: 10", (255, 255, 255))),
+                id(render_text(small, "Kelp: 10", (255, 0, 0))),
+                id(render_text(small, "Kelp: 10", (255, 255, 255), antialias=False)),
+                id(render_text(large, "Kelp: 10", (255, 255, 255)))}
+    assert len(surfaces) == 4
+
+def test_least_recently_used_string_is_evicted(monkeypatch):
+    monkeypatch.setattr(text_cache, 'MAX_TEXT_SURFACES', 2)
+    font = get_font(16)
+    kept = render_text(font, "a", (0, 0, 0))
+    render_text(font, "b", (0, 0, 0))
+    render_text(font, "a", (0, 0, 0))  # Now more recent than "b"
+    render_text(font, "c", (0, 0, 0))
+    assert [key[2] for key in text_cache._text_surfaces] == ["a", "c"]
+    assert render_text(font, "a", (0, 0, 0)) is kept
@@ -0,0 +1,52 @@
+from config import Biome, GRID_COLS, GRID_ROWS
+from simulation import HeadlessEngine
+
+def new_sim():
+    return HeadlessEngine(Biome.HYDROTHERMAL, 1, seed=1).sim
+
+def occupied_cells(sim):
+    return {(col, row) for row in range(GRID_ROWS) for col in range(GRID_COLS) if sim.tower_at(col, row)}
+
+def test_add_remove_and_move_keep_the_grid_in_step():
+    sim = new_sim()
+    shooter = sim.create_tower('RiftiaTubeWorm', 2, 3)
+    tank = sim.create_tower('SquatLobster', 4, 1)
+    sim.add_tower(shooter)
+    sim.add_tower(tank)
+    assert sim.tower_at(2, 3) is shooter and sim.tower_at(4, 1) is tank
+    assert not sim.is_valid_placement(2, 3)
+
+    sim.move_tower(shooter, 5, 0)
+    assert sim.tower_at(2, 3) is None and sim.tower_at(5, 0) is shooter
+    assert (shooter.x, shooter.y) == (5, 0)
+    assert sim.is_valid_placement(2, 3)
+
+    sim.remove_tower(tank)
+    assert sim.tower_at(4, 1) is None
+    assert occupied_cells(sim) == {(5, 0)}
+    assert occupied_cells(sim) == {(t.x, t.y) for t in sim.towers}
+
+def test_out_of_bounds_cells_are_never_free_or_occupied():
+    sim = new_sim()
+    assert sim.tower_at(-1, 0) is None and sim.tower_at(GRID_COLS, 0) is None
+    assert not sim.is_valid_placement(-1, 0)
+    assert not sim.is_valid_placement(0, GRID_ROWS)
+
+def test_layout_version_changes_on_every_layout_edit():
+    sim = new_sim()
+    versions = [sim.layout_version]
+    tower = sim.create_tower('SquatLobster', 1, 1)
+    sim.add_tower(tower)
+    versions.append(sim.layout_version)
+    sim.move_tower(tower, 1, 2)
+    versions.append(sim.layout_version)
+    sim.remove_tower(tower)
+    versions.append(sim.layout_version)
+    assert len(set(versions)) == 4
+
+def test_sell_frees_the_cell():
+    sim = new_sim()
+    sim.add_tower(sim.create_tower('SquatLobster', 3, 3))
+    assert sim.sell_tower(3, 3)
+    assert sim.tower_at(3, 3) is None and not sim.towers
+    assert not sim.sell_tower(3, 3)
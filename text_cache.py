@@ -0,0 +1,19 @@
+from collections import OrderedDict
+
+# Rendered strings kept across frames; HUD text repeats far more often than it changes
+MAX_TEXT_SURFACES = 512
+
+_text_surfaces = OrderedDict()  # (font, size, text, color, antialias) -> Surface, least recently used first
+
+def render_text(font, text, color, antialias=True):
+    """font.render(text, antialias, color), reusing the surface while the same string is drawn"""
+    key = (font, font.get_height(), text, tuple(color), antialias)
+    surface = _text_surfaces.get(key)
+    if surface is None:
+        surface = font.render(text, antialias, color)
+        _text_surfaces[key] = surface
+        if len(_text_surfaces) > MAX_TEXT_SURFACES:
+            _text_surfaces.popitem(last=False)
+    else:
+        _text_surfaces.move_to_end(key)
+    return surface
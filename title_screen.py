@@ -1,6 +1,7 @@
 import pygame
 from config import *
 from ui import Button
+from text_cache import render_text
 import random
 import os
 
@@ -61,6 +62,15 @@ class TitleScreen:
                 'dy': random.uniform(-10, 10),
                 'alpha': random.randint(50, 150)
             })
+
+        # Static parts of the backdrop, rendered once
+        self.background = self.render_gradient_background()
+        self.shape_sprites = {shape['size']: self.render_blurred_shape(shape['size']) for shape in self.shapes}
+        # The frosted overlay is pixelated anyway, so it is drawn at its low resolution and scaled up
+        self.frosted_scale = 10
+        self.frosted_small = pygame.Surface((WINDOW_WIDTH // self.frosted_scale, WINDOW_HEIGHT // self.frosted_scale),
+                                            pygame.SRCALPHA)
+        self.frosted_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
         
     def update(self, dt):
         # Update moving dark blurred shapes
@@ -106,8 +116,9 @@ class TitleScreen:
                 return 'quit'
         return None
 
-    def draw_gradient_background(self, surface):
+    def render_gradient_background(self):
         # Create a deep, dark gradient for the background
+        background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
         top_color = (10, 10, 30)
         bottom_color = (0, 0, 0)
         for y in range(WINDOW_HEIGHT):
@@ -115,37 +126,46 @@ class TitleScreen:
             r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
             g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
             b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-            pygame.draw.line(surface, (r, g, b), (0, y), (WINDOW_WIDTH, y))
-        
-    def draw_blurred_shape(self, surface, shape):
-        # Simulate a blurred shape by drawing multiple semi-transparent circles
+            pygame.draw.line(background, (r, g, b), (0, y), (WINDOW_WIDTH, y))
+        return background
+
+    def draw_gradient_background(self, surface):
+        surface.blit(self.background, (0, 0))
+
+    def render_blurred_shape(self, size):
+        # Simulate a blurred shape by stacking semi-transparent circles into one sprite
+        sprite = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
         base_color = (0, 0, 0)
         layers = 5
         for i in range(layers, 0, -1):
-            layer_surface = pygame.Surface((shape['size']*2, shape['size']*2), pygame.SRCALPHA)
+            layer_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
             alpha = int(30 * i)
             color = (base_color[0], base_color[1], base_color[2], alpha)
-            radius = int(shape['size'] * (i / layers))
-            pygame.draw.circle(layer_surface, color, (shape['size'], shape['size']), radius)
-            pos = (int(shape['x'] - shape['size']), int(shape['y'] - shape['size']))
-            surface.blit(layer_surface, pos)
+            radius = int(size * (i / layers))
+            pygame.draw.circle(layer_surface, color, (size, size), radius)
+            sprite.blit(layer_surface, (0, 0))
+        return sprite
+        
+    def draw_blurred_shape(self, surface, shape):
+        pos = (int(shape['x'] - shape['size']), int(shape['y'] - shape['size']))
+        surface.blit(self.shape_sprites[shape['size']], pos)
     
     def draw_frosted_effect(self, surface):
         try:
-            # Create an overlay covering the entire screen with a dark base
-            frosted_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            frosted_surface.fill((20, 20, 20, 180))  # Dark rectangle with transparency
+            # Cover the low-resolution overlay with a dark base
+            scale_factor = self.frosted_scale
+            self.frosted_small.fill((20, 20, 20, 180))  # Dark rectangle with transparency
             
-            # Draw moving circles on the frosted surface
+            # Draw moving circles straight at the pixelated resolution
             for circle in self.frosted_circles:
                 circle_color = (30, 30, 30, circle['alpha'])
-                pygame.draw.circle(frosted_surface, circle_color, (int(circle['x']), int(circle['y'])), circle['radius'])
+                pygame.draw.circle(self.frosted_small, circle_color,
+                                   (int(circle['x']) // scale_factor, int(circle['y']) // scale_factor),
+                                   max(1, circle['radius'] // scale_factor))
             
-            # Apply pixelation (dithering) effect: scale down then up
-            scale_factor = 10
-            small = pygame.transform.scale(frosted_surface, (WINDOW_WIDTH // scale_factor, WINDOW_HEIGHT // scale_factor))
-            pixelated = pygame.transform.scale(small, (WINDOW_WIDTH, WINDOW_HEIGHT))
-            surface.blit(pixelated, (0, 0))
+            # Scale up into the persistent full-size overlay for the pixelated look
+            pygame.transform.scale(self.frosted_small, (WINDOW_WIDTH, WINDOW_HEIGHT), self.frosted_surface)
+            surface.blit(self.frosted_surface, (0, 0))
         except Exception as e:
             print(f"Error in drawing frosted effect: {e}")
             # Fallback to a simple dark overlay
@@ -165,13 +185,13 @@ class TitleScreen:
             self.draw_frosted_effect(surface)
             
             title_text = "Deep Sea TD"
-            title_surface = self.font_large.render(title_text, True, COLOR_TEXT)
+            title_surface = render_text(self.font_large, title_text, COLOR_TEXT)
             title_rect = title_surface.get_rect(center=(WINDOW_WIDTH // 2, 150))
             surface.blit(title_surface, title_rect)
             
             # Draw subtitle
             subtitle_text = "v.0.0.01A (Anton Only Alpha)"
-            subtitle_surface = self.font_medium.render(subtitle_text, True, COLOR_TEXT)
+            subtitle_surface = render_text(self.font_medium, subtitle_text, COLOR_TEXT)
             subtitle_rect = subtitle_surface.get_rect(center=(WINDOW_WIDTH // 2, 200))
             surface.blit(subtitle_surface, subtitle_rect)
             
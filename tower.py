@@ -1,8 +1,10 @@
 import pygame
 import random
 import os
+import numpy as np
 from config import *
 from ui import HealthBar, StarDisplay
+from dirty_rects import union_rects
 from resource_orb import ResourceOrb
 from base_types import BaseTower
 from powers import *
@@ -49,6 +51,14 @@ class Tower(BaseTower):
         self.stun_timer = 0
         self.gameplay_manager = gameplay_manager
         
+        # Game random streams; rules use rng, visuals use cosmetic_rng
+        if gameplay_manager is not None:
+            self.rng = gameplay_manager.rng.sim
+            self.cosmetic_rng = gameplay_manager.rng.cosmetic
+        else:
+            self.rng = random
+            self.cosmetic_rng = random
+        
         # Get tower specs from definitions
         if tower_type in TOWER_COLORS:
             self.name = tower_type
@@ -175,29 +185,31 @@ class Tower(BaseTower):
         return False
         
     def draw(self, surface):
+        """Draw the tower, returning the area everything it drew covers"""
         # Draw tower base
         tower_x = self.x * CELL_WIDTH + SIDEBAR_WIDTH
         tower_y = self.y * CELL_HEIGHT
         
         if self.name in TOWER_IMAGES:
-            surface.blit(TOWER_IMAGES[self.name], (tower_x, tower_y))
+            drawn = surface.blit(TOWER_IMAGES[self.name], (tower_x, tower_y))
         else:
-            pygame.draw.rect(surface, self.color,
-                           (tower_x, tower_y, CELL_WIDTH, CELL_HEIGHT))
+            drawn = pygame.draw.rect(surface, self.color,
+                                   (tower_x, tower_y, CELL_WIDTH, CELL_HEIGHT))
         
         # Draw health bar if tower has taken damage
         if self.health < self.max_health:
-            HealthBar.draw(surface,
-                          tower_x,
-                          tower_y - 8,
-                          CELL_WIDTH - 10,
-                          self.health,
-                          self.max_health)
+            drawn = union_rects(drawn, HealthBar.draw(surface,
+                                                      tower_x,
+                                                      tower_y - 8,
+                                                      CELL_WIDTH - 10,
+                                                      self.health,
+                                                      self.max_health))
         
         # Draw power effects and energy bar if tower has a power
         if self.power:
-            self.power.draw(surface)
-            self.power.draw_energy_bar(surface, tower_x, tower_y)
+            drawn = union_rects(drawn, self.power.draw(surface),
+                                self.power.draw_energy_bar(surface, tower_x, tower_y))
+        return drawn
 
     def take_damage(self, amount, attacker=None):
         """Take damage from enemies"""
@@ -256,9 +268,9 @@ class ResourceTower(Tower):
         }
         
         # Resource spawn timing and position variation
-        self.spawn_timer = random.random() * 2.0  # Randomize initial timing
+        self.spawn_timer = self.rng.random() * 2.0  # Randomize initial timing
         self.spawn_interval = 2.0  # Base interval, modified by stars
-        self.spawn_offset_x = random.randint(-15, 15)  # Fixed offset per tower
+        self.spawn_offset_x = self.rng.randint(-15, 15)  # Fixed offset per tower
         self.manual_collect_bonus = 1.5  # Bonus for manual collection
         
         # Calculate base resource amount with star rating
@@ -302,21 +314,22 @@ class ResourceTower(Tower):
             tower_center_y = self.y * CELL_HEIGHT + CELL_HEIGHT/2
             
             # Add fixed offset plus small random variation
-            spawn_x = tower_center_x + self.spawn_offset_x + random.randint(-5, 5)
+            spawn_x = tower_center_x + self.spawn_offset_x + self.rng.randint(-5, 5)
             spawn_y = tower_center_y - CELL_HEIGHT/4
             
             if self.primary_resource == 'all':
                 # Spawn all resource types with slight position variation
                 for resource, amount in self.resource_amounts.items():
                     if amount > 0:
-                        resource_x = spawn_x + random.randint(-10, 10)
-                        resource_y = spawn_y + random.randint(-5, 5)
+                        resource_x = spawn_x + self.rng.randint(-10, 10)
+                        resource_y = spawn_y + self.rng.randint(-5, 5)
                         
                         # Create orb with visual enhancements
                         orb = ResourceOrb(
                             resource_x, resource_y,
                             resource, amount,
-                            manual_bonus=self.manual_collect_bonus
+                            manual_bonus=self.manual_collect_bonus,
+                            rng=self.rng
                         )
                         spawned_orbs.append(orb)
             else:
@@ -326,7 +339,8 @@ class ResourceTower(Tower):
                     orb = ResourceOrb(
                         spawn_x, spawn_y,
                         self.primary_resource, amount,
-                        manual_bonus=self.manual_collect_bonus
+                        manual_bonus=self.manual_collect_bonus,
+                        rng=self.rng
                     )
                     spawned_orbs.append(orb)
         
@@ -334,7 +348,7 @@ class ResourceTower(Tower):
 
     def draw(self, surface):
         """Draw the resource tower with enhanced visuals"""
-        super().draw(surface)
+        drawn = super().draw(surface)
         
         # Draw resource type indicator
         x = self.x * CELL_WIDTH + SIDEBAR_WIDTH + 5
@@ -342,10 +356,9 @@ class ResourceTower(Tower):
         
         # Draw tower image or color block
         if self.name in TOWER_IMAGES:
-            surface.blit(TOWER_IMAGES[self.name], (x, y))
-        else:
-            pygame.draw.rect(surface, self.color, 
-                           (x, y, CELL_WIDTH - 10, CELL_HEIGHT - 10))
+            return union_rects(drawn, surface.blit(TOWER_IMAGES[self.name], (x, y)))
+        return union_rects(drawn, pygame.draw.rect(surface, self.color,
+                                                   (x, y, CELL_WIDTH - 10, CELL_HEIGHT - 10)))
         
         # Draw resource generation indicator
         if self.spawn_timer >= self.spawn_interval * 0.8:
@@ -396,7 +409,7 @@ class ProjectileTower(Tower):
         # Check if we can fire
         if self.attack_timer >= self.cooldown:
             # Find target enemy
-            target = self._find_target(game_state.enemies)
+            target = self._find_target(game_state.enemy_grid)
             if target:
                 self.attack_timer = 0
                 return {
@@ -409,26 +422,14 @@ class ProjectileTower(Tower):
                 }
         return None
     
-    def _find_target(self, enemies):
+    def _find_target(self, enemy_grid):
         """Find nearest enemy in range to target"""
         center_x = self.x * CELL_WIDTH + SIDEBAR_WIDTH + CELL_WIDTH/2
         center_y = self.y * CELL_HEIGHT + CELL_HEIGHT/2
         
-        nearest_enemy = None
-        nearest_dist = float('inf')
-        
-        for enemy in enemies:
-            dx = enemy.x - center_x
-            dy = enemy.y - center_y
-            dist = (dx**2 + dy**2) ** 0.5
-            
-            # Only consider enemies in range and to the right of the tower
-            if dist <= self.target_range and dx > 0:
-                if dist < nearest_dist:
-                    nearest_dist = dist
-                    nearest_enemy = enemy
-                    
-        return nearest_enemy
+        # Only consider enemies in range and to the right of the tower
+        return enemy_grid.nearest(center_x, center_y, self.target_range,
+                                  lambda enemy: enemy.x > center_x)
 
 class TankTower(Tower):
     def __init__(self, x, y, tower_type, gameplay_manager, biome):
@@ -486,60 +487,88 @@ class EffectTower(Tower):
         self.affected_enemies = set()
         self.damage_timer = 0
         self.damage_interval = 0.1  # Apply damage every 0.1 seconds for smoother application
+        self.damage_ready = False  # Set when the timer elapses, cleared by apply_effect_fields
         
     def update(self, dt, game_state):
-        """Apply damage to enemies within effect radius"""
+        """Charge the damage timer; apply_effect_fields deals the damage for every ready tower at once
+        and reports the enemies hit, since they are not known until then"""
         super().update(dt, game_state)  # Call parent update to store game_state
         
         if not self.stunned:  # Only apply effects if not stunned
             self.damage_timer += dt
             
             if self.damage_timer >= self.damage_interval:
-                center_x = self.x * CELL_WIDTH + SIDEBAR_WIDTH + CELL_WIDTH/2
-                center_y = self.y * CELL_HEIGHT + CELL_HEIGHT/2
-                radius_px = self.effect_radius * CELL_WIDTH
-                
-                # Clear old affected enemies set
-                self.affected_enemies.clear()
-                
-                # Check which enemies are in range and apply damage
-                for enemy in game_state.enemies:
-                    dx = enemy.x - center_x
-                    dy = enemy.y - center_y
-                    dist = (dx**2 + dy**2) ** 0.5
-                    
-                    if dist <= radius_px:
-                        # Calculate damage with distance falloff
-                        falloff = 1.0 - (dist / radius_px)
-                        # Calculate damage for this interval
-                        interval_damage = self.effect_damage * falloff * self.damage_timer
-                        
-                        # Apply damage and notify power
-                        enemy.take_damage(interval_damage)
-                        if self.power and hasattr(self.power, 'on_damage_dealt'):
-                            self.power.on_damage_dealt(enemy, interval_damage)
-                        self.affected_enemies.add(enemy)
-                
-                # Reset damage timer
-                self.damage_timer = 0
-                
-                # Update power and check if it wants to apply additional effects
-                if self.power:
-                    power_ready = self.power.update(dt, game_state)
-                    if power_ready:
-                        self.power.activate()
-            
-            return list(self.affected_enemies)
-        return []
+                self.damage_ready = True
+        
+    def finish_damage_tick(self, dt, game_state, affected_enemies):
+        """Reset the damage timer once apply_effect_fields has dealt this interval's damage"""
+        self.affected_enemies = set(affected_enemies)
+        self.damage_timer = 0
+        self.damage_ready = False
+        
+        # Update power and check if it wants to apply additional effects
+        if self.power:
+            power_ready = self.power.update(dt, game_state)
+            if power_ready:
+                self.power.activate()
         
     def draw(self, surface):
         """Draw the tower"""
         # Draw base tower
-        super().draw(surface)
+        return super().draw(surface)
         
         # Let the power handle drawing the effect area
         # The effect area is now handled by TowerPower.draw_area_effect()
 
+def apply_effect_fields(dt, towers, game_state):
+    """Deal area damage for every effect tower whose timer has elapsed.
+    
+    Distances and linear falloff for every tower x enemy pair come from one NumPy
+    pass; the hits are then dealt tower by tower in tower order, one take_damage
+    per tower and enemy, so armour and shields see each field's hit on its own.
+    Each tower's power receives the enemies it reached and their damage in bulk.
+    Returns {tower: enemies hit this tick} for the towers that fired.
+    """
+    ready = [tower for tower in towers if isinstance(tower, EffectTower) and tower.damage_ready]
+    if not ready:
+        return {}
+    
+    enemies = game_state.enemies
+    victims = list(enemies)
+    if not victims:
+        for tower in ready:
+            tower.finish_damage_tick(dt, game_state, [])
+        return {tower: [] for tower in ready}
+    
+    # Tower centres, radii and damage for this interval, one row per tower
+    center_x = np.array([t.x * CELL_WIDTH + SIDEBAR_WIDTH + CELL_WIDTH/2 for t in ready])
+    center_y = np.array([t.y * CELL_HEIGHT + CELL_HEIGHT/2 for t in ready])
+    radius_px = np.array([t.effect_radius * CELL_WIDTH for t in ready])
+    interval_damage = np.array([t.effect_damage * t.damage_timer for t in ready])
+    
+    # Enemy positions, one column per enemy
+    slots = enemies.slots()
+    enemy_x = enemies.arrays['x'][slots]
+    enemy_y = enemies.arrays['y'][slots]
+    
+    dist = np.hypot(enemy_x[None, :] - center_x[:, None], enemy_y[None, :] - center_y[:, None])
+    in_range = dist <= radius_px[:, None]
+    falloff = 1.0 - dist / radius_px[:, None]
+    damage = np.where(in_range, interval_damage[:, None] * falloff, 0.0)
+    
+    affected_by_tower = {}
+    for i, tower in enumerate(ready):
+        columns = np.flatnonzero(in_range[i])
+        affected = [victims[j] for j in columns]
+        hits = damage[i, columns]
+        for enemy, amount in zip(affected, hits.tolist()):
+            enemy.take_damage(amount)
+        if tower.power and affected:
+            tower.power.on_damage_dealt_bulk(affected, hits)
+        tower.finish_damage_tick(dt, game_state, affected)
+        affected_by_tower[tower] = affected
+    return affected_by_tower
+
 class Projectile:
     def __init__(self, x, y, damage, color, target=None):
         self.x = x
@@ -586,11 +615,12 @@ class Projectile:
         return False
     
     def draw(self, surface):
-        """Draw projectile"""
+        """Draw projectile, returning the area it covers"""
         if self.active:
-            pygame.draw.rect(surface, self.color, 
-                          (self.x - self.width/2, self.y - self.height/2, 
-                           self.width, self.height))
+            return pygame.draw.rect(surface, self.color, 
+                                  (self.x - self.width/2, self.y - self.height/2, 
+                                   self.width, self.height))
+        return None
 
 class EffectProjectile:
     """Invisible projectile for handling area effect damage"""
@@ -603,7 +633,7 @@ class EffectProjectile:
         self.active = True
         self.lifetime = 0.1  # Short lifetime for quick damage application
         
-    def update(self, dt, enemies):
+    def update(self, dt, enemy_grid):
         """Apply damage to enemies in range"""
         self.lifetime -= dt
         if self.lifetime <= 0:
@@ -611,20 +641,19 @@ class EffectProjectile:
             return False
             
         # Find all enemies in range and apply damage
-        for enemy in enemies:
+        for enemy in enemy_grid.query_radius(self.x, self.y, self.effect_radius):
             dx = enemy.x - self.x
             dy = enemy.y - self.y
             dist = (dx**2 + dy**2) ** 0.5
             
-            if dist <= self.effect_radius:
-                # Calculate damage falloff
-                falloff = 1.0 - (dist / self.effect_radius)
-                actual_damage = self.damage * falloff * dt
-                
-                # Apply damage and notify power
-                enemy.take_damage(actual_damage)
-                if self.tower.power and hasattr(self.tower.power, 'on_damage_dealt'):
-                    self.tower.power.on_damage_dealt(enemy, actual_damage)
+            # Calculate damage falloff
+            falloff = 1.0 - (dist / self.effect_radius)
+            actual_damage = self.damage * falloff * dt
+            
+            # Apply damage and notify power
+            enemy.take_damage(actual_damage)
+            if self.tower.power and hasattr(self.tower.power, 'on_damage_dealt'):
+                self.tower.power.on_damage_dealt(enemy, actual_damage)
                     
         return True
 
@@ -1,5 +1,7 @@
+from collections import OrderedDict
 import pygame
 from config import *
+from text_cache import render_text
 
 class Button:
     def __init__(self, rect, text, font_size=FONT_SIZE_MEDIUM, color=COLOR_BUTTON, hover_color=COLOR_BUTTON_HOVER):
@@ -15,7 +17,7 @@ class Button:
         color = self.hover_color if self.hover else self.color
         pygame.draw.rect(surface, color, self.rect, border_radius=self.border_radius)
         pygame.draw.rect(surface, (255, 255, 255), self.rect, width=2, border_radius=self.border_radius)
-        text_surface = self.font.render(self.text, True, COLOR_TEXT)
+        text_surface = render_text(self.font, self.text, COLOR_TEXT)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
         
@@ -31,11 +33,16 @@ class Tooltip:
     """
     A class for displaying hoverable tooltips in the game.
     Tooltips can display information about towers, resources, or any other game element.
+    Each distinct content is rendered once and shared by every tooltip showing it.
     """
+    MAX_CACHED = 64  # Rendered tooltips kept, least recently used dropped first
+    _surfaces = OrderedDict()  # (content, style) -> Surface
+
     def __init__(self):
         self.font = get_font(FONT_SIZE_SMALL)
         self.visible = False
-        self.content = []
+        self.content = ()
+        self.surface = None
         self.rect = pygame.Rect(0, 0, 0, 0)
         self.background_color = (40, 40, 50, 230)  # Dark blue with alpha
         self.text_color = COLOR_TEXT
@@ -48,23 +55,43 @@ class Tooltip:
         Set the tooltip content.
         Content can be a single string or a list of strings for multiple lines.
         """
-        if isinstance(content, str):
-            self.content = [content]
+        content = (content,) if isinstance(content, str) else tuple(content)
+        if content == self.content and self.surface is not None:
+            return  # Hovering the same thing redraws nothing
+        self.content = content
+
+        key = (content, self.font, self.text_color, self.background_color,
+               self.padding, self.max_width, self.line_height)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self.render(content)
+            self._surfaces[key] = surface
+            if len(self._surfaces) > self.MAX_CACHED:
+                self._surfaces.popitem(last=False)
         else:
-            self.content = content
-        
-        # Calculate tooltip size based on content
-        width = 0
-        for line in self.content:
-            text_surface = self.font.render(line, True, self.text_color)
-            width = max(width, text_surface.get_width())
+            self._surfaces.move_to_end(key)
+        self.surface = surface
+
+        self.rect.width = surface.get_width()
+        self.rect.height = surface.get_height()
+
+    def render(self, content):
+        """Background and text for content, sized to the widest line"""
+        lines = [render_text(self.font, line, self.text_color) for line in content]
         
         # Cap width and calculate height
+        width = max((line.get_width() for line in lines), default=0)
         width = min(width, self.max_width) + self.padding * 2
-        height = len(self.content) * self.line_height + self.padding * 2
-        
-        self.rect.width = width
-        self.rect.height = height
+        height = len(lines) * self.line_height + self.padding * 2
+
+        # Create a transparent surface for the background
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill(self.background_color)
+
+        # Draw each line of text
+        for i, line in enumerate(lines):
+            surface.blit(line, (self.padding, self.padding + i * self.line_height))
+        return surface
         
     def show(self, x, y):
         """Show the tooltip at the specified position"""
@@ -82,18 +109,11 @@ class Tooltip:
         """Draw the tooltip if visible"""
         if not self.visible or not self.content:
             return
-            
-        # Create a transparent surface for the background
-        tooltip_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        tooltip_surface.fill(self.background_color)
-        
-        # Draw each line of text
-        for i, line in enumerate(self.content):
-            text_surface = self.font.render(line, True, self.text_color)
-            tooltip_surface.blit(text_surface, (self.padding, self.padding + i * self.line_height))
-        
-        # Draw the tooltip surface on the main surface
-        surface.blit(tooltip_surface, (self.rect.x, self.rect.y))
+        surface.blit(self.surface, (self.rect.x, self.rect.y))
+
+    def draw_health_bar(self, surface, x, y, width, current_health, max_health):
+        """Draw a health bar using the shared HealthBar component"""
+        HealthBar.draw(surface, x, y, width, current_health, max_health)
 
 class ResourceDisplay:
     def __init__(self, x, y, font_size=FONT_SIZE_SMALL):
@@ -106,7 +126,7 @@ class ResourceDisplay:
         y_offset = self.y
         for resource, amount in resources.items():
             text = f"{resource}: {amount}"
-            resource_text = self.font.render(text, True, RESOURCE_COLORS.get(resource, COLOR_TEXT))
+            resource_text = render_text(self.font, text, RESOURCE_COLORS.get(resource, COLOR_TEXT))
             surface.blit(resource_text, (self.x, y_offset))
             y_offset += self.spacing
 
@@ -117,7 +137,7 @@ class WaveInfoDisplay:
         self.font = get_font(font_size)
         
     def draw(self, surface, wave_status):
-        wave_info = self.font.render(wave_status, True, COLOR_TEXT)
+        wave_info = render_text(self.font, wave_status, COLOR_TEXT)
         surface.blit(wave_info, (self.x, self.y))
 
 class PauseOverlay:
@@ -129,7 +149,7 @@ class PauseOverlay:
         pause_overlay.fill((0, 0, 0, 128))
         surface.blit(pause_overlay, (0, 0))
         
-        pause_title = self.font.render("PAUSED", True, COLOR_TEXT)
+        pause_title = render_text(self.font, "PAUSED", COLOR_TEXT)
         pause_title_rect = pause_title.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
         surface.blit(pause_title, pause_title_rect)
 
@@ -156,7 +176,7 @@ class PauseScreen:
         surface.blit(pause_overlay, (0, 0))
         
         # Draw pause title
-        pause_title = self.font.render("PAUSED", True, COLOR_TEXT)
+        pause_title = render_text(self.font, "PAUSED", COLOR_TEXT)
         pause_title_rect = pause_title.get_rect(center=(WINDOW_WIDTH // 2, 100))
         surface.blit(pause_title, pause_title_rect)
         
@@ -221,9 +241,11 @@ class HealthBar:
             health_width = width * health_pct
             
             # Background of health bar
-            pygame.draw.rect(surface, (80, 0, 0),
-                           (x, y, width, 5))
+            drawn = pygame.draw.rect(surface, (80, 0, 0),
+                                   (x, y, width, 5))
                            
             # Filled portion of health bar
             pygame.draw.rect(surface, (0, 200, 0),
-                           (x, y, health_width, 5))
\ No newline at end of file
+                           (x, y, health_width, 5))
+            return drawn
+        return None
\ No newline at end of file
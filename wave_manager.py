@@ -24,8 +24,9 @@ class WaveDefinition:
         return self
 
 class WaveManager:
-    def __init__(self, level_number):
+    def __init__(self, level_number, rng=None):
         self.level_number = level_number
+        self.rng = rng if rng is not None else random  # Simulation stream for spawn lanes
         self.current_wave = 0
         self.wave_timer = 0
         self.build_phase = True
@@ -185,8 +186,8 @@ class WaveManager:
                 group['timer'] -= dt
                 if group['timer'] <= 0:
                     # Spawn enemy with random vertical position
-                    y = random.randint(0, GRID_ROWS - 1)
-                    enemies.append(Enemy(y, group['enemy_type']))
+                    y = self.rng.randint(0, GRID_ROWS - 1)
+                    enemies.append(Enemy(y, group['enemy_type'], self.rng))
                     group['spawned'] += 1
                     group['timer'] = group['delay']
                     spawned_enemy = True